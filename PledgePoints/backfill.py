@@ -0,0 +1,244 @@
+"""
+Resumable history backfill jobs for the pledge points system.
+
+A backfill streams a fixed window of channel history into the database using
+the ingest pipeline, checkpointing the last committed message after every
+page. Jobs can report progress while they run, can be cancelled, and are
+resumed from their checkpoint when the bot restarts.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import discord
+import pytz
+
+from PledgePoints.constants import (
+    BACKFILL_PROGRESS_INTERVAL_SECONDS,
+    BACKFILL_SLICES,
+    HISTORY_PAGE_SIZE,
+)
+from PledgePoints.db_writer import get_db_writer
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.messages import ingest_channel_history
+from PledgePoints.models import BackfillJob, IngestStats
+from PledgePoints.sqlutils import DatabaseManager
+
+ProgressCallback = Callable[[BackfillJob], Awaitable[None]]
+
+
+class BackfillManager:
+    """
+    Starts, tracks, cancels and resumes backfill jobs.
+
+    Job state lives in the database so it survives restarts; this class only
+    keeps the asyncio tasks for jobs running in the current process.
+
+    Attributes:
+        bot (discord.Client): Bot used to read channel history
+        db_manager (DatabaseManager): Database the jobs write to
+        page_size (int): Messages committed (and checkpointed) per page
+        slices (int): Time slices each job's window is fetched in concurrently
+        progress_interval (float): Minimum seconds between progress reports
+        message_cache (Optional[MessageContentCache]): Cache fetched messages
+            are recorded in
+    """
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        db_manager: DatabaseManager,
+        page_size: int = HISTORY_PAGE_SIZE,
+        slices: int = BACKFILL_SLICES,
+        progress_interval: float = BACKFILL_PROGRESS_INTERVAL_SECONDS,
+        message_cache: Optional[MessageContentCache] = None,
+    ):
+        """
+        Initialize the backfill manager.
+
+        Args:
+            bot: Bot used to read channel history
+            db_manager: Database the jobs write to
+            page_size: Messages committed (and checkpointed) per page
+            slices: Time slices each job's window is fetched in concurrently
+            progress_interval: Minimum seconds between progress reports
+            message_cache: Cache fetched messages are recorded in
+        """
+        self.bot = bot
+        self.db_manager = db_manager
+        self.page_size = page_size
+        self.slices = slices
+        self.progress_interval = progress_interval
+        self.message_cache = message_cache
+        self._tasks: Dict[int, asyncio.Task] = {}
+        # Jobs cancelled through cancel(), as opposed to by shutdown
+        self._cancel_requested: Set[int] = set()
+
+    def start(
+        self,
+        channel_id: int,
+        days_ago: int,
+        requested_by: Optional[str] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Tuple[BackfillJob, asyncio.Task]:
+        """
+        Create and start a backfill of the last `days_ago` days of a channel.
+
+        The window end is fixed to the current time so that a resumed job
+        covers exactly the same messages as the original run.
+
+        Args:
+            channel_id: Discord channel to backfill
+            days_ago: Number of days of history to ingest
+            requested_by: Name of the person starting the job
+            on_progress: Optional coroutine called periodically with the job
+
+        Returns:
+            Tuple of (job, task); awaiting the task returns the finished job
+        """
+        window_end = datetime.now(pytz.UTC)
+        window_start = window_end - timedelta(days=days_ago)
+        job = self.db_manager.create_backfill_job(
+            channel_id, window_start, window_end, requested_by
+        )
+        return job, self._spawn(job, on_progress)
+
+    def resume(
+        self, job: BackfillJob, on_progress: Optional[ProgressCallback] = None
+    ) -> asyncio.Task:
+        """
+        Resume a job from its last checkpoint.
+
+        Args:
+            job: Job to resume
+            on_progress: Optional coroutine called periodically with the job
+
+        Returns:
+            asyncio.Task: Task that returns the finished job
+        """
+        if job.status != "running":
+            self.db_manager.set_backfill_status(job.job_id, "running")
+            job.status = "running"
+            job.error = None
+        return self._spawn(job, on_progress)
+
+    def resume_incomplete(self) -> List[BackfillJob]:
+        """
+        Resume every job left in the 'running' state by a previous process.
+
+        Returns:
+            List[BackfillJob]: The jobs that were resumed
+        """
+        jobs = [
+            job
+            for job in self.db_manager.get_backfill_jobs("running")
+            if job.job_id not in self._tasks
+        ]
+        for job in jobs:
+            self._spawn(job, None)
+        return jobs
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a job running in this process.
+
+        Pages committed before cancellation are kept. Only jobs cancelled here
+        are marked 'cancelled'; jobs interrupted by a shutdown stay 'running'
+        so they are resumed on the next start.
+
+        Args:
+            job_id: ID of the job to cancel
+
+        Returns:
+            bool: True if a running job was cancelled, False otherwise
+        """
+        task = self._tasks.get(job_id)
+        if task is None or task.done():
+            return False
+        self._cancel_requested.add(job_id)
+        task.cancel()
+        return True
+
+    def _spawn(
+        self, job: BackfillJob, on_progress: Optional[ProgressCallback]
+    ) -> asyncio.Task:
+        """Run a job in a new task and track it until it finishes."""
+        task = asyncio.create_task(self._run(job, on_progress))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        return task
+
+    async def _run(
+        self, job: BackfillJob, on_progress: Optional[ProgressCallback]
+    ) -> BackfillJob:
+        """
+        Ingest the job's window from its checkpoint, saving progress per page.
+
+        Args:
+            job: Job to run
+            on_progress: Optional coroutine called periodically with the job
+
+        Returns:
+            BackfillJob: The completed job
+        """
+        # Counters from earlier runs; the pipeline only counts this run
+        base = replace(job)
+        if job.last_message_id is not None:
+            after = discord.Object(id=job.last_message_id)
+        else:
+            after = job.window_start
+        last_report = time.monotonic()
+
+        async def on_page_committed(stats: IngestStats):
+            nonlocal last_report
+            job.fetched = base.fetched + stats.fetched
+            job.inserted = base.inserted + stats.inserted
+            job.duplicates = base.duplicates + stats.duplicates
+            job.invalid = base.invalid + stats.invalid
+            job.last_message_id = stats.last_message_id
+            await get_db_writer(self.db_manager).submit(
+                self.db_manager.save_backfill_checkpoint, job
+            )
+
+            if on_progress is not None:
+                now = time.monotonic()
+                if now - last_report >= self.progress_interval:
+                    last_report = now
+                    try:
+                        await on_progress(job)
+                    except Exception:
+                        # Progress reporting must never stop the backfill
+                        pass
+
+        try:
+            await ingest_channel_history(
+                self.bot,
+                job.channel_id,
+                after,
+                self.db_manager,
+                before=job.window_end,
+                page_size=self.page_size,
+                slices=self.slices,
+                on_page_committed=on_page_committed,
+                message_cache=self.message_cache,
+            )
+        except asyncio.CancelledError:
+            if job.job_id in self._cancel_requested:
+                self._cancel_requested.discard(job.job_id)
+                job.status = "cancelled"
+                self.db_manager.set_backfill_status(job.job_id, job.status)
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            self.db_manager.set_backfill_status(job.job_id, job.status, job.error)
+            raise
+
+        job.status = "completed"
+        self.db_manager.set_backfill_status(job.job_id, job.status)
+        return job
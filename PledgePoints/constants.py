@@ -37,6 +37,33 @@ PLEDGE_ALIASES: Dict[str, str] = {
     # Add more aliases as needed
 }
 
+# =============================================================================
+# AUTO-APPROVAL RULES
+# =============================================================================
+
+# Discord user IDs of brothers whose routine submissions may be approved
+# without review; display names are not used since anyone can change theirs
+TRUSTED_BROTHERS: List[int] = [
+    # Add user IDs as needed
+]
+
+# Rules checked in order when new points are ingested; the first rule whose
+# criteria all match decides. "approve" approves the entry and records the
+# rule as approved_by "auto:<name>"; "hold" leaves it pending for a person.
+# Criteria: max_abs_points, min_points, max_points, author_ids, pledges.
+# Entries matching no rule stay pending.
+AUTO_APPROVAL_RULES: List[Dict] = [
+    # Never auto-approve deductions larger than 10 points
+    {"name": "large-deduction", "action": "hold", "max_points": -11},
+    # Small awards and deductions from trusted brothers
+    {
+        "name": "trusted-small",
+        "action": "approve",
+        "max_abs_points": 5,
+        "author_ids": TRUSTED_BROTHERS,
+    },
+]
+
 # =============================================================================
 # DISCORD CONSTANTS
 # =============================================================================
@@ -52,6 +79,64 @@ DISCORD_MESSAGE_SAFE_LENGTH = 1900  # Safe chunking limit with buffer
 # Rate limiting for Discord API calls
 REACTION_RATE_LIMIT_SECONDS = 0.2  # Minimum time between reactions
 
+# Discord embed limits per message
+DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+DISCORD_EMBED_DESCRIPTION_MAX_LENGTH = 4096
+DISCORD_EMBEDS_MAX_TOTAL_LENGTH = 6000  # Combined text of all embeds
+
+# Deleted message audit log batching
+DELETION_LOG_FLUSH_SECONDS = 2.0  # How long deletions are buffered before sending
+DELETION_LOG_MAX_BACKLOG = 1000  # Oldest buffered deletions are dropped past this
+
+# Entries shown per page of the interactive pending points view
+PENDING_PAGE_SIZE = 10
+
+# =============================================================================
+# INGESTION CONSTANTS
+# =============================================================================
+
+# Number of messages per history page (Discord returns at most 100 per request)
+HISTORY_PAGE_SIZE = 100
+
+# Maximum number of pages buffered between ingest pipeline stages
+INGEST_QUEUE_SIZE = 4
+
+# Number of time slices a backfill window is split into and fetched concurrently
+BACKFILL_SLICES = 4
+
+# Maximum number of history page requests in flight across all slices
+HISTORY_FETCH_MAX_CONCURRENCY = 3
+
+# Number of exported messages inserted per transaction by the offline importer
+IMPORT_BATCH_SIZE = 5000
+
+# Number of rows read per fetchmany call when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Minimum time between progress updates for long-running backfills
+BACKFILL_PROGRESS_INTERVAL_SECONDS = 5.0
+
+# Longest wait between automatic syncs while backing off after failures
+SYNC_MAX_BACKOFF_SECONDS = 3600
+
+# How far back the first automatic sync reads when nothing has been ingested
+SYNC_INITIAL_LOOKBACK_DAYS = 7
+
+# Number of background jobs (long-running commands) run at the same time
+JOB_WORKER_COUNT = 2
+
+# Number of finished jobs kept for /jobs
+JOB_HISTORY_SIZE = 25
+
+# Longest a write waits for others to share its transaction, and the most
+# writes committed together
+DB_WRITE_MAX_DELAY_SECONDS = 0.01
+DB_WRITE_MAX_BATCH = 256
+
+# How long approval requests are remembered, so a retried interaction is
+# answered with its earlier result instead of being applied twice
+REVIEW_REQUEST_RETENTION_DAYS = 7
+
 # =============================================================================
 # VALIDATION CONSTANTS
 # =============================================================================
@@ -61,9 +146,22 @@ REACTION_RATE_LIMIT_SECONDS = 0.2  # Minimum time between reactions
 SQL_INT_MIN = -9223372036854775808
 SQL_INT_MAX = 9223372036854775807
 
-# Point entry validation regex
-# Matches format: +10, -5, +100, +1.25, -2.5, etc.
-POINT_REGEX_PATTERN = r"^([+-]\d+(?:\.\d+)?)"
+# Point message regex: points, optional "to", pledge name, comment in one pass
+# Point values match +10, -5, +100, +1.25, -2.5, etc.
+# Matches: "+10 Eli Great job", "-2.5 to Eli for being late", "+5Eli comment"
+# Compile with re.DOTALL so comments may span lines. The point value is
+# possessive so a failed match never retries with fewer digits.
+POINT_MESSAGE_PATTERN = r"([+-]\d++(?:\.\d+)?+)\s*((?i:to) \s*)?(\S[^ ]*) \s*(.*\S)\s*\Z"
+
+# Point message naming several pledges: "+5 Evan, Milo, Tony for cleanup"
+# Names are separated by commas (no space before a comma); compile with re.DOTALL
+POINT_MULTI_MESSAGE_PATTERN = (
+    r"([+-]\d++(?:\.\d+)?+)\s*((?i:to) \s*)?([^\s,]+(?:, *[^\s,]+)+) \s*(.*\S)\s*\Z"
+)
+
+# Shortest pledge name token that fuzzy matching is tried on; shorter tokens
+# are too close to too many names to correct safely
+FUZZY_MATCH_MIN_LENGTH = 4
 
 # =============================================================================
 # RANKING DISPLAY
@@ -0,0 +1,173 @@
+"""
+Write-coalescing queue in front of the database.
+
+Every DatabaseManager call opens its own connection and commits its own
+transaction, so a burst of submissions, reactions and approvals pays for one
+commit (and fsync) per call. The writer queues calls from the event loop and
+runs everything queued within a short tick as one transaction on a worker
+thread, each call in its own savepoint. Callers await their own result, and
+a failing call raises for its caller alone.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from PledgePoints.constants import DB_WRITE_MAX_BATCH, DB_WRITE_MAX_DELAY_SECONDS
+from PledgePoints.sqlutils import DatabaseManager
+
+T = TypeVar("T")
+
+# A queued call: function, arguments, keyword arguments and its result future
+_Write = Tuple[Callable[..., Any], tuple, Dict[str, Any], asyncio.Future]
+
+
+class DatabaseWriter:
+    """
+    Single writer task that commits queued database calls in batches.
+
+    The writer task is started on the first submission, since it needs a
+    running event loop.
+
+    Attributes:
+        db_manager (DatabaseManager): Database the calls write to
+        max_delay (float): Longest a call waits for others to join its batch
+        max_batch (int): Most calls committed in one transaction
+        batches (int): Number of transactions committed so far
+        writes (int): Number of calls run so far
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_delay: float = DB_WRITE_MAX_DELAY_SECONDS,
+        max_batch: int = DB_WRITE_MAX_BATCH,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            db_manager: Database the calls write to
+            max_delay: Longest a call waits for others to join its batch
+            max_batch: Most calls committed in one transaction
+        """
+        self.db_manager = db_manager
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.batches = 0
+        self.writes = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a database call as part of the next batch and wait for its result.
+
+        The call runs on the writer's thread with every other call queued in
+        the same tick, inside one transaction. It behaves as if it ran alone:
+        its changes are rolled back if it raises, and are committed together
+        with the batch otherwise. Cancelling the wait does not withdraw a
+        call that is already being written.
+
+        Args:
+            func: Function to call, e.g. a DatabaseManager method
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            The call's return value
+
+        Raises:
+            Exception: Whatever the call raised, or the error that stopped
+                the batch from committing
+        """
+        self._ensure_task()
+        future = self._loop.create_future()
+        self._queue.put_nowait((func, args, kwargs, future))
+        return await future
+
+    def _ensure_task(self) -> None:
+        """Start the writer task if it is not running on the current loop."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Collect queued calls into batches and write them, forever."""
+        while True:
+            batch: List[_Write] = [await self._queue.get()]
+            # Give a burst one tick to arrive, then take what is queued
+            await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Skip calls whose caller stopped waiting before they started
+            batch = [write for write in batch if not write[3].done()]
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: List[_Write]) -> None:
+        """Write one batch off the event loop and resolve its futures."""
+        try:
+            outcomes = await asyncio.to_thread(self._apply, batch)
+        except Exception as e:
+            # The transaction failed as a whole, e.g. the database was locked;
+            # every caller gets the exception, so it is logged once here
+            print(
+                f"Database write batch of {len(batch)} failed: "
+                f"{type(e).__name__}: {e}"
+            )
+            outcomes = [(False, e)] * len(batch)
+
+        for (_, _, _, future), (ok, value) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _apply(self, batch: List[_Write]) -> List[Tuple[bool, Any]]:
+        """Run a batch in one transaction, each call in its own savepoint."""
+        outcomes: List[Tuple[bool, Any]] = []
+        with self.db_manager.batch():
+            for func, args, kwargs, _ in batch:
+                try:
+                    # In a batch, get_connection() is a savepoint, so a call
+                    # that fails part way is rolled back on its own
+                    with self.db_manager.get_connection():
+                        outcomes.append((True, func(*args, **kwargs)))
+                except Exception as e:
+                    outcomes.append((False, e))
+        self.batches += 1
+        self.writes += len(batch)
+        return outcomes
+
+
+# Writers by database file, so every DatabaseManager for a file shares one
+_writers: Dict[str, DatabaseWriter] = {}
+
+
+def get_db_writer(db_manager: DatabaseManager) -> DatabaseWriter:
+    """
+    Get the shared writer for a database.
+
+    Creates the writer on first call for the database file and returns the
+    cached instance thereafter, so all writes to one file are coalesced by a
+    single writer task.
+
+    Args:
+        db_manager: Database to write to
+
+    Returns:
+        DatabaseWriter: The writer for the database file
+    """
+    writer = _writers.get(db_manager.db_file)
+    if writer is None:
+        writer = DatabaseWriter(db_manager)
+        _writers[db_manager.db_file] = writer
+    return writer
@@ -0,0 +1,215 @@
+"""
+Streaming export of the Points table.
+
+Writes point entries matching a filter to CSV, JSON Lines or Parquet. Rows
+are read from the database in fetchmany batches and written as they arrive,
+so memory use stays constant regardless of table size.
+
+Usage:
+    python -m PledgePoints.exporter --format csv --status approved -o points.csv
+
+Parquet output requires the optional pyarrow package.
+
+Author: Warner (with AI assistance)
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+from typing import BinaryIO, Iterable, List, Optional
+
+from PledgePoints.constants import EXPORT_BATCH_SIZE
+from PledgePoints.models import PointEntry, PointFilter
+from PledgePoints.sqlutils import DatabaseManager
+
+# Supported output formats
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Column order for every format
+EXPORT_FIELDS = [
+    "id",
+    "time",
+    "point_change",
+    "pledge",
+    "brother",
+    "comment",
+    "approval_status",
+    "approved_by",
+    "approval_timestamp",
+    "message_id",
+    "review_reason",
+]
+
+
+def entry_to_record(entry: PointEntry) -> dict:
+    """
+    Convert a point entry to a flat record keyed by EXPORT_FIELDS.
+
+    Args:
+        entry: Point entry to convert
+
+    Returns:
+        dict: Record with times as ISO strings
+    """
+    return {
+        "id": entry.entry_id,
+        "time": entry.time.isoformat(),
+        "point_change": entry.point_change,
+        "pledge": entry.pledge,
+        "brother": entry.brother,
+        "comment": entry.comment,
+        "approval_status": entry.approval_status,
+        "approved_by": entry.approved_by,
+        "approval_timestamp": (
+            entry.approval_timestamp.isoformat() if entry.approval_timestamp else None
+        ),
+        "message_id": entry.message_id,
+        "review_reason": entry.review_reason,
+    }
+
+
+def _write_csv(batches: Iterable[List[PointEntry]], fp: BinaryIO) -> int:
+    """Write batches as CSV with a header row."""
+    text = io.TextIOWrapper(fp, encoding="utf-8", newline="")
+    writer = csv.DictWriter(text, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for batch in batches:
+        writer.writerows(entry_to_record(entry) for entry in batch)
+        count += len(batch)
+    text.flush()
+    text.detach()
+    return count
+
+
+def _write_jsonl(batches: Iterable[List[PointEntry]], fp: BinaryIO) -> int:
+    """Write batches as one JSON object per line."""
+    count = 0
+    for batch in batches:
+        lines = [
+            json.dumps(entry_to_record(entry), ensure_ascii=False) + "\n"
+            for entry in batch
+        ]
+        fp.write("".join(lines).encode("utf-8"))
+        count += len(batch)
+    return count
+
+
+def _write_parquet(batches: Iterable[List[PointEntry]], fp: BinaryIO) -> int:
+    """Write batches as Parquet, one row group per batch."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet export requires the pyarrow package")
+
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("time", pa.string()),
+            ("point_change", pa.int64()),
+            ("pledge", pa.string()),
+            ("brother", pa.string()),
+            ("comment", pa.string()),
+            ("approval_status", pa.string()),
+            ("approved_by", pa.string()),
+            ("approval_timestamp", pa.string()),
+            ("message_id", pa.int64()),
+            ("review_reason", pa.string()),
+        ]
+    )
+    count = 0
+    with pq.ParquetWriter(fp, schema) as writer:
+        for batch in batches:
+            records = [entry_to_record(entry) for entry in batch]
+            writer.write_table(pa.Table.from_pylist(records, schema=schema))
+            count += len(batch)
+    return count
+
+
+def export_points(
+    db_manager: DatabaseManager,
+    fp: BinaryIO,
+    export_format: str,
+    point_filter: Optional[PointFilter] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> int:
+    """
+    Stream point entries matching a filter to a binary file or buffer.
+
+    Args:
+        db_manager: Database to export from
+        fp: Binary file object to write to (file, BytesIO, stdout buffer)
+        export_format: One of EXPORT_FORMATS
+        point_filter: Criteria to match; all rows if None
+        batch_size: Number of rows read and written per batch
+
+    Returns:
+        int: Number of entries written
+
+    Raises:
+        ValueError: If the format is unknown or its dependency is missing
+    """
+    writers = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+    if export_format not in writers:
+        raise ValueError(
+            f"Unknown export format '{export_format}'. "
+            f"Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    return writers[export_format](
+        db_manager.iter_points(point_filter, batch_size), fp
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for exporting points."""
+    arg_parser = argparse.ArgumentParser(description="Export the Points table.")
+    arg_parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    arg_parser.add_argument(
+        "--status",
+        action="append",
+        help="Approval status to include (repeatable, default: all)",
+    )
+    arg_parser.add_argument("--pledge", help="Only export points for this pledge")
+    arg_parser.add_argument(
+        "--since", type=datetime.fromisoformat, help="Earliest time (ISO format, UTC)"
+    )
+    arg_parser.add_argument(
+        "--until", type=datetime.fromisoformat, help="Latest time (ISO format, UTC)"
+    )
+    arg_parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    arg_parser.add_argument(
+        "--db", help="Path to the SQLite database (defaults to CSV_NAME from .env)"
+    )
+    args = arg_parser.parse_args(argv)
+
+    database_path = args.db
+    if database_path is None:
+        from config.settings import get_config
+
+        database_path = get_config().database_path
+    db_manager = DatabaseManager(database_path)
+
+    point_filter = PointFilter(
+        statuses=tuple(args.status) if args.status else None,
+        pledge=args.pledge,
+        since=args.since,
+        until=args.until,
+    )
+
+    if args.output:
+        with open(args.output, "wb") as fp:
+            count = export_points(db_manager, fp, args.format, point_filter)
+    else:
+        count = export_points(db_manager, sys.stdout.buffer, args.format, point_filter)
+        sys.stdout.buffer.flush()
+
+    print(f"Exported {count} point entries.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
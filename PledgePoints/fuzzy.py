@@ -0,0 +1,112 @@
+"""
+Approximate string matching for pledge names.
+
+Provides a Levenshtein edit distance and a symmetric-deletion index over a
+fixed set of words. The index stores every string reachable from each word
+by deleting up to max_distance characters; two words within max_distance
+edits always share such a string, so a query only computes the distance to
+the few words it shares a deletion with instead of scanning the roster.
+
+Author: Warner (with AI assistance)
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Compute the Levenshtein distance between two strings.
+
+    Counts the minimum number of single-character insertions, deletions and
+    substitutions needed to turn one string into the other.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        int: Edit distance between the strings
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,  # deletion
+                    current[j - 1] + 1,  # insertion
+                    previous[j - 1] + (char_a != char_b),  # substitution
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def deletions(word: str, max_distance: int) -> Set[str]:
+    """
+    Get every string formed by deleting up to max_distance characters.
+
+    Args:
+        word: Word to delete characters from
+        max_distance: Maximum number of characters to delete
+
+    Returns:
+        Set[str]: The word itself and all of its deletions
+    """
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            variant[:i] + variant[i + 1 :]
+            for variant in frontier
+            for i in range(len(variant))
+        }
+        results |= frontier
+    return results
+
+
+class DeletionIndex:
+    """
+    Index for finding words within a fixed edit distance of a query.
+
+    Attributes:
+        max_distance (int): Largest edit distance the index can answer
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int):
+        """
+        Build the index.
+
+        Args:
+            words: Words to index
+            max_distance: Largest edit distance to support in searches
+        """
+        self.max_distance = max_distance
+        self._index: Dict[str, Set[str]] = {}
+        for word in words:
+            for variant in deletions(word, max_distance):
+                self._index.setdefault(variant, set()).add(word)
+
+    def search(self, word: str) -> List[Tuple[int, str]]:
+        """
+        Find every indexed word within max_distance edits of a word.
+
+        Args:
+            word: Word to search for
+
+        Returns:
+            List[Tuple[int, str]]: (distance, word) pairs, closest first
+        """
+        candidates: Set[str] = set()
+        for variant in deletions(word, self.max_distance):
+            candidates |= self._index.get(variant, set())
+
+        matches = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate)
+            if distance <= self.max_distance:
+                matches.append((distance, candidate))
+        matches.sort()
+        return matches
@@ -0,0 +1,362 @@
+"""
+Offline bulk import of point submissions from Discord channel exports.
+
+Reads channel exports produced by DiscordChatExporter (JSON or CSV) and
+streams them through the same validation and deduplication used for live
+ingestion, inserting entries in large batched transactions. No Discord API
+calls are made, so whole semesters of history can be loaded locally.
+
+Usage:
+    python -m PledgePoints.importer export.json [--db pledge_points.db]
+
+Author: Warner (with AI assistance)
+"""
+
+import argparse
+import csv
+import json
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO
+
+import discord
+from dateutil import parser as date_parser
+
+from PledgePoints.constants import IMPORT_BATCH_SIZE
+from PledgePoints.messages import content_hash, eliminate_duplicates
+from PledgePoints.models import IngestStats, ParsedMessage, PointEntry
+from PledgePoints.sqlutils import DatabaseManager
+from PledgePoints.validators import configure_default_parser, parse_point_submission
+
+# Size of each read when streaming a JSON export
+_JSON_READ_SIZE = 1 << 16
+
+
+@dataclass
+class ExportedMessage:
+    """
+    A single message read from a channel export.
+
+    Attributes:
+        message_id (Optional[int]): Discord message ID (missing from CSV exports)
+        time (datetime): When the message was sent, in UTC
+        author (str): Display name of the author
+        is_bot (bool): Whether the author is a bot
+        content (str): Message text
+    """
+
+    message_id: Optional[int]
+    time: datetime
+    author: str
+    is_bot: bool
+    content: str
+
+
+def _parse_time(value: str, message_id: Optional[int]) -> datetime:
+    """
+    Get a message's time, preferring the exact time encoded in its ID.
+
+    Live ingestion stores discord.py's created_at, which is derived from the
+    snowflake, so using the same source keeps duplicate detection exact.
+    """
+    if message_id is not None:
+        return discord.utils.snowflake_time(message_id)
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = date_parser.parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _iter_json_array(fp: TextIO, key: str) -> Iterator[dict]:
+    """
+    Stream the objects of a top-level JSON array without loading the file.
+
+    Args:
+        fp: Open text file containing a JSON object
+        key: Name of the array member to stream, e.g. "messages"
+
+    Yields:
+        dict: Each element of the array
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    marker = f'"{key}"'
+
+    # Skip ahead to the opening bracket of the array
+    while True:
+        chunk = fp.read(_JSON_READ_SIZE)
+        if not chunk:
+            raise ValueError(f'No "{key}" array found in export')
+        buffer += chunk
+        index = buffer.find(marker)
+        if index == -1:
+            # Keep a tail in case the key is split across reads
+            buffer = buffer[-len(marker) :]
+            continue
+        bracket = buffer.find("[", index + len(marker))
+        if bracket != -1:
+            buffer = buffer[bracket + 1 :]
+            break
+
+    position = 0
+    while True:
+        # Skip separators between elements
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer):
+                break
+            chunk = fp.read(_JSON_READ_SIZE)
+            if not chunk:
+                raise ValueError(f'Unterminated "{key}" array in export')
+            buffer, position = chunk, 0
+
+        if buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # The element continues past the end of the buffer
+            chunk = fp.read(_JSON_READ_SIZE)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+
+        yield item
+        position = end
+
+
+def iter_json_export(fp: TextIO) -> Iterator[ExportedMessage]:
+    """
+    Read messages from a DiscordChatExporter JSON export.
+
+    Args:
+        fp: Open text file of the export
+
+    Yields:
+        ExportedMessage: Each message in the export, in file order
+    """
+    for item in _iter_json_array(fp, "messages"):
+        author = item.get("author") or {}
+        message_id = int(item["id"]) if item.get("id") else None
+        yield ExportedMessage(
+            message_id=message_id,
+            time=_parse_time(item.get("timestamp", ""), message_id),
+            author=author.get("nickname") or author.get("name") or "",
+            is_bot=bool(author.get("isBot", False)),
+            content=item.get("content") or "",
+        )
+
+
+def iter_csv_export(fp: TextIO) -> Iterator[ExportedMessage]:
+    """
+    Read messages from a DiscordChatExporter CSV export.
+
+    CSV exports carry no message IDs or bot flags, so duplicates against
+    already stored rows are detected by content only.
+
+    Args:
+        fp: Open text file of the export
+
+    Yields:
+        ExportedMessage: Each message in the export, in file order
+    """
+    for row in csv.DictReader(fp):
+        raw_id = row.get("ID") or row.get("MessageID")
+        message_id = int(raw_id) if raw_id else None
+        yield ExportedMessage(
+            message_id=message_id,
+            time=_parse_time(row.get("Date", ""), message_id),
+            author=row.get("Author", ""),
+            is_bot=False,
+            content=row.get("Content") or "",
+        )
+
+
+def iter_export(path: Path) -> Iterator[ExportedMessage]:
+    """
+    Read messages from a channel export, choosing the reader by file extension.
+
+    Args:
+        path: Path to a .json or .csv export
+
+    Yields:
+        ExportedMessage: Each message in the export
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        reader = iter_json_export
+    elif suffix == ".csv":
+        reader = iter_csv_export
+    else:
+        raise ValueError(f"Unsupported export format: {path.suffix}")
+
+    with open(path, encoding="utf-8-sig", newline="") as fp:
+        yield from reader(fp)
+
+
+def import_messages(
+    messages: Iterator[ExportedMessage],
+    db_manager: DatabaseManager,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> IngestStats:
+    """
+    Parse exported messages and insert new point entries in batches.
+
+    Each batch of messages is deduplicated against the database and stored
+    in one transaction, together with the parse outcome of every message
+    that has an ID, so a later live sync over the same history skips them.
+    Messages repeated within the export are skipped by ID, or for CSV rows
+    without IDs by time, author and content within the batch (repeats in
+    later batches are caught by the database check).
+
+    Args:
+        messages: Exported messages to import
+        db_manager: Database to insert into
+        batch_size: Number of messages per transaction
+
+    Returns:
+        IngestStats: Totals for the import
+    """
+    stats = IngestStats()
+    seen_ids = set()
+    seen_rows = set()
+    batch: List[PointEntry] = []
+    parsed: List[ParsedMessage] = []
+    batch_messages = 0
+
+    def flush():
+        nonlocal batch_messages
+        with db_manager.batch():
+            unique_entries = eliminate_duplicates(batch, db_manager)
+            if unique_entries:
+                db_manager.add_point_entries(unique_entries)
+
+            # A message the live sync already reacted to keeps its reacted
+            # flag, unless its content has changed since
+            known = db_manager.get_parsed_messages(m.message_id for m in parsed)
+            outcomes = []
+            for outcome in parsed:
+                previous = known.get(outcome.message_id)
+                if previous and previous.content_hash == outcome.content_hash:
+                    outcome = replace(outcome, reacted=previous.reacted)
+                outcomes.append(outcome)
+            db_manager.save_parsed_messages(outcomes)
+
+        stats.duplicates += len(batch) - len(unique_entries)
+        stats.inserted += len(unique_entries)
+        stats.pages += 1
+        batch.clear()
+        parsed.clear()
+        seen_rows.clear()
+        batch_messages = 0
+
+    for message in messages:
+        if message.is_bot:
+            continue
+        if message.message_id is not None:
+            if message.message_id in seen_ids:
+                continue
+            seen_ids.add(message.message_id)
+        else:
+            row = (message.time, message.author, message.content)
+            if row in seen_rows:
+                continue
+            seen_rows.add(row)
+
+        stats.fetched += 1
+        batch_messages += 1
+        result = parse_point_submission(message.content)
+        if message.message_id is not None:
+            parsed.append(
+                ParsedMessage(
+                    message.message_id,
+                    content_hash(message.content),
+                    parse_ok=result is not None,
+                )
+            )
+
+        if result is None:
+            stats.invalid += 1
+        else:
+            point_change, pledges, comment = result
+            batch.extend(
+                PointEntry(
+                    time=message.time,
+                    point_change=point_change,
+                    pledge=pledge,
+                    brother=message.author,
+                    comment=comment,
+                    message_id=message.message_id,
+                )
+                for pledge in pledges
+            )
+            stats.parsed += len(pledges)
+            if message.message_id is not None:
+                stats.last_message_id = message.message_id
+
+        if batch_messages >= batch_size:
+            flush()
+
+    if batch_messages:
+        flush()
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for importing channel exports."""
+    arg_parser = argparse.ArgumentParser(
+        description="Import point submissions from Discord channel exports."
+    )
+    arg_parser.add_argument(
+        "exports", nargs="+", type=Path, help="JSON or CSV channel export files"
+    )
+    arg_parser.add_argument(
+        "--db", help="Path to the SQLite database (defaults to CSV_NAME from .env)"
+    )
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=IMPORT_BATCH_SIZE,
+        help="Messages per transaction",
+    )
+    arg_parser.add_argument(
+        "--fuzzy-distance",
+        type=int,
+        default=0,
+        help="Correct pledge names up to this many typos (default: exact only)",
+    )
+    args = arg_parser.parse_args(argv)
+    configure_default_parser(args.fuzzy_distance)
+
+    database_path = args.db
+    if database_path is None:
+        from config.settings import get_config
+
+        database_path = get_config().database_path
+    db_manager = DatabaseManager(database_path)
+
+    for path in args.exports:
+        start_time = time.time()
+        stats = import_messages(iter_export(path), db_manager, args.batch_size)
+        print(
+            f"{path}: added {stats.inserted} new points from {stats.fetched} messages "
+            f"({stats.invalid} invalid, {stats.duplicates} duplicates) "
+            f"in {time.time() - start_time:.2f} seconds."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Bounded in-memory cache of recent points-channel messages.
+
+Raw edit and delete events for messages outside discord.py's own message
+cache carry only IDs. Ingestion records the content and author of every
+points-channel message it reads here, so deletion logging and edit
+reconciliation can recover them from memory instead of the Discord API.
+
+Author: Warner (with AI assistance)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import discord
+
+
+@dataclass
+class CachedMessage:
+    """
+    Content and author of a message, as last seen by the bot.
+
+    Attributes:
+        message_id (int): Discord message ID
+        channel_id (int): ID of the channel the message was sent in
+        author_id (int): Discord user ID of the author
+        author_name (str): Display name of the author
+        content (str): Message text
+        created_at (datetime): When the message was sent
+    """
+
+    message_id: int
+    channel_id: int
+    author_id: int
+    author_name: str
+    content: str
+    created_at: datetime
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> "CachedMessage":
+        """
+        Capture the cacheable fields of a Discord message.
+
+        Args:
+            message: Message to capture
+
+        Returns:
+            CachedMessage: New cache entry
+        """
+        return cls(
+            message_id=message.id,
+            channel_id=message.channel.id,
+            author_id=message.author.id,
+            author_name=message.author.display_name,
+            content=message.content,
+            created_at=message.created_at,
+        )
+
+
+class MessageContentCache:
+    """
+    Least-recently-used cache of messages keyed by message ID.
+
+    Lookups, inserts and evictions are O(1). Once max_size messages are held,
+    adding another evicts the one used longest ago.
+
+    Attributes:
+        max_size (int): Most messages held at once (0 disables caching)
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Most messages held at once (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, CachedMessage]" = OrderedDict()
+
+    def put(self, entry: CachedMessage) -> None:
+        """
+        Add or replace a cached message, marking it most recently used.
+
+        Args:
+            entry: Message to cache
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[entry.message_id] = entry
+        self._entries.move_to_end(entry.message_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def add_message(self, message: discord.Message) -> None:
+        """
+        Cache a Discord message.
+
+        Args:
+            message: Message to cache
+        """
+        self.put(CachedMessage.from_message(message))
+
+    def get(self, message_id: int) -> Optional[CachedMessage]:
+        """
+        Look up a message, marking it most recently used.
+
+        Args:
+            message_id: Discord message ID
+
+        Returns:
+            Optional[CachedMessage]: The cached message, or None if not cached
+        """
+        entry = self._entries.get(message_id)
+        if entry is not None:
+            self._entries.move_to_end(message_id)
+        return entry
+
+    def update_content(self, message_id: int, content: str) -> None:
+        """
+        Record new content for a cached message after an edit.
+
+        Args:
+            message_id: Discord message ID
+            content: Edited message text
+        """
+        entry = self.get(message_id)
+        if entry is not None:
+            entry.content = content
+
+    def pop(self, message_id: int) -> Optional[CachedMessage]:
+        """
+        Remove a message from the cache, e.g. once it has been deleted.
+
+        Args:
+            message_id: Discord message ID
+
+        Returns:
+            Optional[CachedMessage]: The removed message, or None if not cached
+        """
+        return self._entries.pop(message_id, None)
+
+    def __contains__(self, message_id: object) -> bool:
+        """Check whether a message is cached without changing its recency."""
+        return message_id in self._entries
+
+    def __len__(self) -> int:
+        """Get the number of cached messages."""
+        return len(self._entries)
@@ -1,57 +1,33 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Tuple
+import hashlib
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Set, Tuple
 
 import discord
-import pytz
 
 from PledgePoints.constants import (
     EMOJI_FAILURE,
     EMOJI_SUCCESS,
+    HISTORY_FETCH_MAX_CONCURRENCY,
+    HISTORY_PAGE_SIZE,
+    INGEST_QUEUE_SIZE,
     REACTION_RATE_LIMIT_SECONDS,
 )
-from PledgePoints.models import PointEntry
+from PledgePoints.db_writer import get_db_writer
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.models import IngestStats, ParsedMessage, PointEntry
+from PledgePoints.rules import ApprovalRules, get_approval_rules
 from PledgePoints.sqlutils import DatabaseManager
-from PledgePoints.validators import parse_point_message
+from PledgePoints.validators import parse_point_submission
 
-
-async def fetch_messages_from_days_ago(
-    bot: discord.Client, channel_id: int, days_ago: int
-) -> list[tuple[discord.User, datetime, str, discord.Message]]:
-    """
-    Fetch messages from a Discord channel that were sent a certain number of days ago.
-
-    Args:
-        bot (discord.Client): The Discord bot instance
-        channel_id (int): The ID of the channel to fetch messages from
-        days_ago (int): Number of days ago to fetch messages from
-
-    Returns:
-        list[tuple[discord.User, datetime, str, discord.Message]]: List of tuples containing (author, created_at, content, message)
-    """
-    # Get the channel
-    channel = bot.get_channel(channel_id)
-    if not channel:
-        raise ValueError(f"Channel with ID {channel_id} not found")
-
-    # Calculate the target date
-    target_date = datetime.now(pytz.UTC) - timedelta(days=days_ago)
-
-    # Fetch messages
-    messages = []
-    async for message in channel.history(limit=None, after=target_date):
-        # Skip messages from bots
-        if message.author.bot:
-            continue
-        messages.append((message.author, message.created_at, message.content, message))
-
-    return messages
+# Strong references to fire-and-forget tasks; asyncio only keeps weak ones
+_background_tasks: Set[asyncio.Task] = set()
 
 
 async def add_reactions_with_rate_limit(
     messages: List[Tuple[discord.Message, bool]],
     rate_limit: float = REACTION_RATE_LIMIT_SECONDS,
-):
+) -> List[int]:
     """
     Add reactions to messages with rate limiting.
 
@@ -61,62 +37,84 @@ async def add_reactions_with_rate_limit(
     Args:
         messages: List of (message, success) tuples where success determines emoji
         rate_limit: Minimum time between reactions in seconds
+
+    Returns:
+        List[int]: IDs of the messages that received their reaction
     """
+    reacted = []
     for message, success in messages:
         try:
             emoji = EMOJI_SUCCESS if success else EMOJI_FAILURE
             await message.add_reaction(emoji)
+            reacted.append(message.id)
             await asyncio.sleep(rate_limit)  # Rate limit the reactions
         except Exception:
             # Skip if we can't add the reaction (permissions, deleted message, etc.)
             continue
+    return reacted
 
 
-async def process_messages(
+def content_hash(content: str) -> int:
+    """
+    Hash message content into a signed 64-bit integer for the parse cache.
+
+    Args:
+        content: Message content
+
+    Returns:
+        int: Hash that fits in a SQLite INTEGER column
+    """
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def parse_messages(
     messages: list[tuple[discord.User, datetime, str, discord.Message]],
-) -> List[PointEntry]:
+) -> Tuple[List[PointEntry], List[Tuple[discord.Message, bool]]]:
     """
-    Process messages to extract point changes, pledge names, and comments.
+    Parse messages into point entries without touching Discord.
 
     Validates each message against the expected format (+/-N PledgeName Comment)
-    and returns a list of PointEntry objects. Also handles adding reactions
-    to messages (thumbs up for valid, thumbs down for invalid).
+    and records which reaction each message should receive. A message naming
+    several pledges ("+5 Evan, Milo for cleanup") yields one entry per pledge,
+    all tied to the same message ID.
 
     Args:
         messages: List of tuples containing (author, timestamp, content, message)
 
     Returns:
-        List[PointEntry]: List of validated point entries ready for database insertion
+        Tuple of (entries, reactions) where reactions is a list of
+        (message, success) tuples for add_reactions_with_rate_limit
     """
     processed_entries = []
     reaction_queue = []
 
     for author, timestamp, content, message in messages:
         # Use centralized validator to parse message
-        result = parse_point_message(content)
+        result = parse_point_submission(content)
 
         if result is None:
             # Invalid message - queue failure reaction
             reaction_queue.append((message, False))
             continue
 
-        point_change, pledge, comment = result
-
-        # Create PointEntry object
-        entry = PointEntry(
-            time=timestamp,
-            point_change=point_change,
-            pledge=pledge,
-            brother=author.display_name,
-            comment=comment,
-        )
-        processed_entries.append(entry)
+        point_change, pledges, comment = result
+
+        # Create one PointEntry per pledge named in the message
+        for pledge in pledges:
+            entry = PointEntry(
+                time=timestamp,
+                point_change=point_change,
+                pledge=pledge,
+                brother=author.display_name,
+                comment=comment,
+                message_id=message.id,
+                author_id=author.id,
+            )
+            processed_entries.append(entry)
         reaction_queue.append((message, True))
 
-    # Handle reactions separately with rate limiting
-    asyncio.create_task(add_reactions_with_rate_limit(reaction_queue))
-
-    return processed_entries
+    return processed_entries, reaction_queue
 
 
 def eliminate_duplicates(
@@ -126,9 +124,12 @@ def eliminate_duplicates(
     """
     Eliminate duplicate point entries by comparing against existing database entries.
 
-    Compares new entries against all existing entries (pending, approved, rejected)
-    to avoid duplicate insertions. Uses ISO format for datetime comparison to
-    preserve full precision including microseconds and timezone information.
+    Entries whose source message is already stored are duplicates. Entries
+    without a stored message ID (rows written before message IDs were recorded)
+    are compared by content against existing entries (pending, approved,
+    rejected) at the same timestamps, so only the rows relevant to this batch
+    are loaded. Uses ISO format for datetime comparison to preserve full
+    precision including microseconds and timezone information.
 
     Args:
         new_entries: List of new point entries to check for duplicates
@@ -137,11 +138,18 @@ def eliminate_duplicates(
     Returns:
         List[PointEntry]: List of unique entries not already in the database
     """
-    # Get all existing points from the database, regardless of approval status
+    if not new_entries:
+        return []
+
+    existing_message_ids = db_manager.get_existing_message_ids(
+        {entry.message_id for entry in new_entries if entry.message_id is not None}
+    )
+
+    # Get existing points at the same timestamps, regardless of approval status
     # We only compare message content (time, points, pledge, comment)
     # and ignore approval-related fields (id, approval_status, approved_by, approval_timestamp)
     # NOTE: We also ignore the 'brother' field because Discord display names can change
-    old_points = db_manager.get_all_points(status_filter=None)
+    old_points = db_manager.get_points_at_times(entry.time for entry in new_entries)
 
     # Convert old points to a set of string representations for faster lookup
     # NOTE: We exclude the 'brother' field from comparison because Discord display names
@@ -159,6 +167,9 @@ def eliminate_duplicates(
     # Filter new entries
     unique_entries = []
     for entry in new_entries:
+        if entry.message_id in existing_message_ids:
+            continue
+
         # Convert datetime to ISO format string in the same format
         time_str = entry.time.isoformat()
         # Create a tuple of the relevant fields as strings (excluding brother)
@@ -168,3 +179,336 @@ def eliminate_duplicates(
             unique_entries.append(entry)
 
     return unique_entries
+
+
+async def iter_history_pages(
+    channel: discord.abc.Messageable,
+    after: datetime | discord.abc.Snowflake,
+    before: Optional[datetime | discord.abc.Snowflake] = None,
+    page_size: int = HISTORY_PAGE_SIZE,
+) -> AsyncIterator[List[discord.Message]]:
+    """
+    Walk channel history oldest-first, yielding one page of messages at a time.
+
+    Bot messages are skipped. Pages are yielded in chronological order so that
+    the last message of each committed page is a valid resume point.
+
+    Args:
+        channel: Channel to read history from
+        after: Only fetch messages after this time or message
+        before: Only fetch messages before this time or message
+        page_size: Maximum number of messages per yielded page
+
+    Yields:
+        List[discord.Message]: Up to page_size non-bot messages
+    """
+    page = []
+    async for message in channel.history(
+        limit=None, after=after, before=before, oldest_first=True
+    ):
+        if message.author.bot:
+            continue
+        page.append(message)
+        if len(page) >= page_size:
+            yield page
+            page = []
+
+    if page:
+        yield page
+
+
+def split_snowflake_window(
+    after: datetime | discord.abc.Snowflake,
+    before: datetime | discord.abc.Snowflake,
+    slices: int,
+) -> List[Tuple[int, int]]:
+    """
+    Split a history window into contiguous snowflake ranges.
+
+    Snowflakes grow with message time, so equal snowflake ranges are equal
+    time slices. Both bounds of each range are exclusive, like the history
+    bounds they are passed to, and every ID inside the window falls in
+    exactly one range.
+
+    Args:
+        after: Start of the window (exclusive), as a time or message
+        before: End of the window (exclusive), as a time or message
+        slices: Number of slices to split the window into
+
+    Returns:
+        List[Tuple[int, int]]: (after_id, before_id) pairs, oldest first
+    """
+
+    def to_snowflake(bound, high):
+        if isinstance(bound, datetime):
+            return discord.utils.time_snowflake(bound, high=high)
+        return bound.id
+
+    # IDs strictly inside the window, split as evenly as possible
+    first = to_snowflake(after, True) + 1
+    count = to_snowflake(before, False) - first
+    slices = max(1, min(slices, count))
+
+    starts = [first + i * count // slices for i in range(slices)]
+    ends = starts[1:] + [first + count]
+    # Widen each inclusive ID range by one on both sides for exclusive bounds
+    return [(start - 1, end) for start, end in zip(starts, ends)]
+
+
+async def iter_sliced_history_pages(
+    channel: discord.abc.Messageable,
+    after: datetime | discord.abc.Snowflake,
+    before: datetime | discord.abc.Snowflake,
+    slices: int,
+    page_size: int = HISTORY_PAGE_SIZE,
+    max_concurrency: int = HISTORY_FETCH_MAX_CONCURRENCY,
+    queue_size: int = INGEST_QUEUE_SIZE,
+) -> AsyncIterator[List[discord.Message]]:
+    """
+    Fetch a history window as concurrent time slices, yielding pages in order.
+
+    Each slice is walked by its own task into its own bounded queue, and at
+    most max_concurrency page fetches are in flight at once to stay within
+    Discord's rate limits. Pages are yielded slice by slice, so the output
+    is in the same chronological order as iter_history_pages.
+
+    Args:
+        channel: Channel to read history from
+        after: Only fetch messages after this time or message
+        before: Only fetch messages before this time or message
+        slices: Number of time slices to fetch concurrently
+        page_size: Maximum number of messages per yielded page
+        max_concurrency: Maximum number of page fetches in flight
+        queue_size: Maximum number of pages buffered per slice
+
+    Yields:
+        List[discord.Message]: Up to page_size non-bot messages
+    """
+    ranges = split_snowflake_window(after, before, slices)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in ranges]
+
+    async def fetch_slice(queue: asyncio.Queue, low: int, high: int):
+        pages = iter_history_pages(
+            channel, discord.Object(id=low), discord.Object(id=high), page_size
+        )
+        try:
+            while True:
+                # Hold the semaphore only while fetching, not while the
+                # consumer is busy with earlier slices
+                async with semaphore:
+                    try:
+                        page = await anext(pages)
+                    except StopAsyncIteration:
+                        break
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    tasks = [
+        asyncio.create_task(fetch_slice(queue, low, high))
+        for queue, (low, high) in zip(queues, ranges)
+    ]
+    try:
+        for queue in queues:
+            while (page := await queue.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _drain_reactions(
+    queue: "asyncio.Queue[Optional[List[Tuple[discord.Message, bool]]]]",
+    db_manager: DatabaseManager,
+) -> None:
+    """
+    Apply queued reaction batches one after another until a None sentinel.
+
+    Messages that receive their reaction are marked in the parse cache so
+    later runs skip them.
+    """
+    while True:
+        batch = await queue.get()
+        if batch is None:
+            return
+        reacted = await add_reactions_with_rate_limit(batch)
+        try:
+            await get_db_writer(db_manager).submit(
+                db_manager.mark_messages_reacted, reacted
+            )
+        except Exception:
+            # The cache only saves work; a lost update means a repeat reaction
+            pass
+
+
+async def ingest_channel_history(
+    bot: discord.Client,
+    channel_id: int,
+    after: datetime | discord.abc.Snowflake,
+    db_manager: DatabaseManager,
+    before: Optional[datetime | discord.abc.Snowflake] = None,
+    page_size: int = HISTORY_PAGE_SIZE,
+    queue_size: int = INGEST_QUEUE_SIZE,
+    slices: int = 1,
+    on_page_committed: Optional[Callable[[IngestStats], Awaitable[None]]] = None,
+    message_cache: Optional[MessageContentCache] = None,
+    approval_rules: Optional[ApprovalRules] = None,
+) -> IngestStats:
+    """
+    Stream channel history into the database page by page.
+
+    Runs three stages connected by bounded queues: fetching history pages,
+    parsing them into point entries, and deduplicating and inserting each
+    page atomically through the shared database writer, which commits it
+    together with any other writes queued at the time. Only a few pages are
+    held in memory at a time, inserts overlap with network fetches, and
+    every committed page stays committed if the ingest is interrupted.
+
+    Reactions are applied by a separate background task, one page at a time
+    after the page is committed, so they keep the configured rate limit
+    without slowing ingestion.
+
+    Each message's parse outcome is cached by message ID and content hash.
+    Messages already parsed and reacted to in an earlier run are skipped
+    entirely unless they were edited since.
+
+    Args:
+        bot: The Discord bot instance
+        channel_id: The ID of the channel to ingest
+        after: Only ingest messages after this time or message
+        db_manager: Database manager used for deduplication and inserts
+        before: Only ingest messages before this time or message
+        page_size: Maximum number of messages committed per transaction
+        queue_size: Maximum number of pages buffered between stages
+        slices: Number of time slices to fetch concurrently; values above 1
+            require `before` to be set
+        on_page_committed: Optional coroutine called with the running stats
+            after each page is committed
+        message_cache: Optional cache that every fetched message is recorded
+            in, for later edit and deletion handling
+        approval_rules: Auto-approval rules applied to new entries before
+            they are inserted; the configured rules if None
+
+    Returns:
+        IngestStats: Totals for the ingest
+
+    Raises:
+        ValueError: If the channel cannot be found
+    """
+    channel = bot.get_channel(channel_id)
+    if not channel:
+        raise ValueError(f"Channel with ID {channel_id} not found")
+
+    rules = approval_rules if approval_rules is not None else get_approval_rules()
+    writer = get_db_writer(db_manager)
+    stats = IngestStats()
+    parse_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    reaction_queue: asyncio.Queue = asyncio.Queue()
+
+    # Each stage signals completion with a None sentinel. Failures are not
+    # signalled through the queues; gather() cancels the remaining stages.
+    if slices > 1 and before is not None:
+        pages = iter_sliced_history_pages(
+            channel, after, before, slices, page_size, queue_size=queue_size
+        )
+    else:
+        pages = iter_history_pages(channel, after, before, page_size)
+
+    async def fetch_stage():
+        async for page in pages:
+            await parse_queue.put(page)
+        await parse_queue.put(None)
+
+    async def parse_stage():
+        while (page := await parse_queue.get()) is not None:
+            if message_cache is not None:
+                for message in page:
+                    message_cache.add_message(message)
+
+            cache = await asyncio.to_thread(
+                db_manager.get_parsed_messages, [m.id for m in page]
+            )
+            hashes = {m.id: content_hash(m.content) for m in page}
+
+            fresh = []
+            pending_reactions = []
+            for message in page:
+                cached = cache.get(message.id)
+                if cached is None or cached.content_hash != hashes[message.id]:
+                    fresh.append(message)
+                elif not cached.reacted:
+                    # Parsed before but never reacted to; reuse the outcome
+                    pending_reactions.append((message, cached.parse_ok))
+
+            entries, reactions = parse_messages(
+                [(m.author, m.created_at, m.content, m) for m in fresh]
+            )
+            parsed = [
+                ParsedMessage(message.id, hashes[message.id], success)
+                for message, success in reactions
+            ]
+            await write_queue.put(
+                (page, entries, reactions, parsed, pending_reactions)
+            )
+        await write_queue.put(None)
+
+    def store_page(entries, parsed):
+        # Deduplicate inside the writer's transaction, which holds the write
+        # lock, so concurrent ingests (a scheduled sync during a backfill, say)
+        # cannot both decide the same messages are new. Entries and parse
+        # outcomes of a page are stored together or not at all.
+        unique_entries = rules.apply(eliminate_duplicates(entries, db_manager))
+        if unique_entries:
+            db_manager.add_point_entries(unique_entries)
+        db_manager.save_parsed_messages(parsed)
+        return unique_entries
+
+    async def write_stage():
+        while (item := await write_queue.get()) is not None:
+            page, entries, reactions, parsed, pending_reactions = item
+            unique_entries = await writer.submit(store_page, entries, parsed)
+
+            # Only react once the page is stored, so a failed insert leaves no ✅
+            reaction_queue.put_nowait(reactions + pending_reactions)
+
+            stats.fetched += len(page)
+            stats.cached += len(page) - len(reactions)
+            stats.parsed += len(entries)
+            stats.invalid += sum(1 for _, success in reactions if not success)
+            stats.duplicates += len(entries) - len(unique_entries)
+            stats.inserted += len(unique_entries)
+            stats.auto_approved += sum(
+                1 for entry in unique_entries if entry.approval_status == "approved"
+            )
+            stats.pages += 1
+            stats.last_message_id = page[-1].id
+
+            if on_page_committed is not None:
+                await on_page_committed(stats)
+
+    reaction_task = asyncio.create_task(_drain_reactions(reaction_queue, db_manager))
+    _background_tasks.add(reaction_task)
+    reaction_task.add_done_callback(_background_tasks.discard)
+    stages = [
+        asyncio.create_task(fetch_stage()),
+        asyncio.create_task(parse_stage()),
+        asyncio.create_task(write_stage()),
+    ]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        for stage in stages:
+            stage.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        raise
+    finally:
+        reaction_queue.put_nowait(None)
+
+    return stats
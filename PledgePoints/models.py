@@ -7,9 +7,9 @@ used throughout the application, replacing raw tuples with type-safe objects.
 Author: Warner (with AI assistance)
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -31,6 +31,12 @@ class PointEntry:
         approval_status (str): Current approval status ('pending', 'approved', 'rejected')
         approved_by (Optional[str]): Name of person who approved/rejected
         approval_timestamp (Optional[datetime]): When the approval/rejection occurred
+        message_id (Optional[int]): Discord ID of the source message, if known
+        review_reason (Optional[str]): Why the entry was voided or needs review,
+            e.g. its source message was edited or deleted after approval
+        version (int): Row version, incremented by every status change
+        author_id (Optional[int]): Discord user ID of the brother who
+            submitted the entry, if known
     """
 
     time: datetime
@@ -42,6 +48,10 @@ class PointEntry:
     approval_status: str = "pending"
     approved_by: Optional[str] = None
     approval_timestamp: Optional[datetime] = None
+    message_id: Optional[int] = None
+    review_reason: Optional[str] = None
+    version: int = 0
+    author_id: Optional[int] = None
 
     def to_tuple(self) -> tuple:
         """
@@ -60,7 +70,9 @@ class PointEntry:
         Args:
             row (tuple): Database row with columns in order:
                         (id, Time, PointChange, Pledge, Brother, Comment,
-                         approval_status, approved_by, approval_timestamp)
+                         approval_status, approved_by, approval_timestamp,
+                         [message_id], [review_reason], [version],
+                         [author_id])
 
         Returns:
             PointEntry: New PointEntry instance
@@ -75,7 +87,11 @@ class PointEntry:
             approval_status,
             approved_by,
             approval_timestamp_str,
-        ) = row
+        ) = row[:9]
+        message_id = row[9] if len(row) > 9 else None
+        review_reason = row[10] if len(row) > 10 else None
+        version = row[11] if len(row) > 11 else 0
+        author_id = row[12] if len(row) > 12 else None
 
         # Convert time string to datetime
         if isinstance(time_str, datetime):
@@ -104,6 +120,10 @@ class PointEntry:
             approval_status=approval_status or "pending",
             approved_by=approved_by,
             approval_timestamp=approval_dt,
+            message_id=message_id,
+            review_reason=review_reason,
+            version=version or 0,
+            author_id=author_id,
         )
 
     @classmethod
@@ -132,3 +152,398 @@ class PointEntry:
             brother=brother,
             comment=comment,
         )
+
+
+@dataclass
+class IngestStats:
+    """
+    Running counters for a streaming ingest of channel history.
+
+    Updated page by page as messages are fetched, parsed, deduplicated and
+    committed, so a partially completed ingest still reports accurate totals.
+
+    Attributes:
+        fetched (int): Number of non-bot messages fetched from Discord
+        parsed (int): Number of point entries parsed from those messages
+        invalid (int): Number of messages that failed validation
+        duplicates (int): Number of parsed entries already in the database
+        inserted (int): Number of entries committed to the database
+        pages (int): Number of history pages committed
+        last_message_id (Optional[int]): ID of the newest committed message
+        cached (int): Number of messages skipped as unchanged since they were
+            last parsed and reacted to
+        auto_approved (int): Number of inserted entries approved by an
+            auto-approval rule
+    """
+
+    fetched: int = 0
+    parsed: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    inserted: int = 0
+    pages: int = 0
+    last_message_id: Optional[int] = None
+    cached: int = 0
+    auto_approved: int = 0
+
+
+@dataclass
+class ReconcileResult:
+    """
+    Changes made to stored entries after their source message changed.
+
+    Attributes:
+        voided (List[PointEntry]): Pending entries voided
+        flagged (List[PointEntry]): Approved entries flagged for review
+        inserted (List[PointEntry]): Pending entries added from edited content
+    """
+
+    voided: List[PointEntry] = field(default_factory=list)
+    flagged: List[PointEntry] = field(default_factory=list)
+    inserted: List[PointEntry] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """Whether any stored entry was changed."""
+        return bool(self.voided or self.flagged or self.inserted)
+
+
+@dataclass
+class ReviewResult:
+    """
+    Outcome of approving or rejecting point entries.
+
+    Attributes:
+        reviewed (List[PointEntry]): Entries this request approved or rejected
+        already_reviewed (List[PointEntry]): Requested IDs that were no longer
+            pending, as they are now (e.g. reviewed by someone else first)
+        missing (List[int]): Requested IDs with no point entry
+        replayed (bool): Whether the request had already been processed and
+            its earlier result was returned instead of reviewing again
+    """
+
+    reviewed: List[PointEntry] = field(default_factory=list)
+    already_reviewed: List[PointEntry] = field(default_factory=list)
+    missing: List[int] = field(default_factory=list)
+    replayed: bool = False
+
+
+@dataclass
+class PointEvent:
+    """
+    One change to a point entry's status, from the append-only audit log.
+
+    Attributes:
+        event_id (int): Database ID of the event
+        entry_id (int): ID of the point entry that changed
+        old_status (Optional[str]): Status before the change; None when the
+            entry was inserted with a status other than pending
+        new_status (str): Status after the change
+        actor (Optional[str]): Who made the change (approver, or
+            "auto:<rule>"); None for automatic changes such as voiding
+        time (datetime): When the change was made, in UTC
+        note (Optional[str]): Review reason set by the change, if any
+    """
+
+    event_id: int
+    entry_id: int
+    old_status: Optional[str]
+    new_status: str
+    actor: Optional[str]
+    time: datetime
+    note: Optional[str] = None
+
+    @classmethod
+    def from_db_row(cls, row: tuple) -> "PointEvent":
+        """
+        Create a PointEvent from a database row.
+
+        Args:
+            row (tuple): (id, entry_id, old_status, new_status, actor,
+                          event_time, note), with event_time in epoch seconds
+
+        Returns:
+            PointEvent: New PointEvent instance
+        """
+        event_id, entry_id, old_status, new_status, actor, event_time, note = row
+        return cls(
+            event_id=event_id,
+            entry_id=entry_id,
+            old_status=old_status,
+            new_status=new_status,
+            actor=actor,
+            time=datetime.fromtimestamp(event_time, timezone.utc),
+            note=note,
+        )
+
+
+@dataclass
+class ParsedMessage:
+    """
+    Cached outcome of parsing a Discord message.
+
+    Lets re-runs over an overlapping history window skip messages that were
+    already parsed and reacted to, unless their content has changed.
+
+    Attributes:
+        message_id (int): Discord message ID
+        content_hash (int): 64-bit hash of the message content when parsed
+        parse_ok (bool): Whether the message was a valid point submission
+        reacted (bool): Whether the validation reaction has been applied
+    """
+
+    message_id: int
+    content_hash: int
+    parse_ok: bool
+    reacted: bool = False
+
+    @classmethod
+    def from_db_row(cls, row: Tuple) -> "ParsedMessage":
+        """
+        Create a ParsedMessage from a ParsedMessages table row.
+
+        Args:
+            row: (message_id, content_hash, parse_ok, reacted)
+
+        Returns:
+            ParsedMessage: New instance populated from the row
+        """
+        message_id, content_hash, parse_ok, reacted = row
+        return cls(message_id, content_hash, bool(parse_ok), bool(reacted))
+
+
+@dataclass
+class BackfillJob:
+    """
+    Persistent state of a history backfill job.
+
+    A backfill ingests a fixed window of channel history. The ID of the last
+    committed message is checkpointed after every page so an interrupted job
+    can resume where it left off instead of starting over.
+
+    Attributes:
+        job_id (int): Database ID of the job
+        channel_id (int): Discord channel being backfilled
+        window_start (datetime): Oldest message time included in the window
+        window_end (datetime): Newest message time included in the window
+        status (str): 'running', 'completed', 'cancelled' or 'failed'
+        requested_by (Optional[str]): Name of the person who started the job
+        last_message_id (Optional[int]): ID of the last committed message
+        fetched (int): Messages fetched so far, across all runs
+        inserted (int): Entries inserted so far, across all runs
+        duplicates (int): Duplicate entries skipped so far, across all runs
+        invalid (int): Invalid messages seen so far, across all runs
+        error (Optional[str]): Error message if the job failed
+    """
+
+    job_id: int
+    channel_id: int
+    window_start: datetime
+    window_end: datetime
+    status: str = "running"
+    requested_by: Optional[str] = None
+    last_message_id: Optional[int] = None
+    fetched: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    error: Optional[str] = None
+
+    @classmethod
+    def from_db_row(cls, row: tuple) -> "BackfillJob":
+        """
+        Create a BackfillJob from a database row.
+
+        Args:
+            row (tuple): Database row with columns in order:
+                        (id, channel_id, window_start, window_end, status,
+                         requested_by, last_message_id, fetched, inserted,
+                         duplicates, invalid, error)
+
+        Returns:
+            BackfillJob: New BackfillJob instance
+        """
+        (
+            job_id,
+            channel_id,
+            window_start,
+            window_end,
+            status,
+            requested_by,
+            last_message_id,
+            fetched,
+            inserted,
+            duplicates,
+            invalid,
+            error,
+        ) = row
+
+        return cls(
+            job_id=job_id,
+            channel_id=channel_id,
+            window_start=datetime.fromisoformat(window_start),
+            window_end=datetime.fromisoformat(window_end),
+            status=status,
+            requested_by=requested_by,
+            last_message_id=last_message_id,
+            fetched=fetched or 0,
+            inserted=inserted or 0,
+            duplicates=duplicates or 0,
+            invalid=invalid or 0,
+            error=error,
+        )
+
+
+@dataclass
+class Job:
+    """
+    In-memory state of a background job run by the job runner.
+
+    Attributes:
+        job_id (int): Sequential ID of the job within this process
+        name (str): Short description shown in /jobs
+        requested_by (Optional[str]): Name of the person who submitted the job
+        owner_id (Optional[int]): Discord user ID of the person who submitted
+            the job, who may cancel it without the approver role
+        status (str): 'queued', 'running', 'completed', 'failed' or 'cancelled'
+        created_at (datetime): When the job was submitted, in UTC
+        started_at (Optional[datetime]): When a worker picked the job up
+        finished_at (Optional[datetime]): When the job reached a final status
+        summary (Optional[str]): One-line result reported by the job
+        error (Optional[str]): Error message if the job failed
+    """
+
+    job_id: int
+    name: str
+    requested_by: Optional[str] = None
+    owner_id: Optional[int] = None
+    status: str = "queued"
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    summary: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has reached a final status."""
+        return self.status in ("completed", "failed", "cancelled")
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the job has run for, or None if it never started."""
+        if self.started_at is None:
+            return None
+        end = self.finished_at or datetime.now(timezone.utc)
+        return (end - self.started_at).total_seconds()
+
+
+@dataclass(frozen=True)
+class PointFilter:
+    """
+    Criteria for selecting point entries in a single SQL statement.
+
+    Every criterion is optional; unset criteria match all rows.
+
+    Attributes:
+        statuses (Optional[Tuple[str, ...]]): Approval statuses to include
+        pledge (Optional[str]): Pledge name to match exactly
+        since (Optional[datetime]): Earliest entry time (inclusive)
+        until (Optional[datetime]): Latest entry time (exclusive)
+        ids (Optional[Tuple[int, ...]]): Entry IDs to include
+        brother (Optional[str]): Submitting brother to match, ignoring case
+        min_points (Optional[int]): Smallest point change (inclusive)
+        max_points (Optional[int]): Largest point change (inclusive)
+    """
+
+    statuses: Optional[Tuple[str, ...]] = None
+    pledge: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    ids: Optional[Tuple[int, ...]] = None
+    brother: Optional[str] = None
+    min_points: Optional[int] = None
+    max_points: Optional[int] = None
+
+    @staticmethod
+    def _time_key(value: datetime) -> str:
+        """
+        Convert a bound to the stored Time format for text comparison.
+
+        Times are stored by the sqlite3 adapter as UTC ISO strings with a
+        space separator, so bounds must be UTC and use the same separator
+        for lexicographic comparison to match chronological order.
+        """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat(" ")
+
+    def to_sql(self) -> Tuple[str, List]:
+        """
+        Build a WHERE clause and its parameters for the Points table.
+
+        Returns:
+            Tuple[str, List]: (clause, params); the clause is "1 = 1" when
+            no criteria are set so it can always follow WHERE
+        """
+        clauses = []
+        params: List = []
+
+        if self.statuses:
+            placeholders = ",".join("?" for _ in self.statuses)
+            clauses.append(f"approval_status IN ({placeholders})")
+            params.extend(self.statuses)
+        if self.pledge is not None:
+            clauses.append("Pledge = ?")
+            params.append(self.pledge)
+        if self.since is not None:
+            clauses.append("Time >= ?")
+            params.append(self._time_key(self.since))
+        if self.until is not None:
+            clauses.append("Time < ?")
+            params.append(self._time_key(self.until))
+        if self.ids is not None:
+            placeholders = ",".join("?" for _ in self.ids)
+            clauses.append(f"id IN ({placeholders})")
+            params.extend(self.ids)
+        if self.brother is not None:
+            clauses.append("Brother = ? COLLATE NOCASE")
+            params.append(self.brother)
+        if self.min_points is not None:
+            clauses.append("PointChange >= ?")
+            params.append(self.min_points)
+        if self.max_points is not None:
+            clauses.append("PointChange <= ?")
+            params.append(self.max_points)
+
+        return " AND ".join(clauses) or "1 = 1", params
+
+
+@dataclass(frozen=True)
+class ApprovalRule:
+    """
+    A rule deciding whether a newly ingested entry is approved automatically.
+
+    Every criterion is optional; an entry matches the rule when it meets all
+    of the criteria that are set.
+
+    Attributes:
+        name (str): Rule name, recorded as approved_by "auto:<name>"
+        action (str): 'approve' to approve matching entries, or 'hold' to
+            keep them pending for a person regardless of later rules
+        max_abs_points (Optional[int]): Largest absolute point change
+        min_points (Optional[int]): Smallest point change (inclusive)
+        max_points (Optional[int]): Largest point change (inclusive)
+        author_ids (Optional[frozenset]): Discord user IDs of the submitting
+            brothers; display names can be changed by anyone, so they are
+            never used to trust a submission
+        pledges (Optional[frozenset]): Pledges receiving the points
+    """
+
+    name: str
+    action: str = "approve"
+    max_abs_points: Optional[int] = None
+    min_points: Optional[int] = None
+    max_points: Optional[int] = None
+    author_ids: Optional[frozenset] = None
+    pledges: Optional[frozenset] = None
@@ -0,0 +1,105 @@
+"""
+In-memory index of pending point entries for autocomplete.
+
+Discord sends an autocomplete request on every keystroke and expects an
+answer within three seconds. The index keeps the pending entries in memory,
+sorted for prefix search, and only reloads them from the database when
+SQLite's change counter shows the file has been written to since.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from PledgePoints.models import PointEntry
+from PledgePoints.sqlutils import DatabaseManager
+
+
+class PendingIndex:
+    """
+    Pending entries indexed by ID prefix and by pledge.
+
+    Attributes:
+        db_manager (DatabaseManager): Database the pending entries are read from
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Create an empty index. It loads on first use.
+
+        Args:
+            db_manager: Database the pending entries are read from
+        """
+        self.db_manager = db_manager
+        self._version: Optional[int] = None
+        self._entries: Dict[int, PointEntry] = {}
+        # (str(id), id) pairs sorted as strings for prefix search
+        self._id_keys: List[Tuple[str, int]] = []
+        self._pledge_counts: Counter = Counter()
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        """Reload the pending entries if the database changed since last load."""
+        async with self._lock:
+            version = self.db_manager.get_data_version()
+            if version == self._version:
+                return
+            entries = await asyncio.to_thread(self.db_manager.get_pending_points)
+            self._load(entries)
+            self._version = version
+
+    def _load(self, entries: List[PointEntry]) -> None:
+        """Rebuild the index from a list of pending entries."""
+        self._entries = {entry.entry_id: entry for entry in entries}
+        self._id_keys = sorted((str(entry_id), entry_id) for entry_id in self._entries)
+        self._pledge_counts = Counter(entry.pledge for entry in entries)
+
+    def __len__(self) -> int:
+        """Get the number of pending entries."""
+        return len(self._entries)
+
+    def complete_ids(
+        self, prefix: str, exclude: frozenset = frozenset(), limit: int = 25
+    ) -> List[PointEntry]:
+        """
+        Find pending entries whose ID starts with the typed digits.
+
+        Args:
+            prefix: Digits typed so far (empty matches every entry)
+            exclude: Entry IDs already chosen
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[PointEntry]: Matching entries, IDs in string order
+        """
+        matches: List[PointEntry] = []
+        index = bisect_left(self._id_keys, (prefix,))
+        while index < len(self._id_keys) and len(matches) < limit:
+            key, entry_id = self._id_keys[index]
+            if not key.startswith(prefix):
+                break
+            if entry_id not in exclude:
+                matches.append(self._entries[entry_id])
+            index += 1
+        return matches
+
+    def complete_pledges(self, prefix: str, limit: int = 25) -> List[Tuple[str, int]]:
+        """
+        Find pledges with pending entries whose name starts with the typed text.
+
+        Args:
+            prefix: Partial name as typed, in any case
+            limit: Maximum number of pledges to return
+
+        Returns:
+            List[Tuple[str, int]]: (pledge, pending count) pairs, by name
+        """
+        prefix = prefix.casefold()
+        return sorted(
+            (pledge, count)
+            for pledge, count in self._pledge_counts.items()
+            if pledge.casefold().startswith(prefix)
+        )[:limit]
@@ -0,0 +1,135 @@
+"""
+Reconciliation of stored point entries with edited and deleted messages.
+
+When a point submission is edited or deleted in Discord, the entries created
+from it are found through their stored message ID and brought back in line:
+pending entries are voided (and replaced, for edits), while approved entries
+are kept but flagged for review so an officer can keep or void them with
+/resolve_flagged_points.
+
+Author: Warner (with AI assistance)
+"""
+
+from typing import List, Optional, Set, Tuple
+
+from PledgePoints.message_cache import CachedMessage
+from PledgePoints.models import PointEntry, ReconcileResult
+from PledgePoints.rules import get_approval_rules
+from PledgePoints.sqlutils import DatabaseManager
+from PledgePoints.validators import parse_point_submission
+
+# review_reason values recorded on affected entries
+REASON_DELETED = "source message deleted"
+REASON_EDITED = "source message edited"
+
+
+def _entry_key(entry: PointEntry) -> Tuple[int, str, str]:
+    """Get the parsed content of an entry for comparison with edited text."""
+    return entry.point_change, entry.pledge, entry.comment
+
+
+def reconcile_deleted_message(
+    db_manager: DatabaseManager, message_id: int
+) -> ReconcileResult:
+    """
+    Void or flag the entries created from a deleted message.
+
+    Args:
+        db_manager: Database containing the entries
+        message_id: ID of the deleted Discord message
+
+    Returns:
+        ReconcileResult: Entries that were voided or flagged
+    """
+    entries = db_manager.get_points_by_message_id(message_id)
+    void_ids = [e.entry_id for e in entries if e.approval_status == "pending"]
+    flag_ids = [e.entry_id for e in entries if e.approval_status == "approved"]
+    if not void_ids and not flag_ids:
+        return ReconcileResult()
+
+    voided, flagged = db_manager.reconcile_points(void_ids, flag_ids, REASON_DELETED)
+    return ReconcileResult(voided=voided, flagged=flagged)
+
+
+def reconcile_edited_message(
+    db_manager: DatabaseManager,
+    message_id: int,
+    content: str,
+    cached: Optional[CachedMessage] = None,
+) -> ReconcileResult:
+    """
+    Bring the entries created from an edited message in line with its new text.
+
+    Entries that still match the edited submission are kept. Pending entries
+    that no longer match are voided and approved ones are flagged for review.
+    Pledges newly named by the edit get new entries, pending unless an
+    auto-approval rule approves them, except while an approved entry of the
+    message is flagged: it still counts, so a replacement would count the
+    message twice, and a reviewer resolves the flag instead. A message
+    with no stored entries that an edit made valid is added if its author
+    and time are known from the message cache, and otherwise left to the
+    next history sync.
+
+    Args:
+        db_manager: Database containing the entries
+        message_id: ID of the edited Discord message
+        content: New message content
+        cached: The message as recorded in the message cache, if it was
+
+    Returns:
+        ReconcileResult: Entries that were voided, flagged or inserted
+    """
+    entries = db_manager.get_points_by_message_id(message_id)
+    if not entries and cached is None:
+        return ReconcileResult()
+
+    wanted: Set[Tuple[int, str, str]] = set()
+    result = parse_point_submission(content)
+    if result is not None:
+        point_change, pledges, comment = result
+        wanted = {(point_change, pledge, comment) for pledge in pledges}
+
+    live = [e for e in entries if e.approval_status != "voided"]
+    void_ids = [
+        e.entry_id
+        for e in live
+        if e.approval_status == "pending" and _entry_key(e) not in wanted
+    ]
+    flag_ids = [
+        e.entry_id
+        for e in live
+        if e.approval_status == "approved" and _entry_key(e) not in wanted
+    ]
+
+    existing = {_entry_key(e) for e in live}
+    if entries:
+        time, brother = entries[0].time, entries[0].brother
+        author_id = entries[0].author_id
+    else:
+        time, brother = cached.created_at, cached.author_name
+        author_id = cached.author_id
+    new_entries: List[PointEntry] = []
+    if not flag_ids:
+        # An approved entry the edit changed still counts until a reviewer
+        # resolves its flag, so no replacement is added alongside it
+        new_entries = [
+            PointEntry(
+                time=time,
+                point_change=point_change,
+                pledge=pledge,
+                brother=brother,
+                comment=comment,
+                message_id=message_id,
+                author_id=author_id,
+            )
+            for point_change, pledge, comment in sorted(wanted - existing)
+        ]
+
+    if not void_ids and not flag_ids and not new_entries:
+        return ReconcileResult()
+    new_entries = get_approval_rules().apply(new_entries)
+
+    voided, flagged = db_manager.reconcile_points(
+        void_ids, flag_ids, REASON_EDITED, new_entries
+    )
+    return ReconcileResult(voided=voided, flagged=flagged, inserted=new_entries)
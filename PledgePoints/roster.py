@@ -0,0 +1,178 @@
+"""
+Pledge roster lookups for the pledge points system.
+
+Builds a single hash index from every pledge name, alias and nickname to the
+pledge's canonical name, so resolving a name from a message, filtering
+rankings or completing a command argument never scans a list.
+
+Author: Warner (with AI assistance)
+"""
+
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+from PledgePoints.constants import (
+    FUZZY_MATCH_MIN_LENGTH,
+    PLEDGE_ALIASES,
+    VALID_PLEDGES,
+)
+from PledgePoints.fuzzy import DeletionIndex
+
+
+class PledgeRoster:
+    """
+    Immutable index of pledges and the names they can be referred to by.
+
+    Lookups are case-insensitive: every key is casefolded once when the
+    roster is built, and each query is casefolded once when resolved.
+
+    Attributes:
+        canonical_names (frozenset): Official pledge names
+        lookup (Mapping[str, str]): Casefolded name or alias to canonical name
+    """
+
+    def __init__(
+        self, pledges: Iterable[str], aliases: Optional[Mapping[str, str]] = None
+    ):
+        """
+        Build the roster index.
+
+        Args:
+            pledges: Official pledge names
+            aliases: Map of nicknames or alternate spellings to official names
+        """
+        self.canonical_names = frozenset(pledges)
+
+        lookup = {name.casefold(): name for name in self.canonical_names}
+        for alias, target in (aliases or {}).items():
+            if target in self.canonical_names:
+                lookup[alias.casefold()] = target
+            else:
+                # An alias to someone not on the roster hides that name too,
+                # matching how aliases are applied before validation
+                lookup.pop(alias.casefold(), None)
+        self.lookup = MappingProxyType(lookup)
+
+        # Sorted keys for prefix completion with binary search
+        self._sorted_keys = tuple(sorted(lookup))
+        # Fuzzy match indexes by edit distance, built on first use
+        self._fuzzy_indexes: Dict[int, DeletionIndex] = {}
+
+    @classmethod
+    def from_constants(cls) -> "PledgeRoster":
+        """
+        Build the roster for the current semester from constants.
+
+        Returns:
+            PledgeRoster: Roster of VALID_PLEDGES with PLEDGE_ALIASES
+        """
+        return cls(VALID_PLEDGES, PLEDGE_ALIASES)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Resolve a name, alias or nickname to a canonical pledge name.
+
+        Args:
+            name: Name as typed, in any case
+
+        Returns:
+            Optional[str]: Canonical pledge name, or None if not on the roster
+        """
+        return self.lookup.get(name.casefold())
+
+    def fuzzy_resolve(self, name: str, max_distance: int) -> Optional[str]:
+        """
+        Resolve a possibly misspelled name to a canonical pledge name.
+
+        Exact matches win. Otherwise the closest names and aliases within
+        max_distance edits are looked up in a deletion index; if they belong
+        to more than one pledge the match is ambiguous and nothing is returned.
+
+        Args:
+            name: Name as typed, in any case
+            max_distance: Largest edit distance to accept (0 disables)
+
+        Returns:
+            Optional[str]: Canonical pledge name, or None if no unique match
+        """
+        exact = self.resolve(name)
+        if exact is not None or max_distance <= 0:
+            return exact
+        if len(name) < FUZZY_MATCH_MIN_LENGTH:
+            return None
+
+        index = self._fuzzy_indexes.get(max_distance)
+        if index is None:
+            index = DeletionIndex(self._sorted_keys, max_distance)
+            self._fuzzy_indexes[max_distance] = index
+        matches = index.search(name.casefold())
+        if not matches:
+            return None
+
+        best_distance = matches[0][0]
+        candidates = {
+            self.lookup[key] for distance, key in matches if distance == best_distance
+        }
+        if len(candidates) != 1:
+            return None
+        return candidates.pop()
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        Find canonical pledge names matching a typed prefix.
+
+        Matches against names and aliases, so "oz" can complete to the pledge
+        "Ozempic" is an alias for.
+
+        Args:
+            prefix: Partial name as typed
+            limit: Maximum number of names to return (Discord allows 25)
+
+        Returns:
+            List[str]: Distinct canonical names in alphabetical key order
+        """
+        prefix = prefix.casefold()
+        matches: List[str] = []
+        index = bisect_left(self._sorted_keys, prefix)
+        while index < len(self._sorted_keys) and len(matches) < limit:
+            key = self._sorted_keys[index]
+            if not key.startswith(prefix):
+                break
+            name = self.lookup[key]
+            if name not in matches:
+                matches.append(name)
+            index += 1
+        return matches
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a name is an official pledge name (case-sensitive)."""
+        return name in self.canonical_names
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over official pledge names in alphabetical order."""
+        return iter(sorted(self.canonical_names))
+
+    def __len__(self) -> int:
+        """Get the number of pledges on the roster."""
+        return len(self.canonical_names)
+
+
+# Global roster instance, built on first use
+roster: Optional[PledgeRoster] = None
+
+
+def get_roster() -> PledgeRoster:
+    """
+    Get the global pledge roster.
+
+    Builds the roster from constants on first call and returns the cached
+    instance thereafter, so the parser, rankings and autocomplete share it.
+
+    Returns:
+        PledgeRoster: The global roster
+    """
+    global roster
+    if roster is None:
+        roster = PledgeRoster.from_constants()
+    return roster
@@ -0,0 +1,233 @@
+"""
+Auto-approval rules for newly ingested point entries.
+
+Routine submissions (small amounts from trusted brothers, say) are approved
+as they are ingested, so the manual approval queue only holds entries that
+need judgment. Brothers are trusted by Discord user ID, since anyone can set
+their display name to a trusted brother's. Rules are compiled once into lists of predicates, so checking
+an entry is a few comparisons per rule rather than re-reading configuration.
+
+Author: Warner (with AI assistance)
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from typing import Callable, Iterable, List, Mapping, Optional, Tuple
+
+from PledgePoints.constants import AUTO_APPROVAL_RULES
+from PledgePoints.models import ApprovalRule, PointEntry
+
+# Rule actions
+ACTION_APPROVE = "approve"
+ACTION_HOLD = "hold"
+
+# Prefix of approved_by for entries approved by a rule
+AUTO_APPROVER_PREFIX = "auto:"
+
+Predicate = Callable[[PointEntry], bool]
+
+_CRITERIA = (
+    "max_abs_points",
+    "min_points",
+    "max_points",
+    "author_ids",
+    "pledges",
+)
+
+
+def parse_rule(config: Mapping) -> ApprovalRule:
+    """
+    Build a rule from its configuration.
+
+    Args:
+        config: Rule settings, e.g. {"name": "trusted-small",
+            "max_abs_points": 5, "author_ids": [123456789012345678]}
+
+    Returns:
+        ApprovalRule: The rule
+
+    Raises:
+        ValueError: If the rule has no name, an unknown action or an
+            unknown criterion
+    """
+    name = config.get("name")
+    if not name:
+        raise ValueError(f"Auto-approval rule has no name: {dict(config)}")
+    action = config.get("action", ACTION_APPROVE)
+    if action not in (ACTION_APPROVE, ACTION_HOLD):
+        raise ValueError(f"Auto-approval rule '{name}' has unknown action '{action}'")
+    unknown = set(config) - {"name", "action", *_CRITERIA}
+    if unknown:
+        raise ValueError(
+            f"Auto-approval rule '{name}' has unknown criteria: "
+            + ", ".join(sorted(unknown))
+        )
+
+    author_ids = config.get("author_ids")
+    pledges = config.get("pledges")
+    return ApprovalRule(
+        name=name,
+        action=action,
+        max_abs_points=config.get("max_abs_points"),
+        min_points=config.get("min_points"),
+        max_points=config.get("max_points"),
+        author_ids=(
+            frozenset(int(author_id) for author_id in author_ids)
+            if author_ids is not None
+            else None
+        ),
+        pledges=frozenset(pledges) if pledges is not None else None,
+    )
+
+
+def compile_rule(rule: ApprovalRule) -> Predicate:
+    """
+    Compile a rule into a predicate that checks only the criteria it sets.
+
+    Args:
+        rule: Rule to compile
+
+    Returns:
+        Predicate: Function returning True if an entry matches the rule
+    """
+    checks: List[Predicate] = []
+    if rule.max_abs_points is not None:
+        limit = rule.max_abs_points
+        checks.append(lambda entry: abs(entry.point_change) <= limit)
+    if rule.min_points is not None:
+        low = rule.min_points
+        checks.append(lambda entry: entry.point_change >= low)
+    if rule.max_points is not None:
+        high = rule.max_points
+        checks.append(lambda entry: entry.point_change <= high)
+    if rule.author_ids is not None:
+        author_ids = rule.author_ids
+        # Entries without a known author (e.g. imported ones) never match
+        checks.append(lambda entry: entry.author_id in author_ids)
+    if rule.pledges is not None:
+        pledges = rule.pledges
+        checks.append(lambda entry: entry.pledge in pledges)
+
+    if len(checks) == 1:
+        return checks[0]
+    return lambda entry: all(check(entry) for check in checks)
+
+
+class ApprovalRules:
+    """
+    Ordered auto-approval rules, compiled for checking many entries.
+
+    The first rule an entry matches decides: an 'approve' rule approves it
+    and a 'hold' rule keeps it pending. Entries matching no rule stay pending.
+
+    Attributes:
+        rules (Tuple[ApprovalRule, ...]): Rules in the order they are checked
+    """
+
+    def __init__(self, rules: Iterable[ApprovalRule]):
+        """
+        Compile the rules.
+
+        Args:
+            rules: Rules in the order they are checked
+        """
+        self.rules = tuple(rules)
+        self._compiled: List[Tuple[ApprovalRule, Predicate]] = [
+            (rule, compile_rule(rule)) for rule in self.rules
+        ]
+
+    @classmethod
+    def from_config(cls, configs: Iterable[Mapping]) -> "ApprovalRules":
+        """
+        Build the rules from their configuration.
+
+        Args:
+            configs: Rule settings in the order they are checked
+
+        Returns:
+            ApprovalRules: The compiled rules
+
+        Raises:
+            ValueError: If a rule is invalid
+        """
+        return cls(parse_rule(config) for config in configs)
+
+    @classmethod
+    def from_constants(cls) -> "ApprovalRules":
+        """
+        Build the rules configured in constants.
+
+        Returns:
+            ApprovalRules: Compiled AUTO_APPROVAL_RULES
+        """
+        return cls.from_config(AUTO_APPROVAL_RULES)
+
+    def match(self, entry: PointEntry) -> Optional[ApprovalRule]:
+        """
+        Find the rule that decides an entry.
+
+        Args:
+            entry: Entry to check
+
+        Returns:
+            Optional[ApprovalRule]: First matching rule, or None if none match
+        """
+        for rule, predicate in self._compiled:
+            if predicate(entry):
+                return rule
+        return None
+
+    def apply(
+        self, entries: List[PointEntry], now: Optional[datetime] = None
+    ) -> List[PointEntry]:
+        """
+        Approve the pending entries that an 'approve' rule matches.
+
+        Args:
+            entries: Entries about to be inserted
+            now: Approval timestamp to record; the current time if None
+
+        Returns:
+            List[PointEntry]: The entries in the same order, approved ones
+            replaced by copies with their approval recorded
+        """
+        if not self._compiled:
+            return entries
+
+        now = now or datetime.now()
+        result = []
+        for entry in entries:
+            rule = self.match(entry) if entry.approval_status == "pending" else None
+            if rule is not None and rule.action == ACTION_APPROVE:
+                entry = replace(
+                    entry,
+                    approval_status="approved",
+                    approved_by=AUTO_APPROVER_PREFIX + rule.name,
+                    approval_timestamp=now,
+                )
+            result.append(entry)
+        return result
+
+    def __len__(self) -> int:
+        """Get the number of rules."""
+        return len(self.rules)
+
+
+# Global rules instance, built on first use
+approval_rules: Optional[ApprovalRules] = None
+
+
+def get_approval_rules() -> ApprovalRules:
+    """
+    Get the global auto-approval rules.
+
+    Builds the rules from constants on first call and returns the cached
+    instance thereafter.
+
+    Returns:
+        ApprovalRules: The global rules
+    """
+    global approval_rules
+    if approval_rules is None:
+        approval_rules = ApprovalRules.from_constants()
+    return approval_rules
@@ -8,12 +8,48 @@ resource cleanup, and transaction management.
 Author: Warner (with AI assistance)
 """
 
+import json
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import datetime
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from PledgePoints.models import PointEntry
+from PledgePoints.constants import (
+    EXPORT_BATCH_SIZE,
+    PENDING_PAGE_SIZE,
+    REVIEW_REQUEST_RETENTION_DAYS,
+)
+from PledgePoints.models import (
+    BackfillJob,
+    ParsedMessage,
+    PointEntry,
+    PointEvent,
+    PointFilter,
+    ReviewResult,
+)
+
+# Open write batch connections per thread, keyed by database file
+_thread_batches = threading.local()
+
+
+def _batch_connections(db_file: str) -> Optional[sqlite3.Connection]:
+    """Get the write batch connection open on this thread for a file, if any."""
+    return getattr(_thread_batches, "connections", {}).get(db_file)
+
+
+# Column list matching PointEntry.from_db_row
+POINT_COLUMNS = """id, Time, PointChange, Pledge, Brother, Comment,
+    approval_status, approved_by, approval_timestamp, message_id, review_reason,
+    version, author_id"""
+
+# Column list matching PointEvent.from_db_row
+EVENT_COLUMNS = "id, entry_id, old_status, new_status, actor, event_time, note"
+
+# Column list matching BackfillJob.from_db_row
+BACKFILL_COLUMNS = """id, channel_id, window_start, window_end, status,
+    requested_by, last_message_id, fetched, inserted, duplicates, invalid, error"""
 
 
 class DatabaseManager:
@@ -36,6 +72,8 @@ class DatabaseManager:
             db_file (str): Path to the SQLite database file
         """
         self.db_file = db_file
+        # Long-lived read-only connection for watching the change counter
+        self._version_conn: Optional[sqlite3.Connection] = None
         self._ensure_initialized()
 
     @contextmanager
@@ -54,6 +92,21 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM Points")
         """
+        batch_conn = _batch_connections(self.db_file)
+        if batch_conn is not None:
+            # Inside a write batch on this thread: this call becomes a
+            # savepoint of the batch transaction, so it still succeeds or
+            # fails as a whole without committing on its own
+            batch_conn.execute("SAVEPOINT call")
+            try:
+                yield batch_conn
+            except Exception:
+                batch_conn.execute("ROLLBACK TO call")
+                batch_conn.execute("RELEASE call")
+                raise
+            batch_conn.execute("RELEASE call")
+            return
+
         conn = sqlite3.connect(self.db_file)
         try:
             yield conn
@@ -64,6 +117,55 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    @contextmanager
+    def batch(self):
+        """
+        Run every database call on this thread in one transaction.
+
+        Within the block, get_connection() on any DatabaseManager for the
+        same file reuses the batch connection, and each call runs in its own
+        savepoint: a failing call is rolled back alone while the others are
+        committed together when the block exits. Used by DatabaseWriter to
+        pay for one commit per batch of writes instead of one per write.
+
+        Yields:
+            sqlite3.Connection: The batch connection
+        """
+        if _batch_connections(self.db_file) is not None:
+            raise RuntimeError("A write batch is already open on this thread")
+
+        # Autocommit mode so BEGIN, savepoints and COMMIT are issued explicitly
+        conn = sqlite3.connect(self.db_file, isolation_level=None)
+        _thread_batches.connections = {self.db_file: conn}
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            _thread_batches.connections = {}
+            conn.close()
+
+    def get_data_version(self) -> int:
+        """
+        Get SQLite's change counter for the database file.
+
+        PRAGMA data_version changes whenever another connection commits a
+        change. Writes never go through the connection used for this check
+        (they use their own connection or the database writer's batch
+        connection), so caches can compare this value to know when to
+        reload. The check reads no rows.
+
+        Returns:
+            int: Current data version; only comparisons are meaningful
+        """
+        if self._version_conn is None:
+            self._version_conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
     def _ensure_initialized(self):
         """
         Ensure the database is initialized with the required schema.
@@ -85,7 +187,11 @@ class DatabaseManager:
                     Comment TEXT,
                     approval_status TEXT DEFAULT 'pending',
                     approved_by TEXT,
-                    approval_timestamp TEXT
+                    approval_timestamp TEXT,
+                    message_id INTEGER,
+                    review_reason TEXT,
+                    version INTEGER NOT NULL DEFAULT 0,
+                    author_id INTEGER
                 )
             """)
 
@@ -96,6 +202,10 @@ class DatabaseManager:
                 "approval_status TEXT DEFAULT 'pending'",
                 "approved_by TEXT",
                 "approval_timestamp TEXT",
+                "message_id INTEGER",
+                "review_reason TEXT",
+                "version INTEGER NOT NULL DEFAULT 0",
+                "author_id INTEGER",
             ]:
                 try:
                     cursor.execute(f"ALTER TABLE Points ADD COLUMN {column_def}")
@@ -103,11 +213,129 @@ class DatabaseManager:
                     # Column already exists, continue
                     pass
 
+            # Indexes used by page-scoped duplicate detection during ingestion
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_points_message_id ON Points (message_id)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_points_time ON Points (Time)")
+            # Keyset pagination of entries by status
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_points_status_id "
+                "ON Points (approval_status, id)"
+            )
+            # Filtered reviews of pending entries by pledge and/or time range;
+            # the status prefix keeps them from scanning approved history
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_points_status_pledge_time "
+                "ON Points (approval_status, Pledge, Time)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_points_status_time "
+                "ON Points (approval_status, Time)"
+            )
+
+            # Backfill job state, checkpointed after every committed page
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS BackfillJobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    channel_id INTEGER NOT NULL,
+                    window_start TEXT NOT NULL,
+                    window_end TEXT NOT NULL,
+                    status TEXT DEFAULT 'running',
+                    requested_by TEXT,
+                    last_message_id INTEGER,
+                    fetched INTEGER DEFAULT 0,
+                    inserted INTEGER DEFAULT 0,
+                    duplicates INTEGER DEFAULT 0,
+                    invalid INTEGER DEFAULT 0,
+                    error TEXT,
+                    created_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+
+            # Parse outcome per message, so unchanged messages are not reprocessed
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ParsedMessages (
+                    message_id INTEGER PRIMARY KEY,
+                    content_hash INTEGER NOT NULL,
+                    parse_ok INTEGER NOT NULL,
+                    reacted INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            """)
+
+            # Append-only audit log of status changes. Rows are written by
+            # triggers, so every change is logged in the same transaction as
+            # the change itself whichever code path made it; times are epoch
+            # seconds to keep rows small
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS PointEvents (
+                    id INTEGER PRIMARY KEY,
+                    entry_id INTEGER NOT NULL,
+                    old_status TEXT,
+                    new_status TEXT NOT NULL,
+                    actor TEXT,
+                    event_time INTEGER NOT NULL,
+                    note TEXT
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_point_events_entry "
+                "ON PointEvents (entry_id, id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_point_events_actor "
+                "ON PointEvents (actor, id)"
+            )
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_points_status_insert
+                AFTER INSERT ON Points
+                WHEN NEW.approval_status IS NOT 'pending'
+                BEGIN
+                    INSERT INTO PointEvents
+                        (entry_id, old_status, new_status, actor, event_time, note)
+                    VALUES (NEW.id, NULL, NEW.approval_status, NEW.approved_by,
+                            CAST(strftime('%s', 'now') AS INTEGER), NEW.review_reason);
+                END
+            """)
+            # Recreated so databases created with an older definition pick
+            # up the current one; the actor is whoever set approved_by, and
+            # none for automatic changes such as flagging
+            cursor.execute("DROP TRIGGER IF EXISTS trg_points_status_update")
+            cursor.execute("""
+                CREATE TRIGGER trg_points_status_update
+                AFTER UPDATE OF approval_status, approved_by, review_reason ON Points
+                WHEN OLD.approval_status IS NOT NEW.approval_status
+                    OR OLD.review_reason IS NOT NEW.review_reason
+                BEGIN
+                    INSERT INTO PointEvents
+                        (entry_id, old_status, new_status, actor, event_time, note)
+                    VALUES (NEW.id, OLD.approval_status, NEW.approval_status,
+                            CASE WHEN OLD.approval_status IS NOT NEW.approval_status
+                                   OR OLD.approved_by IS NOT NEW.approved_by
+                                 THEN NEW.approved_by END,
+                            CAST(strftime('%s', 'now') AS INTEGER), NEW.review_reason);
+                END
+            """)
+
+            # Approval requests already processed, keyed by interaction ID,
+            # with the (id, version) of every entry each one reviewed
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ReviewRequests (
+                    idempotency_key TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    reviewer TEXT,
+                    entry_versions TEXT,
+                    created_at TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+
     def add_point_entries(self, entries: List[PointEntry]) -> int:
         """
         Add multiple point entries to the database.
 
-        All entries are added with 'pending' approval status by default.
+        Entries keep their approval status, so entries approved by an
+        auto-approval rule are stored approved; new entries are pending.
 
         Args:
             entries (List[PointEntry]): List of point entries to add
@@ -116,16 +344,36 @@ class DatabaseManager:
             int: Number of entries added
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            # Convert entries to tuples for bulk insert
-            values = [entry.to_tuple() for entry in entries]
-            cursor.executemany(
-                """INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment, approval_status)
-                   VALUES (?, ?, ?, ?, ?, 'pending')""",
-                values,
-            )
+            self._insert_point_entries(conn.cursor(), entries)
             return len(entries)
 
+    @staticmethod
+    def _insert_point_entries(
+        cursor: sqlite3.Cursor, entries: List[PointEntry]
+    ) -> None:
+        """Insert point entries with their approval status in one executemany."""
+        cursor.executemany(
+            """INSERT INTO Points (Time, PointChange, Pledge, Brother, Comment, message_id,
+                                  approval_status, approved_by, approval_timestamp,
+                                  author_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                entry.to_tuple()
+                + (
+                    entry.message_id,
+                    entry.approval_status,
+                    entry.approved_by,
+                    (
+                        entry.approval_timestamp.isoformat()
+                        if entry.approval_timestamp
+                        else None
+                    ),
+                    entry.author_id,
+                )
+                for entry in entries
+            ],
+        )
+
     def get_all_points(
         self, status_filter: Optional[List[str]] = None
     ) -> List[PointEntry]:
@@ -147,16 +395,14 @@ class DatabaseManager:
                 # Build parameterized query with placeholders
                 placeholders = ",".join("?" for _ in status_filter)
                 query = f"""
-                    SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                           approval_status, approved_by, approval_timestamp
+                    SELECT {POINT_COLUMNS}
                     FROM Points
                     WHERE approval_status IN ({placeholders})
                 """
                 cursor.execute(query, status_filter)
             else:
-                cursor.execute("""
-                    SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                           approval_status, approved_by, approval_timestamp
+                cursor.execute(f"""
+                    SELECT {POINT_COLUMNS}
                     FROM Points
                 """)
 
@@ -172,6 +418,348 @@ class DatabaseManager:
 
             return entries
 
+    def get_existing_message_ids(self, message_ids: Iterable[int]) -> Set[int]:
+        """
+        Find which of the given Discord message IDs already have point entries.
+
+        Args:
+            message_ids (Iterable[int]): Message IDs to look up
+
+        Returns:
+            Set[int]: The subset of message IDs present in the Points table
+        """
+        ids = list(message_ids)
+        if not ids:
+            return set()
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" for _ in ids)
+            cursor.execute(
+                f"SELECT DISTINCT message_id FROM Points WHERE message_id IN ({placeholders})",
+                ids,
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def get_points_by_message_id(self, message_id: int) -> List[PointEntry]:
+        """
+        Retrieve every point entry created from a Discord message.
+
+        Args:
+            message_id (int): Source message ID
+
+        Returns:
+            List[PointEntry]: Entries from the message, in insertion order
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT {POINT_COLUMNS} FROM Points WHERE message_id = ? ORDER BY id",
+                (message_id,),
+            )
+            return [PointEntry.from_db_row(row) for row in cursor.fetchall()]
+
+    def reconcile_points(
+        self,
+        void_ids: List[int],
+        flag_ids: List[int],
+        reason: str,
+        new_entries: Optional[List[PointEntry]] = None,
+    ) -> Tuple[List[PointEntry], List[PointEntry]]:
+        """
+        Void pending entries, flag approved ones and add replacements atomically.
+
+        Entries whose status changed since they were read are left alone:
+        only entries still pending are voided and only entries still approved
+        are flagged.
+
+        Args:
+            void_ids (List[int]): IDs of pending entries to void
+            flag_ids (List[int]): IDs of approved entries to flag for review
+            reason (str): Why the entries changed, stored as review_reason
+            new_entries (Optional[List[PointEntry]]): Entries to insert
+
+        Returns:
+            Tuple of (voided, flagged) entries as updated
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            current_time = datetime.now().isoformat()
+
+            voided = []
+            if void_ids:
+                placeholders = ",".join("?" for _ in void_ids)
+                cursor.execute(
+                    f"""
+                    UPDATE Points
+                    SET approval_status = 'voided',
+                        approval_timestamp = ?,
+                        review_reason = ?,
+                        version = version + 1
+                    WHERE id IN ({placeholders}) AND approval_status = 'pending'
+                    RETURNING {POINT_COLUMNS}
+                """,
+                    [current_time, reason] + void_ids,
+                )
+                voided = [PointEntry.from_db_row(row) for row in cursor.fetchall()]
+
+            flagged = []
+            if flag_ids:
+                placeholders = ",".join("?" for _ in flag_ids)
+                cursor.execute(
+                    f"""
+                    UPDATE Points
+                    SET review_reason = ?,
+                        version = version + 1
+                    WHERE id IN ({placeholders}) AND approval_status = 'approved'
+                    RETURNING {POINT_COLUMNS}
+                """,
+                    [reason] + flag_ids,
+                )
+                flagged = [PointEntry.from_db_row(row) for row in cursor.fetchall()]
+
+            if new_entries:
+                self._insert_point_entries(cursor, new_entries)
+
+            return voided, flagged
+
+    def get_parsed_messages(
+        self, message_ids: Iterable[int]
+    ) -> Dict[int, ParsedMessage]:
+        """
+        Look up cached parse outcomes for the given Discord message IDs.
+
+        Args:
+            message_ids (Iterable[int]): Message IDs to look up
+
+        Returns:
+            Dict[int, ParsedMessage]: Cached outcomes keyed by message ID;
+                                      messages never parsed are absent
+        """
+        ids = list(message_ids)
+        if not ids:
+            return {}
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" for _ in ids)
+            cursor.execute(
+                f"""SELECT message_id, content_hash, parse_ok, reacted
+                    FROM ParsedMessages WHERE message_id IN ({placeholders})""",
+                ids,
+            )
+            return {
+                row[0]: ParsedMessage.from_db_row(row) for row in cursor.fetchall()
+            }
+
+    def save_parsed_messages(self, messages: List[ParsedMessage]) -> None:
+        """
+        Record parse outcomes, replacing any earlier outcome for the same message.
+
+        Args:
+            messages (List[ParsedMessage]): Outcomes to store
+        """
+        if not messages:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """INSERT INTO ParsedMessages (message_id, content_hash, parse_ok, reacted)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(message_id) DO UPDATE SET
+                       content_hash = excluded.content_hash,
+                       parse_ok = excluded.parse_ok,
+                       reacted = excluded.reacted""",
+                [
+                    (m.message_id, m.content_hash, int(m.parse_ok), int(m.reacted))
+                    for m in messages
+                ],
+            )
+
+    def mark_messages_reacted(self, message_ids: Iterable[int]) -> None:
+        """
+        Record that validation reactions were applied to messages.
+
+        Args:
+            message_ids (Iterable[int]): Messages that received their reaction
+        """
+        ids = [(message_id,) for message_id in message_ids]
+        if not ids:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE ParsedMessages SET reacted = 1 WHERE message_id = ?", ids
+            )
+
+    def get_latest_message_id(self) -> Optional[int]:
+        """
+        Get the newest message ID ingested from the points channel.
+
+        Covers every processed message, valid or not, so an incremental sync
+        can resume right after it.
+
+        Returns:
+            Optional[int]: Highest stored message ID, or None if none are stored
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT MAX(latest) FROM (
+                    SELECT MAX(message_id) AS latest FROM ParsedMessages
+                    UNION ALL
+                    SELECT MAX(message_id) FROM Points
+                )
+            """)
+            return cursor.fetchone()[0]
+
+    def get_points_at_times(self, times: Iterable[datetime]) -> List[PointEntry]:
+        """
+        Retrieve point entries recorded at any of the given timestamps.
+
+        Used to deduplicate a page of new entries without loading the whole
+        table. Both ISO separators are matched because the sqlite3 datetime
+        adapter stores a space while other writers may store a 'T'.
+
+        Args:
+            times (Iterable[datetime]): Timestamps to look up
+
+        Returns:
+            List[PointEntry]: Entries (any approval status) at those times
+        """
+        keys = set()
+        for time in times:
+            keys.add(time.isoformat())
+            keys.add(time.isoformat(" "))
+        if not keys:
+            return []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" for _ in keys)
+            cursor.execute(
+                f"""
+                SELECT {POINT_COLUMNS}
+                FROM Points
+                WHERE Time IN ({placeholders})
+            """,
+                list(keys),
+            )
+
+            entries = []
+            for row in cursor.fetchall():
+                try:
+                    entries.append(PointEntry.from_db_row(row))
+                except (ValueError, TypeError):
+                    continue
+
+            return entries
+
+    def iter_points(
+        self,
+        point_filter: Optional[PointFilter] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[PointEntry]]:
+        """
+        Stream point entries matching a filter in batches.
+
+        Rows are read with cursor.fetchmany, so memory use depends on the
+        batch size rather than the size of the table. The connection stays
+        open until the iterator is exhausted or closed.
+
+        Args:
+            point_filter (Optional[PointFilter]): Criteria to match; all rows if None
+            batch_size (int): Number of rows fetched per batch
+
+        Yields:
+            List[PointEntry]: Up to batch_size entries, in ID order
+        """
+        where, params = (point_filter or PointFilter()).to_sql()
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {POINT_COLUMNS}
+                FROM Points
+                WHERE {where}
+                ORDER BY id
+            """,
+                params,
+            )
+
+            while rows := cursor.fetchmany(batch_size):
+                entries = []
+                for row in rows:
+                    try:
+                        entries.append(PointEntry.from_db_row(row))
+                    except (ValueError, TypeError):
+                        continue
+                yield entries
+
+    def get_points_page(
+        self,
+        point_filter: Optional[PointFilter] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = PENDING_PAGE_SIZE,
+    ) -> Tuple[List[PointEntry], bool]:
+        """
+        Get one page of point entries using keyset pagination.
+
+        Pages are anchored on entry IDs rather than offsets, so fetching any
+        page reads only that page's rows however deep into the table it is.
+
+        Args:
+            point_filter (Optional[PointFilter]): Criteria to match; all rows if None
+            after_id (Optional[int]): Return the page following this entry ID
+            before_id (Optional[int]): Return the page preceding this entry ID
+                (takes precedence over after_id)
+            limit (int): Maximum number of entries on the page
+
+        Returns:
+            Tuple[List[PointEntry], bool]: Entries in ID order, and whether
+            more entries exist beyond the page in the direction of travel
+        """
+        where, params = (point_filter or PointFilter()).to_sql()
+        order = "ASC"
+        if before_id is not None:
+            where += " AND id < ?"
+            params.append(before_id)
+            order = "DESC"
+        elif after_id is not None:
+            where += " AND id > ?"
+            params.append(after_id)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {POINT_COLUMNS}
+                FROM Points
+                WHERE {where}
+                ORDER BY id {order}
+                LIMIT ?
+            """,
+                params + [limit + 1],
+            )
+            rows = cursor.fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if before_id is not None:
+            rows.reverse()
+
+        entries = []
+        for row in rows:
+            try:
+                entries.append(PointEntry.from_db_row(row))
+            except (ValueError, TypeError):
+                continue
+        return entries, has_more
+
     def get_approved_points(self) -> List[PointEntry]:
         """
         Get only approved point entries.
@@ -190,6 +778,118 @@ class DatabaseManager:
         """
         return self.get_all_points(status_filter=["pending"])
 
+    def get_flagged_points(self) -> List[PointEntry]:
+        """
+        Get approved entries flagged for review because their message changed.
+
+        Returns:
+            List[PointEntry]: Flagged entries in ID order
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {POINT_COLUMNS}
+                FROM Points
+                WHERE approval_status = 'approved' AND review_reason IS NOT NULL
+                ORDER BY id
+            """
+            )
+            return self._entries_from_rows(cursor.fetchall())
+
+    def resolve_flagged_points(
+        self, point_ids: List[int], keep: bool, resolver: str
+    ) -> List[PointEntry]:
+        """
+        Resolve flagged entries by keeping or voiding them.
+
+        Keeping clears the flag so the entry counts as approved again without
+        question; voiding removes it from the totals. Either way the resolver
+        becomes approved_by, so the audit log records who decided.
+
+        Args:
+            point_ids (List[int]): IDs of flagged entries to resolve
+            keep (bool): True to keep the entries, False to void them
+            resolver (str): Name of the person resolving the flags
+
+        Returns:
+            List[PointEntry]: Entries resolved, in ID order; IDs that are not
+            flagged approved entries are left alone
+        """
+        if not point_ids:
+            return []
+        if keep:
+            change = "review_reason = NULL"
+        else:
+            change = "approval_status = 'voided'"
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" for _ in point_ids)
+            cursor.execute(
+                f"""
+                UPDATE Points
+                SET {change},
+                    approved_by = ?,
+                    approval_timestamp = ?,
+                    version = version + 1
+                WHERE id IN ({placeholders})
+                    AND approval_status = 'approved'
+                    AND review_reason IS NOT NULL
+                RETURNING {POINT_COLUMNS}
+            """,
+                [resolver, datetime.now().isoformat()] + list(point_ids),
+            )
+            return self._entries_from_rows(cursor.fetchall())
+
+    def get_point_events(
+        self,
+        entry_id: Optional[int] = None,
+        actor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[PointEvent]:
+        """
+        Read the audit log of status changes, oldest first.
+
+        Both filters are served by an index on the log, so audits never scan
+        the Points table.
+
+        Args:
+            entry_id (Optional[int]): Only changes to this entry
+            actor (Optional[str]): Only changes made by this person or rule
+            limit (Optional[int]): Return only the newest this many events
+
+        Returns:
+            List[PointEvent]: Matching events in the order they happened
+        """
+        clauses = []
+        params: List = []
+        if entry_id is not None:
+            clauses.append("entry_id = ?")
+            params.append(entry_id)
+        if actor is not None:
+            clauses.append("actor = ?")
+            params.append(actor)
+        where = " AND ".join(clauses) or "1 = 1"
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT ?"
+            params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT {EVENT_COLUMNS}
+                FROM PointEvents
+                WHERE {where}
+                ORDER BY id DESC
+                {limit_clause}
+            """,
+                params,
+            )
+            return [PointEvent.from_db_row(row) for row in reversed(cursor.fetchall())]
+
     def get_point_by_id(self, point_id: int) -> Optional[PointEntry]:
         """
         Retrieve a specific point entry by its ID.
@@ -203,9 +903,8 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
+                f"""
+                SELECT {POINT_COLUMNS}
                 FROM Points
                 WHERE id = ?
             """,
@@ -220,104 +919,212 @@ class DatabaseManager:
                     return None
             return None
 
-    def approve_points(self, point_ids: List[int], approver: str) -> List[PointEntry]:
+    def review(
+        self,
+        point_filter: PointFilter,
+        status: str,
+        reviewer: str,
+        idempotency_key: Optional[str] = None,
+    ) -> ReviewResult:
         """
-        Approve specific point entries by their IDs.
+        Approve or reject every pending entry matching a filter.
+
+        Runs as a single UPDATE ... RETURNING guarded by the pending status,
+        so concurrent reviews of overlapping entries never both apply: each
+        entry is reviewed by whichever request reaches it first, and the
+        other reports it as already reviewed. No lock is needed beyond
+        SQLite's own write lock.
+
+        With an idempotency key (the Discord interaction ID), the key is
+        claimed in the same transaction; a repeated request with the same
+        key changes nothing and returns the original result.
 
         Args:
-            point_ids (List[int]): List of point entry IDs to approve
-            approver (str): Name of the person approving the points
+            point_filter (PointFilter): Entries to review; its statuses are
+                ignored because only pending entries can be reviewed
+            status (str): 'approved' or 'rejected'
+            reviewer (str): Name of the person reviewing the points
+            idempotency_key (Optional[str]): Unique key of the request
 
         Returns:
-            List[PointEntry]: List of approved point entries
+            ReviewResult: Entries reviewed and, for requested IDs, those
+            already reviewed or not found
         """
-        if not point_ids:
-            return []
+        if point_filter.ids is not None and not point_filter.ids:
+            return ReviewResult()
+        where, params = replace(point_filter, statuses=("pending",)).to_sql()
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
             current_time = datetime.now().isoformat()
 
-            # Get the entries that will be approved
-            placeholders = ",".join("?" for _ in point_ids)
-            cursor.execute(
-                f"""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                point_ids,
-            )
-
-            rows = cursor.fetchall()
-            approved_entries = []
-            for row in rows:
-                try:
-                    approved_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
+            if idempotency_key is not None:
+                # Claiming the key first takes the write lock, so a racing
+                # retry waits here and then finds the key taken
+                cursor.execute(
+                    """INSERT OR IGNORE INTO ReviewRequests
+                       (idempotency_key, status, reviewer, created_at)
+                       VALUES (?, ?, ?, ?)""",
+                    (idempotency_key, status, reviewer, current_time),
+                )
+                if cursor.rowcount == 0:
+                    return self._replay_review(cursor, idempotency_key, point_filter)
 
-            # Update approval status
             cursor.execute(
                 f"""
                 UPDATE Points
-                SET approval_status = 'approved',
+                SET approval_status = ?,
                     approved_by = ?,
-                    approval_timestamp = ?
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
+                    approval_timestamp = ?,
+                    version = version + 1
+                WHERE {where}
+                RETURNING {POINT_COLUMNS}
             """,
-                [approver, current_time] + point_ids,
+                [status, reviewer, current_time] + params,
             )
+            result = ReviewResult(reviewed=self._entries_from_rows(cursor.fetchall()))
+
+            if idempotency_key is not None:
+                cursor.execute(
+                    "UPDATE ReviewRequests SET entry_versions = ? WHERE idempotency_key = ?",
+                    (
+                        json.dumps(
+                            [[entry.entry_id, entry.version] for entry in result.reviewed]
+                        ),
+                        idempotency_key,
+                    ),
+                )
+                cutoff = datetime.now() - timedelta(days=REVIEW_REQUEST_RETENTION_DAYS)
+                cursor.execute(
+                    "DELETE FROM ReviewRequests WHERE created_at < ?",
+                    (cutoff.isoformat(),),
+                )
 
-            return approved_entries
+            self._add_unreviewed_ids(cursor, point_filter, result)
+            return result
 
-    def approve_all_pending(self, approver: str) -> List[PointEntry]:
+    def _replay_review(
+        self, cursor: sqlite3.Cursor, idempotency_key: str, point_filter: PointFilter
+    ) -> ReviewResult:
         """
-        Approve all pending point entries.
+        Rebuild the result of an already processed review request.
+
+        Entries still at the version the request left them in are reported
+        as reviewed by it; entries changed since count as already reviewed.
+        """
+        cursor.execute(
+            "SELECT entry_versions FROM ReviewRequests WHERE idempotency_key = ?",
+            (idempotency_key,),
+        )
+        row = cursor.fetchone()
+        versions = dict(json.loads(row[0])) if row and row[0] else {}
+
+        result = ReviewResult(replayed=True)
+        for entry in self._get_entries_by_ids(cursor, list(versions)):
+            if versions[entry.entry_id] == entry.version:
+                result.reviewed.append(entry)
+            else:
+                result.already_reviewed.append(entry)
+        self._add_unreviewed_ids(cursor, point_filter, result)
+        return result
+
+    def _add_unreviewed_ids(
+        self, cursor: sqlite3.Cursor, point_filter: PointFilter, result: ReviewResult
+    ) -> None:
+        """Report requested IDs that were not reviewed, as not pending or missing."""
+        if not point_filter.ids:
+            return
+        accounted = {entry.entry_id for entry in result.reviewed}
+        accounted.update(entry.entry_id for entry in result.already_reviewed)
+        remaining = sorted(set(point_filter.ids) - accounted)
+
+        found = self._get_entries_by_ids(cursor, remaining)
+        result.already_reviewed.extend(found)
+        result.already_reviewed.sort(key=lambda entry: entry.entry_id)
+        found_ids = {entry.entry_id for entry in found}
+        result.missing = [entry_id for entry_id in remaining if entry_id not in found_ids]
+
+    def _get_entries_by_ids(
+        self, cursor: sqlite3.Cursor, entry_ids: List[int]
+    ) -> List[PointEntry]:
+        """Read entries by ID on an open cursor, in ID order."""
+        if not entry_ids:
+            return []
+        placeholders = ",".join("?" for _ in entry_ids)
+        cursor.execute(
+            f"SELECT {POINT_COLUMNS} FROM Points WHERE id IN ({placeholders}) ORDER BY id",
+            entry_ids,
+        )
+        return self._entries_from_rows(cursor.fetchall())
+
+    @staticmethod
+    def _entries_from_rows(rows: List[tuple]) -> List[PointEntry]:
+        """Convert rows to entries in ID order, skipping malformed rows."""
+        entries = []
+        for row in rows:
+            try:
+                entries.append(PointEntry.from_db_row(row))
+            except (ValueError, TypeError):
+                continue
+        entries.sort(key=lambda entry: entry.entry_id)
+        return entries
+
+    def approve_matching(
+        self, point_filter: PointFilter, approver: str
+    ) -> List[PointEntry]:
+        """
+        Approve every pending entry matching a filter in one statement.
 
         Args:
+            point_filter (PointFilter): Entries to approve (pledge, brother,
+                time range, point range, IDs)
             approver (str): Name of the person approving the points
 
         Returns:
-            List[PointEntry]: List of all approved point entries
+            List[PointEntry]: List of approved point entries
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
+        return self.review(point_filter, "approved", approver).reviewed
 
-            # Get all pending entries
-            cursor.execute("""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE approval_status = 'pending'
-            """)
+    def reject_matching(
+        self, point_filter: PointFilter, rejector: str
+    ) -> List[PointEntry]:
+        """
+        Reject every pending entry matching a filter in one statement.
 
-            rows = cursor.fetchall()
-            approved_entries = []
-            for row in rows:
-                try:
-                    approved_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
+        Args:
+            point_filter (PointFilter): Entries to reject (pledge, brother,
+                time range, point range, IDs)
+            rejector (str): Name of the person rejecting the points
+
+        Returns:
+            List[PointEntry]: List of rejected point entries
+        """
+        return self.review(point_filter, "rejected", rejector).reviewed
 
-            if not approved_entries:
-                return []
+    def approve_points(self, point_ids: List[int], approver: str) -> List[PointEntry]:
+        """
+        Approve specific point entries by their IDs.
 
-            # Update all pending to approved
-            cursor.execute(
-                """
-                UPDATE Points
-                SET approval_status = 'approved',
-                    approved_by = ?,
-                    approval_timestamp = ?
-                WHERE approval_status = 'pending'
-            """,
-                (approver, current_time),
-            )
+        Args:
+            point_ids (List[int]): List of point entry IDs to approve
+            approver (str): Name of the person approving the points
 
-            return approved_entries
+        Returns:
+            List[PointEntry]: List of approved point entries
+        """
+        return self.approve_matching(PointFilter(ids=tuple(point_ids)), approver)
+
+    def approve_all_pending(self, approver: str) -> List[PointEntry]:
+        """
+        Approve all pending point entries.
+
+        Args:
+            approver (str): Name of the person approving the points
+
+        Returns:
+            List[PointEntry]: List of all approved point entries
+        """
+        return self.approve_matching(PointFilter(), approver)
 
     def reject_points(self, point_ids: List[int], rejector: str) -> List[PointEntry]:
         """
@@ -330,97 +1137,154 @@ class DatabaseManager:
         Returns:
             List[PointEntry]: List of rejected point entries
         """
-        if not point_ids:
-            return []
+        return self.reject_matching(PointFilter(ids=tuple(point_ids)), rejector)
 
+    def reject_all_pending(self, rejector: str) -> List[PointEntry]:
+        """
+        Reject all pending point entries.
+
+        Args:
+            rejector (str): Name of the person rejecting the points
+
+        Returns:
+            List[PointEntry]: List of all rejected point entries
+        """
+        return self.reject_matching(PointFilter(), rejector)
+
+    def create_backfill_job(
+        self,
+        channel_id: int,
+        window_start: datetime,
+        window_end: datetime,
+        requested_by: Optional[str] = None,
+    ) -> BackfillJob:
+        """
+        Record a new backfill job in the 'running' state.
+
+        Args:
+            channel_id (int): Discord channel to backfill
+            window_start (datetime): Oldest message time to include
+            window_end (datetime): Newest message time to include
+            requested_by (Optional[str]): Name of the person starting the job
+
+        Returns:
+            BackfillJob: The newly created job
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             current_time = datetime.now().isoformat()
-
-            # Get the entries that will be rejected
-            placeholders = ",".join("?" for _ in point_ids)
             cursor.execute(
-                f"""
-                SELECT id, Time, PointChange, Pledge, Brother, Comment,
-                       approval_status, approved_by, approval_timestamp
-                FROM Points
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
+                """
+                INSERT INTO BackfillJobs
+                    (channel_id, window_start, window_end, status, requested_by,
+                     created_at, updated_at)
+                VALUES (?, ?, ?, 'running', ?, ?, ?)
             """,
-                point_ids,
+                (
+                    channel_id,
+                    window_start.isoformat(),
+                    window_end.isoformat(),
+                    requested_by,
+                    current_time,
+                    current_time,
+                ),
             )
+            job_id = cursor.lastrowid
 
-            rows = cursor.fetchall()
-            rejected_entries = []
-            for row in rows:
-                try:
-                    rejected_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
+        return BackfillJob(
+            job_id=job_id,
+            channel_id=channel_id,
+            window_start=window_start,
+            window_end=window_end,
+            requested_by=requested_by,
+        )
+
+    def get_backfill_job(self, job_id: int) -> Optional[BackfillJob]:
+        """
+        Retrieve a backfill job by its ID.
 
-            # Update approval status
+        Args:
+            job_id (int): The database ID of the job
+
+        Returns:
+            Optional[BackfillJob]: The job if found, None otherwise
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(
-                f"""
-                UPDATE Points
-                SET approval_status = 'rejected',
-                    approved_by = ?,
-                    approval_timestamp = ?
-                WHERE id IN ({placeholders}) AND approval_status = 'pending'
-            """,
-                [rejector, current_time] + point_ids,
+                f"SELECT {BACKFILL_COLUMNS} FROM BackfillJobs WHERE id = ?",
+                (job_id,),
             )
+            row = cursor.fetchone()
+            return BackfillJob.from_db_row(row) if row else None
 
-            return rejected_entries
-
-    def reject_all_pending(self, rejector: str) -> List[PointEntry]:
+    def get_backfill_jobs(self, status: str) -> List[BackfillJob]:
         """
-        Reject all pending point entries.
+        Retrieve all backfill jobs with the given status, oldest first.
 
         Args:
-            rejector (str): Name of the person rejecting the points
+            status (str): Job status to filter by, e.g. 'running'
 
         Returns:
-            List[PointEntry]: List of all rejected point entries
+            List[BackfillJob]: Matching jobs
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
+            cursor.execute(
+                f"SELECT {BACKFILL_COLUMNS} FROM BackfillJobs WHERE status = ? ORDER BY id",
+                (status,),
+            )
+            return [BackfillJob.from_db_row(row) for row in cursor.fetchall()]
 
-            # Get all pending entries
-            cursor.execute("""
-                           SELECT id,
-                                  Time,
-                                  PointChange,
-                                  Pledge,
-                                  Brother,
-                                  Comment,
-                                  approval_status,
-                                  approved_by,
-                                  approval_timestamp
-                           FROM Points
-                           WHERE approval_status = 'pending'
-                           """)
+    def save_backfill_checkpoint(self, job: BackfillJob) -> None:
+        """
+        Persist a job's checkpoint and counters.
 
-            rows = cursor.fetchall()
-            rejected_entries = []
-            for row in rows:
-                try:
-                    rejected_entries.append(PointEntry.from_db_row(row))
-                except (ValueError, TypeError):
-                    continue
+        Args:
+            job (BackfillJob): Job whose last_message_id and counts to store
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE BackfillJobs
+                SET last_message_id = ?,
+                    fetched = ?,
+                    inserted = ?,
+                    duplicates = ?,
+                    invalid = ?,
+                    updated_at = ?
+                WHERE id = ?
+            """,
+                (
+                    job.last_message_id,
+                    job.fetched,
+                    job.inserted,
+                    job.duplicates,
+                    job.invalid,
+                    datetime.now().isoformat(),
+                    job.job_id,
+                ),
+            )
 
-            if not rejected_entries:
-                return []
+    def set_backfill_status(
+        self, job_id: int, status: str, error: Optional[str] = None
+    ) -> None:
+        """
+        Update the status of a backfill job.
 
-            # Update all pending to rejected
+        Args:
+            job_id (int): The database ID of the job
+            status (str): New status ('running', 'completed', 'cancelled', 'failed')
+            error (Optional[str]): Error message for failed jobs
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
             cursor.execute(
                 """
-                           UPDATE Points
-                           SET approval_status    = 'rejected',
-                               approved_by        = ?,
-                               approval_timestamp = ?
-                           WHERE approval_status = 'pending'
-                           """,
-                (rejector, current_time),
+                UPDATE BackfillJobs
+                SET status = ?, error = ?, updated_at = ?
+                WHERE id = ?
+            """,
+                (status, error, datetime.now().isoformat(), job_id),
             )
-
-            return rejected_entries
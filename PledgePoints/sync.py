@@ -0,0 +1,178 @@
+"""
+Scheduled incremental sync of the points channel.
+
+A discord.ext.tasks loop ingests every message posted since the newest one
+already stored, every few minutes, so point submissions are picked up
+without anyone running /update_pledge_points. Each run only reads new
+history. A random delay spreads runs out, and failures (rate limits in
+particular) double the interval up to a ceiling until a run succeeds.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+import discord
+import pytz
+from discord.ext import tasks
+
+from PledgePoints.constants import SYNC_INITIAL_LOOKBACK_DAYS, SYNC_MAX_BACKOFF_SECONDS
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.messages import ingest_channel_history
+from PledgePoints.models import IngestStats
+from PledgePoints.sqlutils import DatabaseManager
+
+
+class IncrementalSync:
+    """
+    Periodically ingests new messages from the points channel.
+
+    Attributes:
+        interval (float): Seconds between runs when healthy
+        jitter (float): Maximum random delay added before each run
+        max_backoff (float): Longest interval used while backing off
+        last_run_at (Optional[datetime]): When the last run started, in UTC
+        last_duration (Optional[float]): Seconds the last run took
+        last_stats (Optional[IngestStats]): Totals of the last successful run
+        last_error (Optional[str]): Error of the last run, if it failed
+        failures (int): Consecutive failed runs
+    """
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        db_manager: DatabaseManager,
+        channel_id: int,
+        interval: float,
+        jitter: float = 0.0,
+        max_backoff: float = SYNC_MAX_BACKOFF_SECONDS,
+        message_cache: Optional[MessageContentCache] = None,
+    ):
+        """
+        Initialize the sync. Call start() to begin the schedule.
+
+        Args:
+            bot: Bot used to read channel history
+            db_manager: Database to ingest into
+            channel_id: Points channel to sync
+            interval: Seconds between runs when healthy
+            jitter: Maximum random delay added before each run
+            max_backoff: Longest interval used while backing off
+            message_cache: Cache fetched messages are recorded in
+        """
+        self.bot = bot
+        self.db_manager = db_manager
+        self.channel_id = channel_id
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.message_cache = message_cache
+
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_stats: Optional[IngestStats] = None
+        self.last_error: Optional[str] = None
+        self.failures = 0
+
+        self._loop = tasks.loop(seconds=interval)(self._tick)
+        self._loop.before_loop(self._wait_until_ready)
+
+    def start(self) -> None:
+        """Start the schedule if it is not already running."""
+        if not self._loop.is_running():
+            self._loop.start()
+
+    def stop(self) -> None:
+        """Stop the schedule after the current run."""
+        self._loop.stop()
+
+    def is_running(self) -> bool:
+        """Whether the schedule is running."""
+        return self._loop.is_running()
+
+    @property
+    def current_interval(self) -> float:
+        """Seconds until the next run is scheduled after the last one."""
+        if not self.failures:
+            return self.interval
+        return min(self.interval * 2**self.failures, self.max_backoff)
+
+    @property
+    def next_run_at(self) -> Optional[datetime]:
+        """When the next run is scheduled, if the schedule is running."""
+        return self._loop.next_iteration if self._loop.is_running() else None
+
+    async def run_once(self) -> IngestStats:
+        """
+        Ingest every message newer than the newest one stored.
+
+        Returns:
+            IngestStats: Totals for the run
+        """
+        latest_id = await asyncio.to_thread(self.db_manager.get_latest_message_id)
+        if latest_id is not None:
+            after = discord.Object(id=latest_id)
+        else:
+            after = datetime.now(pytz.UTC) - timedelta(days=SYNC_INITIAL_LOOKBACK_DAYS)
+
+        return await ingest_channel_history(
+            self.bot,
+            self.channel_id,
+            after,
+            self.db_manager,
+            message_cache=self.message_cache,
+        )
+
+    async def _wait_until_ready(self) -> None:
+        """Hold the first run until the bot is connected."""
+        await self.bot.wait_until_ready()
+
+    async def _tick(self) -> None:
+        """Run one sync and adjust the interval for the next one."""
+        if self.jitter:
+            await asyncio.sleep(random.uniform(0, self.jitter))
+
+        self.last_run_at = datetime.now(pytz.UTC)
+        start_time = time.monotonic()
+        try:
+            stats = await self.run_once()
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            retry_after = _retry_after(e)
+            delay = self.current_interval
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), self.max_backoff)
+            print(f"Automatic sync failed ({e}); next attempt in {delay:.0f} seconds")
+            self._loop.change_interval(seconds=delay)
+        else:
+            if self.failures:
+                self._loop.change_interval(seconds=self.interval)
+            self.failures = 0
+            self.last_error = None
+            self.last_stats = stats
+            if stats.inserted:
+                print(
+                    f"Automatic sync added {stats.inserted} new points "
+                    f"({stats.auto_approved} auto-approved) "
+                    f"from {stats.fetched} messages"
+                )
+        finally:
+            self.last_duration = time.monotonic() - start_time
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Get the wait Discord asked for if an error is a rate limit."""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        retry_after = getattr(error.response, "headers", {}).get("Retry-After")
+        try:
+            return float(retry_after) if retry_after is not None else 0.0
+        except ValueError:
+            return 0.0
+    return None
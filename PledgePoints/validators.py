@@ -8,15 +8,16 @@ Author: Warner (with AI assistance)
 """
 
 import re
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from PledgePoints.constants import (
     PLEDGE_ALIASES,
-    POINT_REGEX_PATTERN,
+    POINT_MESSAGE_PATTERN,
+    POINT_MULTI_MESSAGE_PATTERN,
     SQL_INT_MAX,
     SQL_INT_MIN,
-    VALID_PLEDGES,
 )
+from PledgePoints.roster import PledgeRoster, get_roster
 
 
 def validate_point_change(value: int) -> bool:
@@ -61,8 +62,8 @@ def validate_pledge_name(name: str) -> Optional[str]:
     """
     Validate and normalize a pledge name.
 
-    Checks if the name (after normalization) is in the list of valid pledges.
-    Returns the normalized name if valid, None otherwise.
+    Resolves the name case-insensitively against the pledge roster, applying
+    aliases. Returns the canonical name if valid, None otherwise.
 
     Args:
         name: Pledge name to validate
@@ -70,12 +71,163 @@ def validate_pledge_name(name: str) -> Optional[str]:
     Returns:
         Optional[str]: Normalized pledge name if valid, None if invalid
     """
-    normalized = normalize_pledge_name(name)
+    return get_roster().resolve(name)
 
-    if normalized in VALID_PLEDGES:
-        return normalized
 
-    return None
+class PointMessageParser:
+    """
+    Reusable parser for point submission messages.
+
+    Matches the whole message (points, optional "to", pledge name, comment)
+    with a single precompiled regex and resolves the pledge name through the
+    roster's hash index, instead of re-running several string passes and
+    list scans per message.
+
+    Attributes:
+        pattern (re.Pattern): Compiled point message pattern
+        multi_pattern (re.Pattern): Compiled pattern for several pledges
+        roster (PledgeRoster): Pledges names are resolved against
+        fuzzy_distance (int): Maximum edit distance for misspelled names
+    """
+
+    def __init__(
+        self, roster: Optional[PledgeRoster] = None, fuzzy_distance: int = 0
+    ):
+        """
+        Initialize the parser.
+
+        Args:
+            roster: Pledges to accept; defaults to the global roster
+            fuzzy_distance: Maximum edit distance for correcting misspelled
+                            pledge names (0 accepts exact names only)
+        """
+        self.pattern = re.compile(POINT_MESSAGE_PATTERN, re.DOTALL)
+        self.multi_pattern = re.compile(POINT_MULTI_MESSAGE_PATTERN, re.DOTALL)
+        self.roster = roster if roster is not None else get_roster()
+        self.fuzzy_distance = fuzzy_distance
+
+    def parse_submission(
+        self, content: str
+    ) -> Optional[Tuple[int, Tuple[str, ...], str]]:
+        """
+        Parse a point submission that may name several pledges.
+
+        Accepts "+5 Evan Cleanup" as well as "+5 Evan, Milo, Tony for cleanup".
+        Every name must be valid; repeated names are counted once.
+
+        Args:
+            content: Message content to parse
+
+        Returns:
+            Optional[Tuple[int, Tuple[str, ...], str]]: (point_change, pledges,
+                comment) or None if invalid
+        """
+        match = self.pattern.match(content)
+        if match is None:
+            return None
+        raw_points, to_prefix, raw_pledge, comment = match.groups()
+
+        if "," in raw_pledge:
+            # The first token runs into a list of names
+            match = self.multi_pattern.match(content)
+            if match is None:
+                return None
+            raw_points, to_prefix, raw_names, comment = match.groups()
+            raw_pledges = [name.strip() for name in raw_names.split(",")]
+        elif to_prefix is None and raw_pledge.lower() == "to":
+            # "to" taken as the name means nothing followed the real name
+            return None
+        else:
+            raw_pledges = [raw_pledge]
+
+        pledges = []
+        for raw_name in raw_pledges:
+            pledge = self.roster.fuzzy_resolve(raw_name, self.fuzzy_distance)
+            if pledge is None:
+                return None
+            if pledge not in pledges:
+                pledges.append(pledge)
+
+        # Parse point value (accept floats and round to nearest int)
+        try:
+            point_change = round(float(raw_points))
+        except (ValueError, OverflowError):
+            return None
+
+        if not validate_point_change(point_change):
+            return None
+
+        return point_change, tuple(pledges), comment
+
+    def parse(self, content: str) -> Optional[Tuple[int, str, str]]:
+        """
+        Parse a point submission message naming a single pledge.
+
+        Args:
+            content: Message content to parse
+
+        Returns:
+            Optional[Tuple[int, str, str]]: (point_change, pledge_name, comment)
+                                             or None if invalid or if the
+                                             message names several pledges
+        """
+        result = self.parse_submission(content)
+        if result is None or len(result[1]) != 1:
+            return None
+        point_change, (pledge,), comment = result
+        return point_change, pledge, comment
+
+    def parse_many(
+        self, contents: Iterable[str]
+    ) -> List[Optional[Tuple[int, str, str]]]:
+        """
+        Parse a batch of messages.
+
+        Args:
+            contents: Message contents to parse
+
+        Returns:
+            List of parse results in input order, None for invalid messages
+        """
+        parse = self.parse
+        return [parse(content) for content in contents]
+
+
+# Parser for the configured pledge roster, shared by parse_point_message
+_default_parser = PointMessageParser()
+
+
+def configure_default_parser(fuzzy_distance: int) -> None:
+    """
+    Replace the parser used by parse_point_message.
+
+    Called once at startup with settings from the bot configuration.
+
+    Args:
+        fuzzy_distance: Maximum edit distance for misspelled pledge names
+    """
+    global _default_parser
+    _default_parser = PointMessageParser(fuzzy_distance=fuzzy_distance)
+
+
+def parse_point_submission(
+    content: str,
+) -> Optional[Tuple[int, Tuple[str, ...], str]]:
+    """
+    Parse a point submission that may award points to several pledges.
+
+    Args:
+        content: Message content to parse
+
+    Returns:
+        Optional[Tuple[int, Tuple[str, ...], str]]: (point_change, pledges,
+            comment) or None if invalid
+
+    Examples:
+        >>> parse_point_submission("+5 Evan, Milo, Tony for cleanup")
+        (5, ("Evan", "Milo", "Tony"), "for cleanup")
+    """
+    return _default_parser.parse_submission(content)
 
 
 def parse_point_message(content: str) -> Optional[Tuple[int, str, str]]:
@@ -102,48 +254,4 @@ def parse_point_message(content: str) -> Optional[Tuple[int, str, str]]:
         >>> parse_point_message("invalid message")
         None
     """
-    # Check for empty content
-    if not content.strip():
-        return None
-
-    # Extract point change using regex
-    point_match = re.match(POINT_REGEX_PATTERN, content)
-    if not point_match:
-        return None
-
-    # Parse point value (accept floats and round to nearest int)
-    try:
-        point_change = round(float(point_match.group(1)))
-    except ValueError:
-        return None
-
-    # Validate point value
-    if not validate_point_change(point_change):
-        return None
-
-    # Extract remaining content after the point value
-    remaining_content = content[len(point_match.group(1)) :].strip()
-
-    # Split into pledge name and comment
-    parts = remaining_content.split(" ", 1)
-    if len(parts) < 2:
-        return None
-
-    raw_pledge = parts[0]
-    raw_comment = parts[1].strip()
-
-    # Handle "to" prefix (e.g., "+10 to Eli for great work")
-    if raw_pledge.lower() == "to":
-        # Extract actual pledge name from comment
-        comment_parts = raw_comment.split(" ", 1)
-        if len(comment_parts) < 2:
-            return None
-        raw_pledge = comment_parts[0]
-        raw_comment = comment_parts[1].strip()
-
-    # Validate and normalize pledge name
-    pledge = validate_pledge_name(raw_pledge)
-    if pledge is None:
-        return None
-
-    return point_change, pledge, raw_comment
+    return _default_parser.parse(content)
@@ -0,0 +1,142 @@
+"""
+Benchmark for point message parsing.
+
+Compares PointMessageParser.parse_many against the original per-message
+parse_point_message implementation on synthetic submissions, and checks
+that both produce identical results.
+
+Usage:
+    python -m benchmarks.parse_points [--count 100000]
+
+Author: Warner (with AI assistance)
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List, Optional, Tuple
+
+from PledgePoints.constants import PLEDGE_ALIASES, VALID_PLEDGES
+from PledgePoints.validators import PointMessageParser, validate_point_change
+
+# The pattern and parser as they were before PointMessageParser
+LEGACY_POINT_REGEX_PATTERN = r"^([+-]\d+(?:\.\d+)?)"
+
+
+def legacy_parse_point_message(content: str) -> Optional[Tuple[int, str, str]]:
+    """Original parse_point_message, kept as the benchmark baseline.
+
+    OverflowError is also caught so huge values do not abort the run.
+    """
+    if not content.strip():
+        return None
+
+    point_match = re.match(LEGACY_POINT_REGEX_PATTERN, content)
+    if not point_match:
+        return None
+
+    try:
+        point_change = round(float(point_match.group(1)))
+    except (ValueError, OverflowError):
+        return None
+
+    if not validate_point_change(point_change):
+        return None
+
+    remaining_content = content[len(point_match.group(1)) :].strip()
+
+    parts = remaining_content.split(" ", 1)
+    if len(parts) < 2:
+        return None
+
+    raw_pledge = parts[0]
+    raw_comment = parts[1].strip()
+
+    if raw_pledge.lower() == "to":
+        comment_parts = raw_comment.split(" ", 1)
+        if len(comment_parts) < 2:
+            return None
+        raw_pledge = comment_parts[0]
+        raw_comment = comment_parts[1].strip()
+
+    normalized = raw_pledge.title()
+    if normalized in PLEDGE_ALIASES:
+        normalized = PLEDGE_ALIASES[normalized]
+    if normalized not in VALID_PLEDGES:
+        return None
+
+    return point_change, normalized, raw_comment
+
+
+def make_messages(count: int, seed: int = 0) -> List[str]:
+    """
+    Generate a realistic mix of valid and invalid submissions.
+
+    Args:
+        count: Number of messages to generate
+        seed: Random seed so runs are comparable
+
+    Returns:
+        List[str]: Message contents
+    """
+    rng = random.Random(seed)
+    names = list(VALID_PLEDGES) + list(PLEDGE_ALIASES) + ["Nobody", "to"]
+    comments = [
+        "great job at recruitment",
+        "late to chapter",
+        "helped set up for the philanthropy event",
+        "missed study hours\nsecond line",
+        "",
+    ]
+    messages = []
+    for _ in range(count):
+        kind = rng.random()
+        points = rng.choice(["+", "-"]) + str(rng.randint(0, 50))
+        if rng.random() < 0.1:
+            points += ".5"
+        name = rng.choice(names)
+        if rng.random() < 0.3:
+            name = name.lower()
+        comment = rng.choice(comments)
+        if kind < 0.7:
+            messages.append(f"{points} {name} {comment}")
+        elif kind < 0.85:
+            messages.append(f"{points} to {name}  {comment} ")
+        else:
+            messages.append(rng.choice(["hello everyone", "", f"{name} {points}"]))
+    return messages
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--count", type=int, default=100_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    messages = make_messages(args.count)
+    parser = PointMessageParser()
+
+    legacy_results = [legacy_parse_point_message(m) for m in messages]
+    new_results = parser.parse_many(messages)
+    mismatches = sum(a != b for a, b in zip(legacy_results, new_results))
+    print(f"{args.count} messages, {mismatches} mismatches")
+
+    def best_of(func) -> float:
+        timings = []
+        for _ in range(args.repeat):
+            start_time = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start_time)
+        return min(timings)
+
+    legacy_time = best_of(lambda: [legacy_parse_point_message(m) for m in messages])
+    new_time = best_of(lambda: parser.parse_many(messages))
+    print(f"legacy parse_point_message: {legacy_time:.3f}s")
+    print(f"PointMessageParser.parse_many: {new_time:.3f}s")
+    print(f"speedup: {legacy_time / new_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,157 @@
+import asyncio
+import contextlib
+import io
 import os
 import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 
 import discord
+from discord import app_commands
 from discord.ext import commands
 
-from PledgePoints.constants import VALID_PLEDGES
-from PledgePoints.messages import (
-    fetch_messages_from_days_ago,
-    process_messages,
-    eliminate_duplicates,
-)
+from PledgePoints.backfill import BackfillManager
+from PledgePoints.db_writer import get_db_writer
+from PledgePoints.exporter import EXPORT_FORMATS, export_points
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.models import Job, PointFilter, ReviewResult
+from PledgePoints.pending_index import PendingIndex
 from PledgePoints.pledges import get_pledge_points, rank_pledges, plot_rankings
+from PledgePoints.roster import get_roster
 from PledgePoints.sqlutils import DatabaseManager
+from PledgePoints.sync import IncrementalSync
+from PledgePoints.validators import configure_default_parser
 from config.settings import get_config
 from utils.discord_helpers import (
-    send_chunked_message,
+    send_chunks,
+    format_point_entry_choice,
     format_point_entry_detailed,
-    format_rankings_text,
-    format_pending_points_list,
-    format_approval_confirmation,
+    format_point_entry_summary,
+    iter_rankings_chunks,
+    iter_approval_confirmation_chunks,
+    iter_packed_chunks,
+    iter_flagged_points_chunks,
+    iter_point_history_chunks,
+    iter_review_note_chunks,
+    format_backfill_progress,
+    format_job_status,
+    format_sync_status,
+    send_followup_or_channel,
+    edit_original_response_quietly,
 )
+from utils.job_runner import JobRunner
+from utils.pending_view import PendingPointsView
+
+# Shared across setup() calls, see setup()
+_backfill_manager: Optional[BackfillManager] = None
+_job_runner: Optional[JobRunner] = None
+_incremental_sync: Optional[IncrementalSync] = None
+
+# Parameter help shared by /approve_points and /reject_points
+REVIEW_PARAMETER_DESCRIPTIONS = {
+    "point_ids": "Comma-separated IDs, or 'all' for every pending point",
+    "pledge": "Only points for this pledge",
+    "brother": "Only points submitted by this brother",
+    "since": "Only points from this date on, e.g. 2025-01-31 (UTC)",
+    "until": "Only points from before this date, e.g. 2025-02-07 (UTC)",
+    "min_points": "Only point changes of at least this much",
+    "max_points": "Only point changes of at most this much",
+}
+
+
+def parse_point_ids(point_ids: str, allow_all: bool = False) -> Tuple[int, ...]:
+    """
+    Parse a comma-separated list of point IDs.
+
+    Args:
+        point_ids: IDs as typed by the user, e.g. "1, 2,3"
+        allow_all: Whether the command also accepts 'all', for the error message
+
+    Returns:
+        Tuple[int, ...]: The IDs in the order given
+
+    Raises:
+        ValueError: If a token is not a number; the message is meant for the user
+    """
+    try:
+        return tuple(int(token.strip()) for token in point_ids.split(","))
+    except ValueError:
+        raise ValueError(
+            "Invalid point IDs. Please provide comma-separated numbers"
+            + (" or 'all'." if allow_all else ".")
+        ) from None
+
+
+def parse_review_filter(
+    point_ids: Optional[str],
+    pledge: Optional[str] = None,
+    brother: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_points: Optional[int] = None,
+    max_points: Optional[int] = None,
+) -> Tuple[PointFilter, bool]:
+    """
+    Turn the arguments of /approve_points or /reject_points into a filter.
+
+    Args:
+        point_ids: Comma-separated IDs, "all", or None to select by filters only
+        pledge: Pledge name, already resolved against the roster
+        brother: Submitting brother, matched ignoring case
+        since: ISO date or datetime; earliest entry time (inclusive, UTC if
+            no offset is given)
+        until: ISO date or datetime; latest entry time (exclusive)
+        min_points: Smallest point change (inclusive)
+        max_points: Largest point change (inclusive)
+
+    Returns:
+        Tuple[PointFilter, bool]: The filter, and whether it is a bulk
+        review ('all' or filters only) rather than one bounded by IDs
+
+    Raises:
+        ValueError: If the arguments are invalid or select nothing; the
+            message is meant for the user
+    """
+    point_ids = (point_ids or "").strip()
+    select_all = point_ids.lower() == "all"
+
+    ids = None
+    if point_ids and not select_all:
+        ids = parse_point_ids(point_ids, allow_all=True)
+
+    bounds = {}
+    for name, value in (("since", since), ("until", until)):
+        if value is None:
+            continue
+        try:
+            bounds[name] = datetime.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(
+                f"Invalid {name} date '{value}'. Use YYYY-MM-DD or an ISO timestamp."
+            ) from None
+
+    if min_points is not None and max_points is not None and min_points > max_points:
+        raise ValueError("min_points cannot be greater than max_points.")
+
+    point_filter = PointFilter(
+        ids=ids,
+        pledge=pledge or None,
+        brother=brother.strip() if brother else None,
+        since=bounds.get("since"),
+        until=bounds.get("until"),
+        min_points=min_points,
+        max_points=max_points,
+    )
+    has_criteria = point_filter != PointFilter(ids=ids)
+    if not (point_ids or has_criteria):
+        raise ValueError(
+            "Provide point IDs, 'all', or at least one filter "
+            "(pledge, brother, since, until, min_points, max_points)."
+        )
+    return point_filter, ids is None
 
 
-def setup(bot: commands.Bot):
+def setup(bot: commands.Bot, message_cache: Optional[MessageContentCache] = None):
     """
     Set up all pledge points-related slash commands for the bot.
 
@@ -32,6 +161,7 @@ def setup(bot: commands.Bot):
 
     Args:
         bot: Discord bot instance to register commands with
+        message_cache: Cache that ingested messages are recorded in
     """
     # Load configuration from centralized config
     config = get_config()
@@ -39,6 +169,70 @@ def setup(bot: commands.Bot):
     # Initialize the database manager
     db_manager = DatabaseManager(config.database_path)
 
+    # Pledge roster shared with the message parser
+    roster = get_roster()
+
+    # Writes from commands share the coalescing writer with ingestion
+    db_writer = get_db_writer(db_manager)
+
+    # Pending entries in memory, so autocomplete never waits on a full query
+    pending_index = PendingIndex(db_manager)
+    configure_default_parser(config.fuzzy_match_distance)
+
+    # Create the backfill manager once; on_ready (and so setup) can run again
+    # on every reconnect, and a second manager would resume jobs twice
+    global _backfill_manager
+    if _backfill_manager is None:
+        _backfill_manager = BackfillManager(
+            bot, db_manager, message_cache=message_cache
+        )
+        # Resume backfills interrupted by a crash or restart from their checkpoints
+        resumed = _backfill_manager.resume_incomplete()
+        if resumed:
+            print(
+                f"Resumed {len(resumed)} backfill job(s): "
+                + ", ".join(f"#{job.job_id}" for job in resumed)
+            )
+    backfill_manager = _backfill_manager
+
+    # Long-running commands run as background jobs on a shared worker pool
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner()
+    job_runner = _job_runner
+
+    # Ingest new submissions on a schedule instead of waiting for a command
+    global _incremental_sync
+    if _incremental_sync is None and config.sync_interval_minutes > 0:
+        _incremental_sync = IncrementalSync(
+            bot,
+            db_manager,
+            config.points_channel_id,
+            interval=config.sync_interval_minutes * 60,
+            jitter=config.sync_jitter_seconds,
+            message_cache=message_cache,
+        )
+        _incremental_sync.start()
+    incremental_sync = _incremental_sync
+
+    # pyplot keeps global state, so only one plot is drawn at a time
+    plot_lock = asyncio.Lock()
+
+    def report_failure(interaction: discord.Interaction):
+        """Build a job callback that tells the user if their job failed."""
+
+        async def on_finish(job: Job):
+            if job.status == "failed":
+                await send_followup_or_channel(
+                    interaction, f"Job #{job.job_id} failed: {job.error}"
+                )
+            elif job.status == "cancelled" and job.started_at is None:
+                await send_followup_or_channel(
+                    interaction, f"Job #{job.job_id} was cancelled before it started."
+                )
+
+        return on_finish
+
     @bot.tree.command(
         name="update_pledge_points", description="Update the point Database."
     )
@@ -48,7 +242,10 @@ def setup(bot: commands.Bot):
 
         This command scans the configured channel for messages from the specified
         number of days ago, validates them, and adds new point entries to the database.
-        Duplicates are automatically filtered out.
+        The update runs as a background job. Messages are streamed and
+        committed page by page as a backfill that reports progress, can be
+        cancelled with /jobs or /cancel_backfill, and resumes from its
+        checkpoint after a restart. Duplicates are automatically filtered out.
 
         Args:
             interaction: Discord interaction from the slash command
@@ -62,47 +259,215 @@ def setup(bot: commands.Bot):
                 ephemeral=True,
             )
             return
-        try:
+
+        async def run_update(job: Job) -> str:
+            start_time = time.time()
+
+            async def report_progress(backfill_job):
+                await edit_original_response_quietly(
+                    interaction, format_backfill_progress(backfill_job)
+                )
+
+            # Stream messages from Discord into the database as a resumable job
+            backfill_job, task = backfill_manager.start(
+                config.points_channel_id,
+                days_ago,
+                requested_by=interaction.user.display_name,
+                on_progress=report_progress,
+            )
+            await edit_original_response_quietly(
+                interaction,
+                f"Updating pledge points for {days_ago} days ago "
+                f"(job #{job.job_id}, backfill job #{backfill_job.job_id}, "
+                f"cancel with `/jobs cancel:{job.job_id}`)",
+            )
+            try:
+                backfill_job = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.done():
+                    # Cancelled from /jobs: stop the backfill as a user cancel
+                    backfill_manager.cancel(backfill_job.job_id)
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
+                if not task.cancelled():
+                    raise
+                await edit_original_response_quietly(
+                    interaction, format_backfill_progress(backfill_job)
+                )
+                await send_followup_or_channel(
+                    interaction,
+                    f"Backfill job #{backfill_job.job_id} was cancelled. "
+                    f"{backfill_job.inserted} new points were added before it stopped.",
+                )
+                raise
+            elapsed = time.time() - start_time
+
+            # Long backfills can outlive the 15 minute interaction token
+            await edit_original_response_quietly(
+                interaction, format_backfill_progress(backfill_job)
+            )
+
+            if not backfill_job.fetched:
+                await send_followup_or_channel(
+                    interaction, "No messages found for the specified time period."
+                )
+            elif not backfill_job.inserted:
+                await send_followup_or_channel(
+                    interaction, "No new points to add to the database."
+                )
+            else:
+                await send_followup_or_channel(
+                    interaction,
+                    f"Successfully added {backfill_job.inserted} new points to the database. \n"
+                    f"Scanned {backfill_job.fetched} messages ({backfill_job.invalid} invalid, "
+                    f"{backfill_job.duplicates} duplicates) in {elapsed:.2f} seconds.\n",
+                )
+            return (
+                f"{backfill_job.inserted} new points from "
+                f"{backfill_job.fetched} messages"
+            )
+
+        # Respond before queueing so the job's followups have a response to follow
+        await interaction.response.send_message(
+            f"Updating pledge points for {days_ago} days ago"
+        )
+        job = job_runner.submit(
+            f"Update points ({days_ago} days)",
+            run_update,
+            requested_by=interaction.user.display_name,
+            on_finish=report_failure(interaction),
+            owner_id=interaction.user.id,
+        )
+        await edit_original_response_quietly(
+            interaction,
+            f"Updating pledge points for {days_ago} days ago (queued as job #{job.job_id})",
+        )
+
+    @bot.tree.command(
+        name="cancel_backfill", description="Cancel a running points backfill job."
+    )
+    async def cancel_backfill(interaction: discord.Interaction, job_id: int):
+        """
+        Cancel a running backfill job started by /update_pledge_points.
+
+        Points committed before cancellation are kept.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            job_id: ID of the backfill job to cancel
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
             await interaction.response.send_message(
-                f"Updating pledge points for {days_ago} days ago"
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
+            )
+            return
+
+        if backfill_manager.cancel(job_id):
+            await interaction.response.send_message(
+                f"Cancelling backfill job #{job_id}..."
             )
-            start_time_1 = time.time()
-            # Fetch messages from Discord using config
-            messages = await fetch_messages_from_days_ago(
-                bot, config.points_channel_id, days_ago
+        else:
+            await interaction.response.send_message(
+                f"No running backfill job found with ID {job_id}.", ephemeral=True
             )
 
-            if not messages:
-                await interaction.followup.send(
-                    "No messages found for the specified time period."
+    @bot.tree.command(
+        name="jobs", description="List background jobs, or cancel one by ID."
+    )
+    @app_commands.describe(cancel="ID of a queued or running job to cancel")
+    async def jobs_command(
+        interaction: discord.Interaction, cancel: Optional[int] = None
+    ):
+        """
+        Show recent background jobs or cancel one.
+
+        Long-running commands such as /update_pledge_points, /plot_rankings
+        and approving or rejecting all points run as background jobs. Anyone
+        with the Brother role can list them; a job can only be cancelled by
+        the person who started it or by someone with the approver role, since
+        cancelling a bulk review is an approval decision.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            cancel: ID of a queued or running job to cancel, if any
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
+            )
+            return
+
+        if cancel is not None:
+            from role.role_checking import check_approver_role
+
+            job = job_runner.get(cancel)
+            if (
+                job is not None
+                and job.owner_id != interaction.user.id
+                and not await check_approver_role(interaction)
+            ):
+                await interaction.response.send_message(
+                    "You can only cancel your own jobs. Executive Board role "
+                    "required to cancel someone else's.",
+                    ephemeral=True,
                 )
                 return
-            end_time_1 = time.time()
-            # Process messages into PointEntry objects
-            start_time_2 = time.time()
-            new_entries = await process_messages(messages)
-            end_time_2 = time.time()
-
-            start_time_3 = time.time()
-            # Eliminate duplicates using the database manager
-            unique_entries = eliminate_duplicates(new_entries, db_manager)
-
-            if not unique_entries:
-                await interaction.followup.send("No new points to add to the database.")
-                return
-            end_time_3 = time.time()
-            # Add new entries to the database
+            if job_runner.cancel(cancel):
+                await interaction.response.send_message(f"Cancelling job #{cancel}...")
+            else:
+                await interaction.response.send_message(
+                    f"No queued or running job found with ID {cancel}.",
+                    ephemeral=True,
+                )
+            return
 
-            count = db_manager.add_point_entries(unique_entries)
-            await interaction.followup.send(
-                f"Successfully added {count} new points to the database. \n"
-                f"Fetching Messages took {(end_time_1 - start_time_1):.2f} seconds.\n"
-                f"Processing Messages took {(end_time_2 - start_time_2):.2f} seconds.\n"
-                f"Eliminating Duplicates took {(end_time_3 - start_time_3):.2f} seconds.\n"
+        jobs = job_runner.list_jobs()
+        if not jobs:
+            await interaction.response.send_message("No background jobs yet.")
+            return
+
+        await interaction.response.send_message("📋 **Background Jobs**")
+        await send_chunks(
+            interaction,
+            iter_packed_chunks(format_job_status(job) + "\n" for job in jobs),
+        )
+
+    @bot.tree.command(
+        name="sync_status",
+        description="Show when points were last synced automatically.",
+    )
+    async def sync_status(interaction: discord.Interaction):
+        """
+        Show the state of the automatic incremental sync.
+
+        Reports the last run's time, duration and result, any failure and
+        backoff, and when the next run is due.
+
+        Args:
+            interaction: Discord interaction from the slash command
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
             )
-        except Exception as e:
-            await interaction.followup.send(f"An error occurred: {str(e)}")
-            raise
+            return
+
+        if incremental_sync is None:
+            await interaction.response.send_message(
+                "Automatic sync is disabled (SYNC_INTERVAL_MINUTES is 0)."
+            )
+            return
+
+        await interaction.response.send_message(format_sync_status(incremental_sync))
 
     @bot.tree.command(
         name="pledge_rankings",
@@ -133,8 +498,8 @@ def setup(bot: commands.Bot):
             points = get_pledge_points(db_manager)
             rankings_df = rank_pledges(points)
 
-            # Filter to only include current pledges from VALID_PLEDGES
-            rankings_df = rankings_df[rankings_df.index.isin(VALID_PLEDGES)]
+            # Filter to only include current pledges on the roster
+            rankings_df = rankings_df[rankings_df.index.isin(roster.canonical_names)]
 
             rankings = [
                 (pledge, int(total_points))
@@ -145,11 +510,8 @@ def setup(bot: commands.Bot):
                 await interaction.followup.send("No pledge data found in the database.")
                 return
 
-            # Format the rankings using utility function
-            ranking_text = format_rankings_text(rankings)
-
-            # Send with automatic chunking if needed
-            await send_chunked_message(interaction, ranking_text)
+            # Format and send the rankings chunk by chunk
+            await send_chunks(interaction, iter_rankings_chunks(rankings))
         except Exception as e:
             await interaction.followup.send(
                 f"An error occurred while fetching rankings: {str(e)}"
@@ -178,49 +540,62 @@ def setup(bot: commands.Bot):
                 ephemeral=True,
             )
             return
-        try:
-            await interaction.response.send_message(
-                "Generating pledge rankings plot..."
-            )
 
-            # Get pledge points and rankings using database manager
-            points = get_pledge_points(db_manager)
+        async def run_plot(job: Job) -> str:
+            # Get pledge points and rankings off the event loop
+            points = await asyncio.to_thread(get_pledge_points, db_manager)
             rankings_df = rank_pledges(points)
 
-            # Filter to only include current pledges from VALID_PLEDGES
-            rankings_df = rankings_df[rankings_df.index.isin(VALID_PLEDGES)]
+            # Filter to only include current pledges on the roster
+            rankings_df = rankings_df[rankings_df.index.isin(roster.canonical_names)]
 
             if rankings_df.empty:
-                await interaction.followup.send("No pledge data found in the database.")
-                return
-
-            # Generate plot and send as file
-            plot_file = plot_rankings(rankings_df)
-            await interaction.followup.send(file=discord.File(plot_file))
-
-            # Clean up the generated plot file
-            if os.path.exists(plot_file):
-                os.remove(plot_file)
+                await send_followup_or_channel(
+                    interaction, "No pledge data found in the database."
+                )
+                return "No pledge data"
 
-        except Exception as e:
-            await interaction.followup.send(
-                f"An error occurred while generating the plot: {str(e)}"
-            )
-            raise
+            # Generate plot and send as file; pyplot is not thread-safe
+            async with plot_lock:
+                plot_file = await asyncio.to_thread(plot_rankings, rankings_df)
+                try:
+                    await interaction.followup.send(file=discord.File(plot_file))
+                finally:
+                    # Clean up the generated plot file
+                    if os.path.exists(plot_file):
+                        os.remove(plot_file)
+            return f"Plotted {len(rankings_df)} pledges"
+
+        await interaction.response.send_message("Generating pledge rankings plot...")
+        job = job_runner.submit(
+            "Plot rankings",
+            run_plot,
+            requested_by=interaction.user.display_name,
+            on_finish=report_failure(interaction),
+            owner_id=interaction.user.id,
+        )
+        await edit_original_response_quietly(
+            interaction, f"Generating pledge rankings plot (job #{job.job_id})..."
+        )
 
     @bot.tree.command(
         name="view_pending_points",
-        description="View all pending point submissions that need approval",
+        description="Page through pending point submissions that need approval",
     )
-    async def view_pending_points(interaction: discord.Interaction):
+    @app_commands.describe(pledge="Only show pending points for this pledge")
+    async def view_pending_points(
+        interaction: discord.Interaction, pledge: Optional[str] = None
+    ):
         """
-        Display all point submissions awaiting approval.
+        Display point submissions awaiting approval, one page at a time.
 
         Shows detailed information for each pending entry including timestamp,
-        brother who submitted, points, pledge, and comment.
+        brother who submitted, points, pledge, and comment, with buttons to
+        page through the list and a menu to filter it by pledge.
 
         Args:
             interaction: Discord interaction from the slash command
+            pledge: Optional pledge to filter the list to
         """
         from role.role_checking import check_brother_role
 
@@ -231,107 +606,174 @@ def setup(bot: commands.Bot):
             )
             return
         try:
-            await interaction.response.send_message("Fetching pending points...")
+            view = PendingPointsView(db_manager, roster, interaction.user.id)
+            if pledge:
+                view.pledge = roster.resolve(pledge) or pledge
+            view.load()
 
-            # Get pending points using database manager
-            pending_entries = db_manager.get_pending_points()
-
-            if not pending_entries:
-                await interaction.followup.send("No pending points found.")
+            if not view.entries:
+                await interaction.response.send_message("No pending points found.")
                 return
 
-            # Format the pending points using utility function
-            pending_text = format_pending_points_list(pending_entries)
-
-            # Send with automatic chunking if needed
-            await send_chunked_message(interaction, pending_text)
+            await interaction.response.send_message(
+                embed=view.build_embed(), view=view
+            )
+            view.message = await interaction.original_response()
 
         except Exception as e:
-            await interaction.followup.send(
-                f"An error occurred while fetching pending points: {str(e)}"
+            await send_followup_or_channel(
+                interaction,
+                f"An error occurred while fetching pending points: {str(e)}",
             )
             raise
 
+    async def review_points(
+        interaction: discord.Interaction,
+        approved: bool,
+        point_filter: PointFilter,
+        bulk: bool,
+    ):
+        """
+        Approve or reject the pending points matching a filter and confirm.
+
+        Bulk reviews ('all' or filters only) can touch thousands of rows, so
+        they run as a background job; a list of IDs is reviewed inline. The
+        interaction ID is the idempotency key, so a retried interaction
+        reports its earlier result instead of reviewing again.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            approved: True to approve, False to reject
+            point_filter: Pending entries to review
+            bulk: Whether the filter is unbounded by IDs
+        """
+        reviewer = interaction.user.display_name
+        status = "approved" if approved else "rejected"
+        action = "approve" if approved else "reject"
+        verb = "Approving" if approved else "Rejecting"
+        past = "Approved" if approved else "Rejected"
+        select_all = point_filter == PointFilter()
+
+        async def review() -> ReviewResult:
+            return await db_writer.submit(
+                db_manager.review,
+                point_filter,
+                status,
+                reviewer,
+                idempotency_key=str(interaction.id),
+            )
+
+        if not bulk:
+            await interaction.response.send_message(
+                "Processing approval..." if approved else "Processing rejection..."
+            )
+            result = await review()
+            if result.reviewed:
+                await send_chunks(
+                    interaction,
+                    iter_approval_confirmation_chunks(result.reviewed, approved=approved),
+                    use_embeds=True,
+                )
+            # Say which requested IDs were reviewed already or do not exist
+            await send_chunks(interaction, iter_review_note_chunks(result))
+            return
+
+        async def run_review(job: Job) -> str:
+            # One UPDATE for every matching row, off the event loop
+            result = await review()
+
+            if result.replayed:
+                await send_chunks(interaction, iter_review_note_chunks(result))
+            elif not result.reviewed:
+                await send_followup_or_channel(
+                    interaction, f"No pending points found to {action}."
+                )
+            if not result.reviewed:
+                return "No pending points"
+
+            # Format the confirmation chunk by chunk and send it as embeds,
+            # which fit three times the text of a plain message
+            await send_chunks(
+                interaction,
+                iter_approval_confirmation_chunks(
+                    result.reviewed, approved=approved, all_pending=select_all
+                ),
+                use_embeds=True,
+            )
+            return f"{past} {len(result.reviewed)} points"
+
+        target = "all pending points" if select_all else "matching pending points"
+        await interaction.response.send_message(f"{verb} {target}...")
+        job = job_runner.submit(
+            f"{action.capitalize()} {target}",
+            run_review,
+            requested_by=reviewer,
+            on_finish=report_failure(interaction),
+            owner_id=interaction.user.id,
+        )
+        await edit_original_response_quietly(
+            interaction, f"{verb} {target} (job #{job.job_id})..."
+        )
+
     @bot.tree.command(
         name="approve_points",
-        description="Approve specific point submissions by ID or all pending points",
+        description="Approve pending point submissions by ID, filter, or all at once",
     )
-    async def approve_points(interaction: discord.Interaction, point_ids: str):
+    @app_commands.describe(**REVIEW_PARAMETER_DESCRIPTIONS)
+    async def approve_points(
+        interaction: discord.Interaction,
+        point_ids: Optional[str] = None,
+        pledge: Optional[str] = None,
+        brother: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_points: Optional[int] = None,
+        max_points: Optional[int] = None,
+    ):
         """
         Approve pending point submissions.
 
-        Allows E-Board members to approve point submissions by ID or approve all
-        pending points at once using 'all'. Approved points count toward pledge rankings.
+        Allows E-Board members to approve point submissions by ID, approve all
+        pending points at once using 'all', or approve every pending point
+        matching filters (e.g. all of one pledge's points before a date).
+        Approved points count toward pledge rankings.
 
         Args:
             interaction: Discord interaction from the slash command
             point_ids: Comma-separated list of IDs (e.g., "1,2,3") or "all" for all pending
+            pledge: Only approve points for this pledge
+            brother: Only approve points submitted by this brother
+            since: Only approve points from this date or time on (ISO format)
+            until: Only approve points from before this date or time (ISO format)
+            min_points: Only approve point changes of at least this much
+            max_points: Only approve point changes of at most this much
         """
         try:
             # Check if user has Executive Board role
-            from role.role_checking import check_eboard_role, check_info_systems_role
+            from role.role_checking import check_approver_role
 
-            if not (
-                await check_eboard_role(interaction)
-                or await check_info_systems_role(interaction)
-            ):
+            if not await check_approver_role(interaction):
                 await interaction.response.send_message(
                     "You don't have permission to approve points. Executive Board role required.",
                     ephemeral=True,
                 )
                 return
 
-            await interaction.response.send_message("Processing approval...")
-
-            approve_all = point_ids.strip().lower() == "all"
-            approver = interaction.user.display_name
-
-            if approve_all:
-                # Approve all pending points using database manager
-                approved_entries = db_manager.approve_all_pending(approver)
-
-                if not approved_entries:
-                    await interaction.followup.send(
-                        "No pending points found to approve."
-                    )
-                    return
-
-                # Format response using utility function
-                approved_text = format_approval_confirmation(
-                    approved_entries, approved=True
-                )
-                approved_text = approved_text.replace(
-                    "Approved", f"Approved ALL ({len(approved_entries)})"
-                )
-
-                # Send with automatic chunking if needed
-                await send_chunked_message(interaction, approved_text)
-            else:
-                # Parse point IDs
-                try:
-                    ids = [int(id.strip()) for id in point_ids.split(",")]
-                except ValueError:
-                    await interaction.followup.send(
-                        "Invalid point IDs. Please provide comma-separated numbers or 'all'."
-                    )
-                    return
-
-                # Approve specific points using database manager
-                approved_entries = db_manager.approve_points(ids, approver)
-
-                if not approved_entries:
-                    await interaction.followup.send(
-                        "No pending points found with the provided IDs."
-                    )
-                    return
-
-                # Format response using utility function
-                approved_text = format_approval_confirmation(
-                    approved_entries, approved=True
+            try:
+                point_filter, bulk = parse_review_filter(
+                    point_ids,
+                    pledge=(roster.resolve(pledge) or pledge) if pledge else None,
+                    brother=brother,
+                    since=since,
+                    until=until,
+                    min_points=min_points,
+                    max_points=max_points,
                 )
+            except ValueError as e:
+                await interaction.response.send_message(str(e), ephemeral=True)
+                return
 
-                # Send with automatic chunking if needed
-                await send_chunked_message(interaction, approved_text)
+            await review_points(interaction, True, point_filter, bulk)
 
         except Exception as e:
             # If the error is due to message length, send a more helpful message
@@ -351,84 +793,63 @@ def setup(bot: commands.Bot):
 
     @bot.tree.command(
         name="reject_points",
-        description="Reject specific point submissions by ID or all pending points",
+        description="Reject pending point submissions by ID, filter, or all at once",
     )
-    async def reject_points(interaction: discord.Interaction, point_ids: str):
+    @app_commands.describe(**REVIEW_PARAMETER_DESCRIPTIONS)
+    async def reject_points(
+        interaction: discord.Interaction,
+        point_ids: Optional[str] = None,
+        pledge: Optional[str] = None,
+        brother: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_points: Optional[int] = None,
+        max_points: Optional[int] = None,
+    ):
         """
         Reject pending point submissions.
 
-        Allows E-Board members to reject point submissions by ID or reject all
-        pending points at once using 'all'. Rejected points will not count toward
-        pledge rankings.
+        Allows E-Board members to reject point submissions by ID, reject all
+        pending points at once using 'all', or reject every pending point
+        matching filters (e.g. everything one brother submitted before a
+        date). Rejected points will not count toward pledge rankings.
 
         Args:
             interaction: Discord interaction from the slash command
             point_ids: Comma-separated list of IDs to reject (e.g., "1,2,3") or "all" for all pending
+            pledge: Only reject points for this pledge
+            brother: Only reject points submitted by this brother
+            since: Only reject points from this date or time on (ISO format)
+            until: Only reject points from before this date or time (ISO format)
+            min_points: Only reject point changes of at least this much
+            max_points: Only reject point changes of at most this much
         """
         try:
             # Check if user has Executive Board role
-            from role.role_checking import check_eboard_role, check_info_systems_role
+            from role.role_checking import check_approver_role
 
-            if not (
-                await check_eboard_role(interaction)
-                or await check_info_systems_role(interaction)
-            ):
+            if not await check_approver_role(interaction):
                 await interaction.response.send_message(
                     "You don't have permission to reject points. Executive Board role required.",
                     ephemeral=True,
                 )
                 return
 
-            await interaction.response.send_message("Processing rejection...")
-
-            reject_all = point_ids.strip().lower() == "all"
-            rejector = interaction.user.display_name
-
-            if reject_all:
-                # Reject all pending points using database manager
-                rejected_entries = db_manager.reject_all_pending(rejector)
-
-                if not rejected_entries:
-                    await interaction.followup.send(
-                        "No pending points found to reject."
-                    )
-                    return
-
-                # Format response using utility function
-                rejected_text = format_approval_confirmation(
-                    rejected_entries, approved=False
-                )
-                rejected_text = rejected_text.replace(
-                    "Rejected", f"Rejected ALL ({len(rejected_entries)})"
-                )
-
-                # Send with automatic chunking if needed
-                await send_chunked_message(interaction, rejected_text)
-            else:
-                # Parse point IDs
-                try:
-                    ids = [int(id.strip()) for id in point_ids.split(",")]
-                except ValueError:
-                    await interaction.followup.send(
-                        "Invalid point IDs. Please provide comma-separated numbers or 'all'."
-                    )
-                    return
-
-                # Reject points using database manager
-                rejected_entries = db_manager.reject_points(ids, rejector)
-
-                if not rejected_entries:
-                    await interaction.followup.send(
-                        "No pending points found with the provided IDs."
-                    )
-                    return
-
-                # Format response using utility function
-                rejected_text = format_approval_confirmation(
-                    rejected_entries, approved=False
+            try:
+                point_filter, bulk = parse_review_filter(
+                    point_ids,
+                    pledge=(roster.resolve(pledge) or pledge) if pledge else None,
+                    brother=brother,
+                    since=since,
+                    until=until,
+                    min_points=min_points,
+                    max_points=max_points,
                 )
+            except ValueError as e:
+                await interaction.response.send_message(str(e), ephemeral=True)
+                return
 
-                await interaction.followup.send(rejected_text)
+            await review_points(interaction, False, point_filter, bulk)
 
         except Exception as e:
             await interaction.followup.send(
@@ -436,6 +857,69 @@ def setup(bot: commands.Bot):
             )
             raise
 
+    @approve_points.autocomplete("point_ids")
+    @reject_points.autocomplete("point_ids")
+    async def point_ids_autocomplete(
+        interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """
+        Suggest pending point IDs to add to a comma-separated list.
+
+        Completes the last ID being typed, keeping the IDs before it and
+        leaving out ones already listed. Served from the pending index.
+
+        Args:
+            interaction: Discord interaction for the command being typed
+            current: Text typed so far, e.g. "12, 3"
+
+        Returns:
+            Up to 25 choices, each the whole list with one more ID
+        """
+        await pending_index.refresh()
+
+        *chosen, last = [token.strip() for token in current.split(",")]
+        chosen_ids = frozenset(int(token) for token in chosen if token.isdigit())
+        head = ",".join(chosen) + "," if chosen else ""
+
+        choices = []
+        if not chosen and "all".startswith(last.lower()):
+            choices.append(
+                app_commands.Choice(
+                    name=f"all ({len(pending_index)} pending)", value="all"
+                )
+            )
+        for entry in pending_index.complete_ids(
+            last, exclude=chosen_ids, limit=25 - len(choices)
+        ):
+            value = f"{head}{entry.entry_id}"
+            # Discord rejects choice values over 100 characters
+            if len(value) <= 100:
+                name = format_point_entry_choice(entry)
+                choices.append(app_commands.Choice(name=name, value=value))
+        return choices
+
+    @view_pending_points.autocomplete("pledge")
+    @approve_points.autocomplete("pledge")
+    @reject_points.autocomplete("pledge")
+    async def pending_pledge_autocomplete(
+        interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """
+        Suggest pledges that have pending points, with how many.
+
+        Args:
+            interaction: Discord interaction for the command being typed
+            current: Text typed so far
+
+        Returns:
+            Up to 25 matching pledges with their pending counts
+        """
+        await pending_index.refresh()
+        return [
+            app_commands.Choice(name=f"{pledge} ({count} pending)", value=pledge)
+            for pledge, count in pending_index.complete_pledges(current)
+        ]
+
     @bot.tree.command(
         name="view_point_details",
         description="View detailed information about a specific point entry",
@@ -482,3 +966,255 @@ def setup(bot: commands.Bot):
                 f"An error occurred while fetching point details: {str(e)}"
             )
             raise
+
+    @bot.tree.command(
+        name="point_history",
+        description="View every status change of a point entry",
+    )
+    async def point_history(interaction: discord.Interaction, point_id: int):
+        """
+        Display a point entry with its approval history from the audit log.
+
+        Lists every status change (approvals, rejections, auto-approvals,
+        voids and review flags) with who made it and when.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            point_id: Database ID of the point entry
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
+            )
+            return
+        try:
+            await interaction.response.send_message("Fetching point history...")
+
+            entry = await asyncio.to_thread(db_manager.get_point_by_id, point_id)
+            if not entry:
+                await interaction.followup.send(
+                    f"No point entry found with ID {point_id}."
+                )
+                return
+
+            events = await asyncio.to_thread(
+                db_manager.get_point_events, entry_id=point_id
+            )
+            await send_chunks(interaction, iter_point_history_chunks(entry, events))
+
+        except Exception as e:
+            await interaction.followup.send(
+                f"An error occurred while fetching point history: {str(e)}"
+            )
+            raise
+
+    @bot.tree.command(
+        name="view_flagged_points",
+        description="List approved points whose message was edited or deleted",
+    )
+    async def view_flagged_points(interaction: discord.Interaction):
+        """
+        Display approved entries flagged for review by message reconciliation.
+
+        An approved entry whose message is later edited or deleted keeps
+        counting but is flagged, and stays listed here until a reviewer keeps
+        or voids it with /resolve_flagged_points.
+
+        Args:
+            interaction: Discord interaction from the slash command
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
+            )
+            return
+        try:
+            await interaction.response.send_message("Fetching flagged points...")
+
+            entries = await asyncio.to_thread(db_manager.get_flagged_points)
+            await send_chunks(
+                interaction, iter_flagged_points_chunks(entries), use_embeds=True
+            )
+
+        except Exception as e:
+            await send_followup_or_channel(
+                interaction,
+                f"An error occurred while fetching flagged points: {str(e)}",
+            )
+            raise
+
+    @bot.tree.command(
+        name="resolve_flagged_points",
+        description="Keep or void approved points flagged for review",
+    )
+    @app_commands.describe(
+        point_ids="Comma-separated IDs of flagged points",
+        action="Keep the points as approved, or void them",
+    )
+    @app_commands.choices(
+        action=[
+            app_commands.Choice(name="keep", value="keep"),
+            app_commands.Choice(name="void", value="void"),
+        ]
+    )
+    async def resolve_flagged_points(
+        interaction: discord.Interaction,
+        point_ids: str,
+        action: app_commands.Choice[str],
+    ):
+        """
+        Resolve flagged approved entries.
+
+        Keeping clears the flag and leaves the points counted; voiding
+        removes them from the totals. The resolver is recorded in the audit
+        log either way. IDs that are not flagged are reported and left alone.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            point_ids: Comma-separated list of IDs (e.g., "1,2,3")
+            action: 'keep' or 'void'
+        """
+        from role.role_checking import check_approver_role
+
+        if not await check_approver_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to resolve flagged points. Executive Board role required.",
+                ephemeral=True,
+            )
+            return
+        try:
+            ids = parse_point_ids(point_ids)
+        except ValueError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+
+        try:
+            keep = action.value == "keep"
+            await interaction.response.send_message("Resolving flagged points...")
+
+            resolved = await db_writer.submit(
+                db_manager.resolve_flagged_points,
+                list(ids),
+                keep,
+                interaction.user.display_name,
+            )
+
+            lines = []
+            if resolved:
+                past = "Kept" if keep else "Voided"
+                lines.append(f"{past} {len(resolved)} flagged point submission(s):")
+                lines += [format_point_entry_summary(entry) for entry in resolved]
+            skipped = sorted(set(ids) - {entry.entry_id for entry in resolved})
+            if skipped:
+                lines.append(
+                    "Not flagged: " + ", ".join(f"#{point_id}" for point_id in skipped)
+                )
+            await send_chunks(
+                interaction, iter_packed_chunks(line + "\n" for line in lines)
+            )
+
+        except Exception as e:
+            await send_followup_or_channel(
+                interaction,
+                f"An error occurred while resolving flagged points: {str(e)}",
+            )
+            raise
+
+    @bot.tree.command(
+        name="export_points",
+        description="Export point entries as a CSV, JSONL or Parquet file",
+    )
+    async def export_points_command(
+        interaction: discord.Interaction,
+        export_format: str = "csv",
+        status: Optional[str] = None,
+        pledge: Optional[str] = None,
+        days_ago: Optional[int] = None,
+    ):
+        """
+        Export point entries to a file attached to the response.
+
+        Rows are streamed from the database in batches into an in-memory
+        buffer, so the command does not hold the whole table as objects.
+
+        Args:
+            interaction: Discord interaction from the slash command
+            export_format: One of 'csv', 'jsonl' or 'parquet'
+            status: Only export entries with this approval status
+            pledge: Only export entries for this pledge
+            days_ago: Only export entries from the last N days
+        """
+        from role.role_checking import check_brother_role
+
+        if not await check_brother_role(interaction):
+            await interaction.response.send_message(
+                "You don't have permission to do that. Brother role required.",
+                ephemeral=True,
+            )
+            return
+
+        export_format = export_format.strip().lower()
+        if export_format not in EXPORT_FORMATS:
+            await interaction.response.send_message(
+                f"Unknown format. Use one of: {', '.join(EXPORT_FORMATS)}.",
+                ephemeral=True,
+            )
+            return
+
+        try:
+            await interaction.response.send_message("Exporting points...")
+
+            since = None
+            if days_ago is not None:
+                since = datetime.now(timezone.utc) - timedelta(days=days_ago)
+            point_filter = PointFilter(
+                statuses=(status.strip().lower(),) if status else None,
+                pledge=(roster.resolve(pledge) or pledge) if pledge else None,
+                since=since,
+            )
+
+            buffer = io.BytesIO()
+            count = await asyncio.to_thread(
+                export_points, db_manager, buffer, export_format, point_filter
+            )
+
+            if not count:
+                await interaction.followup.send("No point entries match that filter.")
+                return
+
+            buffer.seek(0)
+            await interaction.followup.send(
+                f"Exported {count} point entries.",
+                file=discord.File(buffer, filename=f"points.{export_format}"),
+            )
+
+        except Exception as e:
+            await interaction.followup.send(
+                f"An error occurred while exporting points: {str(e)}"
+            )
+            raise
+
+    @export_points_command.autocomplete("pledge")
+    async def pledge_autocomplete(
+        interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """
+        Suggest pledge names matching what has been typed so far.
+
+        Args:
+            interaction: Discord interaction for the command being typed
+            current: Text typed so far
+
+        Returns:
+            Up to 25 matching pledge names
+        """
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in roster.complete(current)
+        ]
@@ -13,6 +13,57 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+# Info Systems role ID, previously hardcoded in role/role_checking.py
+DEFAULT_INFO_SYSTEMS_ROLE_ID = 1032306248235888762
+
+
+def _get_non_negative_env(name: str, default: str, cast: type = int):
+    """
+    Read an optional non-negative number from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+        cast: int or float
+
+    Returns:
+        The parsed value
+
+    Raises:
+        ValueError: If the value is not a number of the right type or is negative
+    """
+    value_str = os.getenv(name, default)
+    try:
+        value = cast(value_str)
+    except ValueError:
+        kind = "integer" if cast is int else "number"
+        raise ValueError(f"{name} must be a valid {kind}, got {value_str}")
+    if value < 0:
+        raise ValueError(f"{name} must not be negative, got {value}")
+    return value
+
+
+def _get_role_id_env(name: str) -> Optional[int]:
+    """
+    Read an optional Discord role ID from the environment.
+
+    Args:
+        name: Environment variable name
+
+    Returns:
+        Optional[int]: The role ID, or None if the variable is unset or empty
+
+    Raises:
+        ValueError: If the value is not a valid integer
+    """
+    value_str = os.getenv(name)
+    if not value_str:
+        return None
+    try:
+        return int(value_str)
+    except ValueError:
+        raise ValueError(f"{name} must be a valid integer, got {value_str}")
+
 
 @dataclass(frozen=True)
 class BotConfig:
@@ -27,12 +78,31 @@ class BotConfig:
         database_path (str): Path to the SQLite database file
         points_channel_id (int): Discord channel ID for point submissions
         deleted_messages_channel_id (int): Discord channel ID for deleted message logs
+        fuzzy_match_distance (int): Maximum edit distance for correcting
+            misspelled pledge names (0 disables fuzzy matching)
+        message_cache_size (int): Number of recent points-channel messages
+            kept in memory for edit and deletion handling (0 disables)
+        sync_interval_minutes (float): Minutes between automatic incremental
+            syncs of the points channel (0 disables)
+        sync_jitter_seconds (float): Maximum random delay added to each sync
+        brother_role_id (Optional[int]): ID of the Brother role (found by
+            name when unset)
+        eboard_role_id (Optional[int]): ID of the Executive Board role (found
+            by name when unset)
+        info_systems_role_id (int): ID of the Info Systems role
     """
 
     discord_token: str
     database_path: str
     points_channel_id: int
     deleted_messages_channel_id: int
+    fuzzy_match_distance: int = 0
+    message_cache_size: int = 5000
+    sync_interval_minutes: float = 5.0
+    sync_jitter_seconds: float = 30.0
+    brother_role_id: Optional[int] = None
+    eboard_role_id: Optional[int] = None
+    info_systems_role_id: int = DEFAULT_INFO_SYSTEMS_ROLE_ID
 
     @classmethod
     def load_from_env(cls) -> "BotConfig":
@@ -77,11 +147,38 @@ class BotConfig:
         # This channel ID was previously hardcoded in main.py
         deleted_messages_channel_id = 1160689874299523133
 
+        # Fuzzy pledge name matching (optional, off by default)
+        fuzzy_match_distance = _get_non_negative_env("FUZZY_MATCH_DISTANCE", "0")
+
+        # In-memory message cache size (optional)
+        message_cache_size = _get_non_negative_env("MESSAGE_CACHE_SIZE", "5000")
+
+        # Automatic incremental sync schedule (optional)
+        sync_interval_minutes = _get_non_negative_env(
+            "SYNC_INTERVAL_MINUTES", "5", float
+        )
+        sync_jitter_seconds = _get_non_negative_env("SYNC_JITTER_SECONDS", "30", float)
+
+        # Permission role IDs (optional; Brother and Executive Board fall back
+        # to lookup by name)
+        brother_role_id = _get_role_id_env("BROTHER_ROLE_ID")
+        eboard_role_id = _get_role_id_env("EBOARD_ROLE_ID")
+        info_systems_role_id = (
+            _get_role_id_env("INFO_SYSTEMS_ROLE_ID") or DEFAULT_INFO_SYSTEMS_ROLE_ID
+        )
+
         return cls(
             discord_token=discord_token,
             database_path=database_path,
             points_channel_id=points_channel_id,
             deleted_messages_channel_id=deleted_messages_channel_id,
+            fuzzy_match_distance=fuzzy_match_distance,
+            message_cache_size=message_cache_size,
+            sync_interval_minutes=sync_interval_minutes,
+            sync_jitter_seconds=sync_jitter_seconds,
+            brother_role_id=brother_role_id,
+            eboard_role_id=eboard_role_id,
+            info_systems_role_id=info_systems_role_id,
         )
 
 
@@ -11,6 +11,12 @@ from discord.ext import commands  # Discord bot commands and scheduled tasks
 from commands.admin import setup as setup_admin
 from commands.points import setup as setup_points
 from config.settings import get_config
+from PledgePoints.db_writer import get_db_writer
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.reconcile import reconcile_deleted_message, reconcile_edited_message
+from PledgePoints.sqlutils import DatabaseManager
+from role.permissions import get_permission_service
+from utils.deletion_log import DeletionLogAggregator
 
 # Warner: ssl_context until the on_ready function was AI generated because I couldn't be bothered
 # Initialize SSL context for secure connections
@@ -51,7 +57,7 @@ async def on_ready():
     try:
         # Set up command modules
         setup_admin(bot)
-        setup_points(bot)
+        setup_points(bot, message_cache)
 
         # Synchronize slash commands with Discord's API
         synced = await bot.tree.sync()
@@ -78,88 +84,127 @@ async def on_ready():
 
 
 @bot.event
-async def on_message_delete(message):
+async def on_raw_message_edit(payload: discord.RawMessageUpdateEvent):
     """
-    Event handler that triggers when a message is deleted.
-    Sends the deleted message content to a specific channel for logging.
+    Event handler that triggers when any message is edited, cached or not.
+    Updates the point entries created from an edited point submission.
     """
-    print(
-        f"Message deletion detected! Message ID: {message.id}, Author: {message.author}"
-    )
+    if payload.channel_id != config.points_channel_id:
+        return
 
-    try:
-        # Get configuration
-        config = get_config()
+    # Embed-only updates carry no content
+    content = payload.data.get("content")
+    if content is None:
+        return
+
+    cached = message_cache.get(payload.message_id)
+    message_cache.update_content(payload.message_id, content)
 
-        # Get the target channel from config
-        channel = bot.get_channel(config.deleted_messages_channel_id)
-        if not channel:
+    try:
+        result = await get_db_writer(db_manager).submit(
+            reconcile_edited_message, db_manager, payload.message_id, content, cached
+        )
+        if result.changed:
             print(
-                f"Warning: Could not find channel with ID {config.deleted_messages_channel_id}"
+                f"Reconciled edited message {payload.message_id}: "
+                f"{len(result.voided)} voided, {len(result.flagged)} flagged, "
+                f"{len(result.inserted)} added"
             )
-            return
+    except Exception as e:
+        print(f"Error reconciling edited message: {str(e)}")
 
-        print(f"Target channel found: {channel.name} ({channel.id})")
 
-        # Skip if the message was from a bot
-        if message.author.bot:
-            print("Skipping bot message deletion")
-            return
+@bot.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    """
+    Event handler that triggers when any message is deleted, cached or not.
+    Logs the deletion to the deleted messages channel and voids or flags the
+    point entries created from a deleted point submission.
+    """
+    deletion_log.log_raw_delete(payload)
+    message_cache.pop(payload.message_id)
 
-        # Create embed for the deleted message
-        embed = discord.Embed(
-            title="🗑️ Message Deleted",
-            color=discord.Color.red(),
-            timestamp=datetime.now(pytz.UTC),
-        )
+    if payload.channel_id != config.points_channel_id:
+        return
 
-        # Add message details
-        embed.add_field(
-            name="Author",
-            value=f"{message.author.mention} ({message.author.name}#{message.author.discriminator})",
-            inline=True,
-        )
-        embed.add_field(
-            name="Channel",
-            value=f"{message.channel.mention} ({message.channel.name})",
-            inline=True,
+    try:
+        result = await get_db_writer(db_manager).submit(
+            reconcile_deleted_message, db_manager, payload.message_id
         )
-        embed.add_field(name="Message ID", value=message.id, inline=True)
+        if result.changed:
+            print(
+                f"Reconciled deleted message {payload.message_id}: "
+                f"{len(result.voided)} voided, {len(result.flagged)} flagged"
+            )
+    except Exception as e:
+        print(f"Error reconciling deleted message: {str(e)}")
+
+
+@bot.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent):
+    """
+    Event handler that triggers when messages are deleted in bulk (purges).
+    Logs every deleted message and reconciles deleted point submissions.
+    """
+    deletion_log.log_raw_bulk_delete(payload)
+    for message_id in payload.message_ids:
+        message_cache.pop(message_id)
 
-        # Add message content (truncate if too long)
-        content = message.content if message.content else "*No text content*"
-        if len(content) > 1024:
-            content = content[:1021] + "..."
+    if payload.channel_id != config.points_channel_id:
+        return
 
-        embed.add_field(name="Content", value=content, inline=False)
+    def reconcile_all():
+        return [
+            reconcile_deleted_message(db_manager, message_id)
+            for message_id in payload.message_ids
+        ]
 
-        # Add attachments info if any
-        if message.attachments:
-            attachment_names = [att.filename for att in message.attachments]
-            embed.add_field(
-                name="Attachments", value=", ".join(attachment_names), inline=False
+    try:
+        results = await get_db_writer(db_manager).submit(reconcile_all)
+        changed = [result for result in results if result.changed]
+        if changed:
+            print(
+                f"Reconciled {len(changed)} bulk-deleted message(s): "
+                f"{sum(len(r.voided) for r in changed)} voided, "
+                f"{sum(len(r.flagged) for r in changed)} flagged"
             )
+    except Exception as e:
+        print(f"Error reconciling bulk-deleted messages: {str(e)}")
 
-        # Add embeds info if any
-        if message.embeds:
-            embed.add_field(
-                name="Embeds",
-                value=f"{len(message.embeds)} embed(s) were present",
-                inline=False,
-            )
 
-        # Send the embed to the target channel
-        await channel.send(embed=embed)
-        print(f"Successfully logged deleted message to {channel.name}")
+@bot.event
+async def on_guild_role_create(role: discord.Role):
+    """Re-resolve permission roles when a role is added to a guild."""
+    get_permission_service().invalidate(role.guild.id)
 
-    except Exception as e:
-        print(f"Error handling message deletion: {str(e)}")
+
+@bot.event
+async def on_guild_role_update(before: discord.Role, after: discord.Role):
+    """Re-resolve permission roles when a role is renamed or changed."""
+    get_permission_service().invalidate(after.guild.id)
+
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    """Re-resolve permission roles when a role is removed from a guild."""
+    get_permission_service().invalidate(role.guild.id)
 
 
 # Load configuration from centralized config module
 config = get_config()
 TOKEN = config.discord_token
 
+# Database used to reconcile edited and deleted submissions
+db_manager = DatabaseManager(config.database_path)
+
+# Recent points-channel messages, so edits and deletions resolve from memory
+message_cache = MessageContentCache(config.message_cache_size)
+
+# Batches deleted message embeds into as few sends as possible
+deletion_log = DeletionLogAggregator(
+    bot, config.deleted_messages_channel_id, message_cache=message_cache
+)
+
 
 async def main():
     print("Starting bot...")
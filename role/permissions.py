@@ -0,0 +1,158 @@
+"""
+Cached role-based permission checks.
+
+Each permission role is resolved to a role ID once per guild: by its
+configured ID, or by name when no ID is configured. The resolved IDs are
+cached until a role in that guild is created, updated or deleted, and
+checks compare them against the set of the member's role IDs.
+
+Author: Warner (with AI assistance)
+"""
+
+from typing import Dict, Iterable, Mapping, Optional
+
+import discord
+
+from config.settings import BotConfig, get_config
+
+# Permission roles, with the guild role name used when no ID is configured
+ROLE_BROTHER = "brother"
+ROLE_EBOARD = "eboard"
+ROLE_INFO_SYSTEMS = "info_systems"
+ROLE_NAMES: Dict[str, str] = {
+    ROLE_BROTHER: "Brother",
+    ROLE_EBOARD: "Executive Board",
+    ROLE_INFO_SYSTEMS: "Info Systems",
+}
+
+
+class PermissionService:
+    """
+    Resolves permission roles per guild and checks members against them.
+
+    Attributes:
+        role_ids (Mapping[str, Optional[int]]): Configured role ID per
+            permission role; None means look the role up by name
+    """
+
+    def __init__(self, role_ids: Mapping[str, Optional[int]]):
+        """
+        Initialize the service.
+
+        Args:
+            role_ids: Configured role ID per permission role (ROLE_* keys)
+        """
+        self.role_ids = dict(role_ids)
+        self._resolved: Dict[int, Dict[str, Optional[int]]] = {}
+
+    @classmethod
+    def from_config(cls, config: BotConfig) -> "PermissionService":
+        """
+        Build the service from the bot configuration.
+
+        Args:
+            config: Bot configuration holding the role IDs
+
+        Returns:
+            PermissionService: Service using the configured role IDs
+        """
+        return cls(
+            {
+                ROLE_BROTHER: config.brother_role_id,
+                ROLE_EBOARD: config.eboard_role_id,
+                ROLE_INFO_SYSTEMS: config.info_systems_role_id,
+            }
+        )
+
+    def resolve(self, guild: discord.Guild, role: str) -> Optional[int]:
+        """
+        Get the ID of a permission role in a guild.
+
+        Args:
+            guild: Guild to resolve the role in
+            role: Permission role (one of the ROLE_* keys)
+
+        Returns:
+            Optional[int]: Role ID, or None if the guild has no such role
+        """
+        resolved = self._resolved.get(guild.id)
+        if resolved is None:
+            resolved = self._resolve_guild(guild)
+            self._resolved[guild.id] = resolved
+        return resolved.get(role)
+
+    def _resolve_guild(self, guild: discord.Guild) -> Dict[str, Optional[int]]:
+        """Resolve every permission role in a guild with one pass over its roles."""
+        by_name: Dict[str, int] = {}
+        missing_names = {
+            ROLE_NAMES[role]
+            for role, role_id in self.role_ids.items()
+            if role_id is None
+        }
+        if missing_names:
+            for guild_role in guild.roles:
+                if guild_role.name in missing_names:
+                    by_name.setdefault(guild_role.name, guild_role.id)
+
+        resolved: Dict[str, Optional[int]] = {}
+        for role, role_id in self.role_ids.items():
+            if role_id is None:
+                resolved[role] = by_name.get(ROLE_NAMES[role])
+            else:
+                resolved[role] = role_id if guild.get_role(role_id) else None
+        return resolved
+
+    def has_any_role(self, interaction: discord.Interaction, *roles: str) -> bool:
+        """
+        Check whether the user of an interaction has any of the given roles.
+
+        Args:
+            interaction: Interaction whose user to check
+            *roles: Permission roles (ROLE_* keys), any of which is enough
+
+        Returns:
+            bool: True if the user has at least one of the roles
+        """
+        guild = interaction.guild
+        if guild is None:
+            return False
+
+        required = {self.resolve(guild, role) for role in roles}
+        required.discard(None)
+        if not required:
+            return False
+
+        member_roles: Iterable[discord.Role] = getattr(interaction.user, "roles", ())
+        return not required.isdisjoint(role.id for role in member_roles)
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """
+        Forget resolved roles so they are resolved again on next use.
+
+        Args:
+            guild_id: Guild whose roles changed, or None to clear every guild
+        """
+        if guild_id is None:
+            self._resolved.clear()
+        else:
+            self._resolved.pop(guild_id, None)
+
+
+# Global permission service instance, built on first use
+permission_service: Optional[PermissionService] = None
+
+
+def get_permission_service() -> PermissionService:
+    """
+    Get the global permission service.
+
+    Builds the service from the bot configuration on first call and returns
+    the cached instance thereafter, so role resolutions are shared.
+
+    Returns:
+        PermissionService: The global permission service
+    """
+    global permission_service
+    if permission_service is None:
+        permission_service = PermissionService.from_config(get_config())
+    return permission_service
@@ -1,5 +1,12 @@
 import discord
 
+from role.permissions import (
+    ROLE_BROTHER,
+    ROLE_EBOARD,
+    ROLE_INFO_SYSTEMS,
+    get_permission_service,
+)
+
 
 async def check_eboard_role(interaction: discord.Interaction) -> bool:
     """
@@ -15,12 +22,7 @@ async def check_eboard_role(interaction: discord.Interaction) -> bool:
         an ephemeral message to the user and returns ``False``.
     :rtype: bool
     """
-    vp_role: discord.role = discord.utils.get(
-        interaction.guild.roles, name="Executive Board"
-    )
-    if vp_role is None or vp_role not in interaction.user.roles:
-        return False
-    return True
+    return get_permission_service().has_any_role(interaction, ROLE_EBOARD)
 
 
 async def check_brother_role(interaction: discord.Interaction) -> bool:
@@ -37,12 +39,7 @@ async def check_brother_role(interaction: discord.Interaction) -> bool:
         an ephemeral message to the user and returns ``False``.
     :rtype: bool
     """
-    brother_role: discord.role = discord.utils.get(
-        interaction.guild.roles, name="Brother"
-    )
-    if brother_role is None or brother_role not in interaction.user.roles:
-        return False
-    return True
+    return get_permission_service().has_any_role(interaction, ROLE_BROTHER)
 
 
 async def check_info_systems_role(interaction: discord.Interaction) -> bool:
@@ -59,9 +56,21 @@ async def check_info_systems_role(interaction: discord.Interaction) -> bool:
     :return: True if the user has the "Info Systems" role and the role exists within the guild; False otherwise.
     :rtype: bool
     """
-    infosys_role: discord.role = discord.utils.get(
-        interaction.guild.roles, id=1032306248235888762
+    return get_permission_service().has_any_role(interaction, ROLE_INFO_SYSTEMS)
+
+
+async def check_approver_role(interaction: discord.Interaction) -> bool:
+    """
+    Checks if the user has the "Executive Board" or "Info Systems" role.
+
+    Both roles may approve and reject points; checking them together builds
+    the user's role ID set only once.
+
+    :param interaction: The interaction object whose user's roles are checked.
+    :type interaction: discord.Interaction
+    :return: True if the user has either role; False otherwise.
+    :rtype: bool
+    """
+    return get_permission_service().has_any_role(
+        interaction, ROLE_EBOARD, ROLE_INFO_SYSTEMS
     )
-    if infosys_role is None or infosys_role not in interaction.user.roles:
-        return False
-    return True
@@ -0,0 +1,136 @@
+"""Unit tests for PledgePoints backfill jobs."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+import pytz
+
+from PledgePoints.backfill import BackfillManager
+from PledgePoints.sqlutils import DatabaseManager
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+def make_message(message_id, content):
+    """Create a mock Discord message."""
+    message = Mock()
+    message.id = message_id
+    message.content = content
+    message.created_at = BASE_TIME + timedelta(minutes=message_id)
+    message.author = Mock()
+    message.author.bot = False
+    message.author.id = 42
+    message.author.display_name = "Brother"
+    message.add_reaction = AsyncMock()
+    return message
+
+
+def make_bot(messages, block_after=None):
+    """
+    Create a mock bot whose channel history honours snowflake `after` bounds.
+
+    If block_after is set, history stalls after yielding that message ID.
+    """
+
+    async def history(after=None, **kwargs):
+        for message in messages:
+            if isinstance(after, discord.Object) and message.id <= after.id:
+                continue
+            yield message
+            if message.id == block_after:
+                await asyncio.Event().wait()
+
+    channel = Mock()
+    channel.history = history
+    bot = Mock()
+    bot.get_channel = Mock(return_value=channel)
+    return bot
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database manager backed by a temporary file."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+class TestBackfillManager:
+    """Tests for BackfillManager class."""
+
+    @pytest.mark.asyncio
+    async def test_completed_job_is_recorded(self, db_manager):
+        """Test that a finished job stores its counts and status."""
+        messages = [make_message(1, "+10 Evan cleanup"), make_message(2, "hello")]
+        manager = BackfillManager(make_bot(messages), db_manager, slices=1)
+
+        job, task = manager.start(123, days_ago=7, requested_by="Admin")
+        await task
+
+        stored = db_manager.get_backfill_job(job.job_id)
+        assert stored.status == "completed"
+        assert stored.last_message_id == 2
+        assert (stored.fetched, stored.inserted, stored.invalid) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cancel_then_resume_from_checkpoint(self, db_manager):
+        """Test that a cancelled job resumes after its last committed page."""
+        messages = [
+            make_message(1, "+10 Evan cleanup"),
+            make_message(2, "+5 Milo driving"),
+            make_message(3, "+1 Tony help"),
+        ]
+        bot = make_bot(messages, block_after=1)
+        manager = BackfillManager(bot, db_manager, page_size=1, slices=1)
+
+        job, task = manager.start(123, days_ago=7)
+        while db_manager.get_backfill_job(job.job_id).last_message_id is None:
+            await asyncio.sleep(0.01)
+        assert manager.cancel(job.job_id) is True
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stored = db_manager.get_backfill_job(job.job_id)
+        assert stored.status == "cancelled"
+        assert stored.last_message_id == 1
+
+        resumed = BackfillManager(make_bot(messages), db_manager, slices=1)
+        finished = await resumed.resume(stored)
+
+        assert finished.status == "completed"
+        assert finished.inserted == 3
+        assert len(db_manager.get_all_points()) == 3
+
+    @pytest.mark.asyncio
+    async def test_shutdown_leaves_job_resumable(self, db_manager):
+        """Test that a job cancelled by shutdown stays 'running', not 'cancelled'."""
+        bot = make_bot([make_message(1, "+10 Evan cleanup")], block_after=1)
+        manager = BackfillManager(bot, db_manager, slices=1)
+
+        job, task = manager.start(123, days_ago=7)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert db_manager.get_backfill_job(job.job_id).status == "running"
+
+    @pytest.mark.asyncio
+    async def test_resume_incomplete_picks_up_running_jobs(self, db_manager):
+        """Test that jobs left running by a crash are resumed on startup."""
+        job = db_manager.create_backfill_job(123, BASE_TIME, BASE_TIME)
+        manager = BackfillManager(
+            make_bot([make_message(1, "+1 Evan x")]), db_manager, slices=1
+        )
+
+        resumed = manager.resume_incomplete()
+        assert [j.job_id for j in resumed] == [job.job_id]
+
+        await asyncio.sleep(0.1)
+        assert db_manager.get_backfill_job(job.job_id).status == "completed"
+
+    def test_cancel_unknown_job(self, db_manager):
+        """Test that cancelling a job that is not running returns False."""
+        manager = BackfillManager(Mock(), db_manager)
+        assert manager.cancel(42) is False
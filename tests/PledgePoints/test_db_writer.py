@@ -0,0 +1,108 @@
+"""Unit tests for the write-coalescing database writer."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from PledgePoints.db_writer import DatabaseWriter
+from PledgePoints.models import PointEntry
+from PledgePoints.sqlutils import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing an empty database."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+def make_entry(points):
+    """Build a pending entry."""
+    return PointEntry(
+        datetime(2025, 1, 1, tzinfo=timezone.utc), points, "Evan", "Ann", "x"
+    )
+
+
+class TestDatabaseWriter:
+    """Tests for DatabaseWriter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_one_transaction(self, db_manager):
+        """Test that calls queued in the same tick commit together."""
+        writer = DatabaseWriter(db_manager, max_delay=0.01)
+
+        results = await asyncio.gather(
+            *(
+                writer.submit(db_manager.add_point_entries, [make_entry(i)])
+                for i in range(20)
+            )
+        )
+
+        assert results == [1] * 20
+        assert (writer.batches, writer.writes) == (1, 20)
+        assert len(db_manager.get_pending_points()) == 20
+
+    @pytest.mark.asyncio
+    async def test_failing_call_is_rolled_back_alone(self, db_manager):
+        """Test that a call that fails part way changes nothing and raises."""
+        writer = DatabaseWriter(db_manager, max_delay=0.01)
+
+        def insert_then_fail():
+            db_manager.add_point_entries([make_entry(99)])
+            raise ValueError("bad write")
+
+        ok, failed = await asyncio.gather(
+            writer.submit(db_manager.add_point_entries, [make_entry(1)]),
+            writer.submit(insert_then_fail),
+            return_exceptions=True,
+        )
+
+        assert ok == 1
+        assert isinstance(failed, ValueError)
+        assert [entry.point_change for entry in db_manager.get_pending_points()] == [1]
+        assert writer.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises_for_every_caller(
+        self, db_manager, monkeypatch, capsys
+    ):
+        """Test that a batch that cannot commit raises and logs its error type."""
+        writer = DatabaseWriter(db_manager, max_delay=0.01)
+
+        def fail(batch):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(writer, "_apply", fail)
+        results = await asyncio.gather(
+            writer.submit(db_manager.add_point_entries, [make_entry(1)]),
+            writer.submit(db_manager.add_point_entries, [make_entry(2)]),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert "RuntimeError: database is locked" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_batches_are_bounded(self, db_manager):
+        """Test that no more than max_batch calls share a transaction."""
+        writer = DatabaseWriter(db_manager, max_delay=0.01, max_batch=4)
+
+        await asyncio.gather(
+            *(
+                writer.submit(db_manager.add_point_entries, [make_entry(i)])
+                for i in range(10)
+            )
+        )
+
+        assert (writer.batches, writer.writes) == (3, 10)
+
+    def test_batch_is_shared_by_managers_of_the_same_file(self, db_manager):
+        """Test that another manager for the file joins the open batch."""
+        other = DatabaseManager(db_manager.db_file)
+
+        with db_manager.batch():
+            db_manager.add_point_entries([make_entry(1)])
+            # A separate connection would wait on the batch's write lock
+            other.add_point_entries([make_entry(2)])
+
+        assert len(db_manager.get_pending_points()) == 2
@@ -0,0 +1,82 @@
+"""Unit tests for the Points table exporter."""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from PledgePoints.exporter import export_points
+from PledgePoints.models import PointEntry, PointFilter
+from PledgePoints.sqlutils import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database with a few point entries."""
+    db_manager = DatabaseManager(str(tmp_path / "points.db"))
+    db_manager.add_point_entries(
+        [
+            PointEntry(datetime(2025, 1, 1, tzinfo=timezone.utc), 10, "Evan", "A", "x"),
+            PointEntry(datetime(2025, 1, 2, tzinfo=timezone.utc), 5, "Milo", "B", "y"),
+            PointEntry(datetime(2025, 1, 3, tzinfo=timezone.utc), -5, "Evan", "C", "z"),
+        ]
+    )
+    db_manager.approve_points([1, 2], "Admin")
+    return db_manager
+
+
+class TestExportPoints:
+    """Tests for export_points function."""
+
+    def test_csv_export_in_batches(self, db_manager):
+        """Test that all rows are written when read in small batches."""
+        buffer = io.BytesIO()
+
+        count = export_points(db_manager, buffer, "csv", batch_size=1)
+
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue().decode())))
+        assert count == 3
+        assert [row["pledge"] for row in rows] == ["Evan", "Milo", "Evan"]
+        assert rows[0]["approval_status"] == "approved"
+
+    def test_jsonl_export_with_filter(self, db_manager):
+        """Test filtering by status, pledge and time window."""
+        buffer = io.BytesIO()
+        point_filter = PointFilter(
+            statuses=("approved",),
+            pledge="Evan",
+            since=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            until=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        )
+
+        count = export_points(db_manager, buffer, "jsonl", point_filter)
+
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        assert count == 1
+        assert records[0]["id"] == 1
+        assert records[0]["point_change"] == 10
+
+    def test_time_window_excludes_later_entries(self, db_manager):
+        """Test that the until bound is exclusive and since is inclusive."""
+        point_filter = PointFilter(since=datetime(2025, 1, 2), until=datetime(2025, 1, 3))
+
+        count = export_points(db_manager, io.BytesIO(), "jsonl", point_filter)
+
+        assert count == 1
+
+    def test_parquet_export(self, db_manager):
+        """Test Parquet output when pyarrow is installed."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        buffer = io.BytesIO()
+
+        export_points(db_manager, buffer, "parquet")
+
+        buffer.seek(0)
+        assert pq.read_table(buffer).num_rows == 3
+
+    def test_unknown_format(self, db_manager):
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export_points(db_manager, io.BytesIO(), "xml")
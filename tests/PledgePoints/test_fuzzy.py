@@ -0,0 +1,50 @@
+"""Unit tests for PledgePoints fuzzy matching."""
+
+import random
+import string
+
+from PledgePoints.fuzzy import DeletionIndex, deletions, edit_distance
+
+
+class TestEditDistance:
+    """Tests for edit_distance function."""
+
+    def test_known_distances(self):
+        """Test distances for insertions, deletions and substitutions."""
+        assert edit_distance("", "") == 0
+        assert edit_distance("abc", "") == 3
+        assert edit_distance("kitten", "sitting") == 3
+        assert edit_distance("krishiv", "krishive") == 1
+        assert edit_distance("flaw", "lawn") == 2
+
+
+class TestDeletionIndex:
+    """Tests for DeletionIndex class."""
+
+    def test_deletions(self):
+        """Test that deletions include the word and every shorter variant."""
+        assert deletions("abc", 1) == {"abc", "bc", "ac", "ab"}
+        assert deletions("ab", 0) == {"ab"}
+
+    def test_search_matches_linear_scan(self):
+        """Test that index search finds exactly what a full scan finds."""
+        rng = random.Random(0)
+        letters = string.ascii_lowercase[:6]
+        words = {
+            "".join(rng.choice(letters) for _ in range(rng.randint(3, 7)))
+            for _ in range(300)
+        }
+        index = DeletionIndex(words, 2)
+
+        for _ in range(50):
+            query = "".join(rng.choice(letters) for _ in range(rng.randint(3, 7)))
+            expected = sorted(
+                (edit_distance(query, word), word)
+                for word in words
+                if edit_distance(query, word) <= 2
+            )
+            assert index.search(query) == expected
+
+    def test_empty_index(self):
+        """Test that searching an empty index finds nothing."""
+        assert DeletionIndex([], 2).search("abc") == []
@@ -0,0 +1,161 @@
+"""Unit tests for the offline channel export importer."""
+
+import io
+import json
+
+import discord
+import pytest
+
+from PledgePoints import importer
+from PledgePoints.importer import import_messages, iter_csv_export, iter_export
+from PledgePoints.messages import content_hash
+from PledgePoints.models import ParsedMessage
+from PledgePoints.sqlutils import DatabaseManager
+
+# Real snowflakes so times are derived the same way as live ingestion
+ID_1 = 1200000000000000000
+ID_2 = 1200000000000000001
+ID_3 = 1200000000000000002
+
+
+def make_json_export(messages):
+    """Build a DiscordChatExporter-style JSON export."""
+    return json.dumps(
+        {
+            "guild": {"id": "1", "name": "Guild"},
+            "channel": {"id": "2", "name": "points"},
+            "messages": messages,
+            "messageCount": len(messages),
+        }
+    )
+
+
+def make_message(message_id, content, is_bot=False):
+    """Build a single exported message object."""
+    return {
+        "id": str(message_id),
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "content": content,
+        "author": {"name": "brother", "nickname": "Brother", "isBot": is_bot},
+    }
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database manager backed by a temporary file."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+class TestReadExports:
+    """Tests for export readers."""
+
+    def test_json_export_streams_in_small_reads(self, tmp_path, monkeypatch):
+        """Test that messages split across read boundaries are decoded."""
+        monkeypatch.setattr(importer, "_JSON_READ_SIZE", 7)
+        path = tmp_path / "export.json"
+        path.write_text(
+            make_json_export(
+                [make_message(ID_1, "+10 Evan [cleanup]"), make_message(ID_2, "hi")]
+            )
+        )
+
+        messages = list(iter_export(path))
+
+        assert [m.message_id for m in messages] == [ID_1, ID_2]
+        assert messages[0].content == "+10 Evan [cleanup]"
+        assert messages[0].author == "Brother"
+        assert messages[0].time == discord.utils.snowflake_time(ID_1)
+
+    def test_csv_export_without_ids(self):
+        """Test reading a CSV export, which has no message IDs."""
+        fp = io.StringIO(
+            "AuthorID,Author,Date,Content,Attachments,Reactions\n"
+            '1,brother,2024-01-01T12:00:00.000+00:00,"+5 Milo driving",,\n'
+        )
+
+        (message,) = iter_csv_export(fp)
+
+        assert message.message_id is None
+        assert message.content == "+5 Milo driving"
+        assert message.time.isoformat() == "2024-01-01T12:00:00+00:00"
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that unknown file types are rejected."""
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            list(iter_export(tmp_path / "export.txt"))
+
+
+class TestImportMessages:
+    """Tests for import_messages function."""
+
+    def test_imports_in_batches_and_dedups(self, tmp_path, db_manager):
+        """Test that valid messages are inserted once across batches and reruns."""
+        path = tmp_path / "export.json"
+        path.write_text(
+            make_json_export(
+                [
+                    make_message(ID_1, "+10 Evan cleanup"),
+                    make_message(ID_1, "+10 Evan cleanup"),
+                    make_message(ID_2, "not points"),
+                    make_message(ID_3, "+5 Milo driving"),
+                    make_message(ID_3 + 1, "+5 Tony bot", is_bot=True),
+                ]
+            )
+        )
+
+        stats = import_messages(iter_export(path), db_manager, batch_size=2)
+
+        assert (stats.fetched, stats.invalid, stats.inserted) == (3, 1, 2)
+        # Batches count messages, valid or not
+        assert stats.pages == 2
+
+        rerun = import_messages(iter_export(path), db_manager)
+        assert rerun.inserted == 0
+        assert rerun.duplicates == 2
+        assert len(db_manager.get_all_points()) == 2
+
+    def test_multi_pledge_message(self, tmp_path, db_manager):
+        """Test that a message naming several pledges imports one entry each."""
+        path = tmp_path / "export.json"
+        path.write_text(
+            make_json_export([make_message(ID_1, "+5 Evan, Milo, Tony for cleanup")])
+        )
+
+        stats = import_messages(iter_export(path), db_manager)
+
+        assert (stats.fetched, stats.parsed, stats.inserted) == (1, 3, 3)
+        points = db_manager.get_all_points()
+        assert sorted(point.pledge for point in points) == ["Evan", "Milo", "Tony"]
+        assert {point.message_id for point in points} == {ID_1}
+
+    def test_records_parse_outcomes(self, tmp_path, db_manager):
+        """Test that imported messages are recorded so live syncs skip them."""
+        db_manager.save_parsed_messages(
+            [ParsedMessage(ID_1, content_hash("+10 Evan cleanup"), True, reacted=True)]
+        )
+        path = tmp_path / "export.json"
+        path.write_text(
+            make_json_export(
+                [
+                    make_message(ID_1, "+10 Evan cleanup"),
+                    make_message(ID_2, "not points"),
+                ]
+            )
+        )
+
+        import_messages(iter_export(path), db_manager)
+
+        parsed = db_manager.get_parsed_messages([ID_1, ID_2])
+        assert (parsed[ID_1].parse_ok, parsed[ID_1].reacted) == (True, True)
+        assert (parsed[ID_2].parse_ok, parsed[ID_2].reacted) == (False, False)
+
+    def test_repeated_csv_rows_are_imported_once(self, db_manager):
+        """Test that identical CSV rows without IDs are only inserted once."""
+        row = '1,brother,2024-01-01T12:00:00.000+00:00,"+5 Milo driving",,\n'
+        header = "AuthorID,Author,Date,Content,Attachments,Reactions\n"
+        fp = io.StringIO(header + row * 3)
+
+        stats = import_messages(iter_csv_export(fp), db_manager)
+
+        assert (stats.fetched, stats.inserted) == (1, 1)
+        assert len(db_manager.get_all_points()) == 1
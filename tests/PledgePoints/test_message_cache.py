@@ -0,0 +1,49 @@
+"""Unit tests for the in-memory message cache."""
+
+from datetime import datetime
+
+import pytz
+
+from PledgePoints.message_cache import CachedMessage, MessageContentCache
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+def make_entry(message_id, content="+10 Evan cleanup"):
+    """Create a cache entry."""
+    return CachedMessage(message_id, 1, 2, "Brother", content, BASE_TIME)
+
+
+class TestMessageContentCache:
+    """Tests for MessageContentCache class."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the entry used longest ago is evicted first."""
+        cache = MessageContentCache(max_size=2)
+        cache.put(make_entry(1))
+        cache.put(make_entry(2))
+        assert cache.get(1) is not None  # 2 is now least recently used
+
+        cache.put(make_entry(3))
+
+        assert 1 in cache and 3 in cache
+        assert 2 not in cache
+        assert len(cache) == 2
+
+    def test_update_and_pop(self):
+        """Test that edits update content and deletions remove entries."""
+        cache = MessageContentCache(max_size=10)
+        cache.put(make_entry(1))
+
+        cache.update_content(1, "+5 Milo edited")
+        assert cache.get(1).content == "+5 Milo edited"
+
+        assert cache.pop(1).message_id == 1
+        assert cache.get(1) is None
+        cache.update_content(1, "ignored")  # No error for unknown messages
+
+    def test_zero_size_disables_cache(self):
+        """Test that a cache of size 0 stores nothing."""
+        cache = MessageContentCache(max_size=0)
+        cache.put(make_entry(1))
+        assert len(cache) == 0
@@ -0,0 +1,304 @@
+"""Unit tests for PledgePoints message ingestion."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+import pytz
+
+from PledgePoints.messages import (
+    eliminate_duplicates,
+    ingest_channel_history,
+    iter_sliced_history_pages,
+    split_snowflake_window,
+)
+from PledgePoints.message_cache import MessageContentCache
+from PledgePoints.models import PointEntry
+from PledgePoints.sqlutils import DatabaseManager
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+def make_message(message_id, content, bot=False):
+    """Create a mock Discord message."""
+    message = Mock()
+    message.id = message_id
+    message.content = content
+    message.created_at = BASE_TIME + timedelta(minutes=message_id)
+    message.author = Mock()
+    message.author.bot = bot
+    message.author.id = 42
+    message.author.display_name = "Brother"
+    message.add_reaction = AsyncMock()
+    return message
+
+
+def make_bot(messages):
+    """Create a mock bot whose channel yields the given messages."""
+
+    async def history(**kwargs):
+        for message in messages:
+            yield message
+
+    channel = Mock()
+    channel.history = history
+    bot = Mock()
+    bot.get_channel = Mock(return_value=channel)
+    return bot
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database manager backed by a temporary file."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+class TestEliminateDuplicates:
+    """Tests for eliminate_duplicates function."""
+
+    def test_skips_known_message_ids(self, db_manager):
+        """Test that entries from an already stored message are duplicates."""
+        entry = PointEntry(BASE_TIME, 10, "Evan", "Brother", "Cleanup", message_id=1)
+        db_manager.add_point_entries([entry])
+
+        edited = PointEntry(BASE_TIME, 5, "Evan", "Brother", "Edited", message_id=1)
+        assert eliminate_duplicates([edited], db_manager) == []
+
+    def test_matches_legacy_rows_by_content(self, db_manager):
+        """Test that rows without message IDs are matched by content."""
+        legacy = PointEntry(BASE_TIME, 10, "Evan", "Old Name", "Cleanup")
+        db_manager.add_point_entries([legacy])
+
+        same = PointEntry(BASE_TIME, 10, "Evan", "New Name", "Cleanup", message_id=7)
+        other = PointEntry(BASE_TIME, 5, "Milo", "New Name", "Cleanup", message_id=8)
+        assert eliminate_duplicates([same, other], db_manager) == [other]
+
+
+class TestIngestChannelHistory:
+    """Tests for ingest_channel_history function."""
+
+    @pytest.mark.asyncio
+    async def test_commits_each_page(self, db_manager):
+        """Test that pages are committed incrementally with running stats."""
+        messages = [
+            make_message(1, "+10 Evan cleanup"),
+            make_message(2, "not a point message"),
+            make_message(3, "+5 Milo driving", bot=True),
+            make_message(4, "-5 Tony late"),
+            make_message(5, "+1 Will help"),
+        ]
+        committed = []
+
+        async def on_page_committed(stats):
+            committed.append((stats.pages, len(db_manager.get_all_points())))
+
+        stats = await ingest_channel_history(
+            make_bot(messages),
+            123,
+            BASE_TIME,
+            db_manager,
+            page_size=2,
+            on_page_committed=on_page_committed,
+        )
+
+        assert stats.fetched == 4
+        assert stats.invalid == 1
+        assert stats.inserted == 3
+        assert stats.last_message_id == 5
+        assert committed == [(1, 1), (2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_rerun_inserts_nothing(self, db_manager):
+        """Test that ingesting the same history twice adds no duplicates."""
+        messages = [make_message(1, "+10 Evan cleanup")]
+
+        await ingest_channel_history(make_bot(messages), 123, BASE_TIME, db_manager)
+        stats = await ingest_channel_history(
+            make_bot(messages), 123, BASE_TIME, db_manager
+        )
+
+        assert stats.inserted == 0
+        assert stats.cached == 1
+        assert len(db_manager.get_all_points()) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ingests_insert_once(self, db_manager):
+        """Test that overlapping ingests of the same history add no duplicates."""
+        messages = [make_message(i, f"+{i} Evan cleanup") for i in range(1, 6)]
+
+        results = await asyncio.gather(
+            ingest_channel_history(make_bot(messages), 123, BASE_TIME, db_manager),
+            ingest_channel_history(make_bot(messages), 123, BASE_TIME, db_manager),
+        )
+
+        assert sum(stats.inserted for stats in results) == 5
+        assert len(db_manager.get_all_points()) == 5
+
+    @pytest.mark.asyncio
+    async def test_cached_messages_skip_parsing_and_reacting(
+        self, db_manager, monkeypatch
+    ):
+        """Test that unchanged, reacted messages are not processed again."""
+        messages = [make_message(1, "+10 Evan cleanup"), make_message(2, "hi")]
+        await ingest_channel_history(make_bot(messages), 123, BASE_TIME, db_manager)
+        while not all(
+            m.reacted for m in db_manager.get_parsed_messages([1, 2]).values()
+        ):
+            await asyncio.sleep(0.01)
+        for message in messages:
+            message.add_reaction.reset_mock()
+
+        parsed = []
+        monkeypatch.setattr(
+            "PledgePoints.messages.parse_messages",
+            lambda batch: parsed.extend(batch) or ([], []),
+        )
+        stats = await ingest_channel_history(
+            make_bot(messages), 123, BASE_TIME, db_manager
+        )
+        await asyncio.sleep(0)
+
+        assert (stats.fetched, stats.cached, stats.invalid) == (2, 2, 0)
+        assert parsed == []
+        for message in messages:
+            message.add_reaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_edited_messages_are_parsed_again(self, db_manager):
+        """Test that a message whose content changed is not served from cache."""
+        await ingest_channel_history(
+            make_bot([make_message(1, "hello")]), 123, BASE_TIME, db_manager
+        )
+
+        stats = await ingest_channel_history(
+            make_bot([make_message(1, "+10 Evan cleanup")]), 123, BASE_TIME, db_manager
+        )
+
+        assert (stats.cached, stats.inserted) == (0, 1)
+        assert db_manager.get_parsed_messages([1])[1].parse_ok is True
+
+    @pytest.mark.asyncio
+    async def test_multi_pledge_message(self, db_manager):
+        """Test that one message naming several pledges stores an entry each."""
+        messages = [make_message(1, "+5 Evan, Milo for cleanup")]
+
+        stats = await ingest_channel_history(
+            make_bot(messages), 123, BASE_TIME, db_manager
+        )
+
+        assert (stats.fetched, stats.parsed, stats.invalid) == (1, 2, 0)
+        assert stats.inserted == 2
+        points = db_manager.get_all_points()
+        assert sorted(point.pledge for point in points) == ["Evan", "Milo"]
+        assert {point.message_id for point in points} == {1}
+        messages[0].add_reaction.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_populates_message_cache(self, db_manager):
+        """Test that every fetched message is recorded in the message cache."""
+        cache = MessageContentCache(max_size=10)
+        messages = [make_message(1, "+10 Evan cleanup"), make_message(2, "hi")]
+
+        await ingest_channel_history(
+            make_bot(messages), 123, BASE_TIME, db_manager, message_cache=cache
+        )
+
+        assert cache.get(1).content == "+10 Evan cleanup"
+        assert cache.get(2).author_name == "Brother"
+
+    @pytest.mark.asyncio
+    async def test_missing_channel_raises(self, db_manager):
+        """Test that an unknown channel raises ValueError."""
+        bot = Mock()
+        bot.get_channel = Mock(return_value=None)
+
+        with pytest.raises(ValueError, match="not found"):
+            await ingest_channel_history(bot, 123, BASE_TIME, db_manager)
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_adds_no_reactions(self, db_manager, monkeypatch):
+        """Test that messages are only reacted to after their page is stored."""
+        message = make_message(1, "+10 Evan cleanup")
+
+        def fail(entries):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(db_manager, "add_point_entries", fail)
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await ingest_channel_history(
+                make_bot([message]), 123, BASE_TIME, db_manager
+            )
+        await asyncio.sleep(0)
+
+        message.add_reaction.assert_not_called()
+
+
+def make_bounded_channel(messages, delays=None):
+    """Create a mock channel whose history honours snowflake after/before bounds."""
+
+    async def history(after=None, before=None, **kwargs):
+        for message in messages:
+            if after.id < message.id < before.id:
+                if delays:
+                    await asyncio.sleep(delays.get(message.id, 0))
+                yield message
+
+    channel = Mock()
+    channel.history = history
+    return channel
+
+
+class TestSlicedHistory:
+    """Tests for time-sliced history fetching."""
+
+    def test_split_covers_window_contiguously(self):
+        """Test that slices are contiguous, ordered and span the whole window."""
+        end = BASE_TIME + timedelta(days=30)
+        ranges = split_snowflake_window(BASE_TIME, end, 4)
+
+        assert len(ranges) == 4
+        assert ranges[0][0] == discord.utils.time_snowflake(BASE_TIME, high=True)
+        assert ranges[-1][1] == discord.utils.time_snowflake(end)
+        for (_, high), (low, _) in zip(ranges, ranges[1:]):
+            assert low == high - 1
+
+    def test_split_never_produces_empty_slices(self):
+        """Test that tiny windows are not split into more slices than IDs."""
+        ranges = split_snowflake_window(discord.Object(10), discord.Object(13), 8)
+        assert ranges == [(10, 12), (11, 13)]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_merged_in_order(self):
+        """Test that concurrently fetched slices are yielded oldest first."""
+        messages = [make_message(i, f"+{i} Evan x") for i in range(1, 40)]
+        # Make early messages slow so later slices finish first
+        delays = {i: 0.01 for i in range(1, 10)}
+        channel = make_bounded_channel(messages, delays)
+
+        ids = []
+        async for page in iter_sliced_history_pages(
+            channel, discord.Object(0), discord.Object(40), slices=4, page_size=5
+        ):
+            ids.extend(m.id for m in page)
+
+        assert ids == list(range(1, 40))
+
+    @pytest.mark.asyncio
+    async def test_slice_errors_are_raised(self):
+        """Test that a failing slice fetch propagates to the consumer."""
+
+        async def history(**kwargs):
+            raise discord.DiscordException("boom")
+            yield
+
+        channel = Mock()
+        channel.history = history
+
+        with pytest.raises(discord.DiscordException, match="boom"):
+            async for _ in iter_sliced_history_pages(
+                channel, discord.Object(0), discord.Object(40), slices=2
+            ):
+                pass
@@ -0,0 +1,75 @@
+"""Unit tests for the in-memory pending entry index."""
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from PledgePoints.models import PointEntry
+from PledgePoints.pending_index import PendingIndex
+from PledgePoints.sqlutils import DatabaseManager
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database with 12 pending entries."""
+    db_manager = DatabaseManager(str(tmp_path / "points.db"))
+    db_manager.add_point_entries(
+        [
+            PointEntry(BASE_TIME, i, "Evan" if i % 3 else "Milo", "Bro", f"#{i}")
+            for i in range(1, 13)
+        ]
+    )
+    return db_manager
+
+
+class TestPendingIndex:
+    """Tests for PendingIndex."""
+
+    @pytest.mark.asyncio
+    async def test_complete_ids_by_prefix(self, db_manager):
+        """Test that IDs are completed by their leading digits."""
+        index = PendingIndex(db_manager)
+        await index.refresh()
+
+        assert [e.entry_id for e in index.complete_ids("1")] == [1, 10, 11, 12]
+        assert [e.entry_id for e in index.complete_ids("1", frozenset({10}))] == [
+            1,
+            11,
+            12,
+        ]
+        assert len(index.complete_ids("", limit=5)) == 5
+        assert index.complete_ids("9")[0].comment == "#9"
+
+    @pytest.mark.asyncio
+    async def test_complete_pledges_with_counts(self, db_manager):
+        """Test that pledges with pending entries are suggested with counts."""
+        index = PendingIndex(db_manager)
+        await index.refresh()
+
+        assert index.complete_pledges("") == [("Evan", 8), ("Milo", 4)]
+        assert index.complete_pledges("mi") == [("Milo", 4)]
+
+    @pytest.mark.asyncio
+    async def test_reloads_only_after_changes(self, db_manager, monkeypatch):
+        """Test that the database is only read again after it changed."""
+        index = PendingIndex(db_manager)
+        await index.refresh()
+
+        loads = []
+        original = db_manager.get_pending_points
+        monkeypatch.setattr(
+            db_manager,
+            "get_pending_points",
+            lambda: loads.append(1) or original(),
+        )
+        await index.refresh()
+        assert loads == []
+
+        db_manager.approve_points([1, 2, 3], "Admin")
+        await index.refresh()
+        assert loads == [1]
+        assert len(index) == 9
+        assert [e.entry_id for e in index.complete_ids("1")] == [10, 11, 12]
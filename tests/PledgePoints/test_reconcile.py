@@ -0,0 +1,145 @@
+"""Unit tests for PledgePoints edit and deletion reconciliation."""
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from PledgePoints.message_cache import CachedMessage
+from PledgePoints.models import PointEntry
+from PledgePoints.reconcile import (
+    REASON_DELETED,
+    REASON_EDITED,
+    reconcile_deleted_message,
+    reconcile_edited_message,
+)
+from PledgePoints.sqlutils import DatabaseManager
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database manager backed by a temporary file."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+def add_submission(db_manager, message_id, pledges, points=5, comment="cleanup"):
+    """Store the entries a multi-pledge submission would create."""
+    db_manager.add_point_entries(
+        [
+            PointEntry(
+                BASE_TIME, points, pledge, "Brother", comment, message_id=message_id
+            )
+            for pledge in pledges
+        ]
+    )
+    return db_manager.get_points_by_message_id(message_id)
+
+
+def statuses(db_manager, message_id):
+    """Get (pledge, status, review_reason) for a message's entries."""
+    return [
+        (e.pledge, e.approval_status, e.review_reason)
+        for e in db_manager.get_points_by_message_id(message_id)
+    ]
+
+
+class TestReconcileDeletedMessage:
+    """Tests for reconcile_deleted_message function."""
+
+    def test_voids_pending_and_flags_approved(self, db_manager):
+        """Test that deletion voids pending entries and flags approved ones."""
+        evan, milo, tony = add_submission(db_manager, 1, ["Evan", "Milo", "Tony"])
+        db_manager.approve_points([milo.entry_id], "Officer")
+        db_manager.reject_points([tony.entry_id], "Officer")
+
+        result = reconcile_deleted_message(db_manager, 1)
+
+        assert [e.entry_id for e in result.voided] == [evan.entry_id]
+        assert [e.entry_id for e in result.flagged] == [milo.entry_id]
+        assert statuses(db_manager, 1) == [
+            ("Evan", "voided", REASON_DELETED),
+            ("Milo", "approved", REASON_DELETED),
+            ("Tony", "rejected", None),
+        ]
+
+    def test_unknown_message(self, db_manager):
+        """Test that deleting a message without entries changes nothing."""
+        assert reconcile_deleted_message(db_manager, 99).changed is False
+
+
+class TestReconcileEditedMessage:
+    """Tests for reconcile_edited_message function."""
+
+    def test_edit_replaces_pending_entries(self, db_manager):
+        """Test that changed pending entries are voided and replaced."""
+        add_submission(db_manager, 1, ["Evan", "Milo"])
+
+        result = reconcile_edited_message(db_manager, 1, "+5 Evan, Tony cleanup")
+
+        assert [e.pledge for e in result.voided] == ["Milo"]
+        assert [e.pledge for e in result.inserted] == ["Tony"]
+        assert statuses(db_manager, 1) == [
+            ("Evan", "pending", None),
+            ("Milo", "voided", REASON_EDITED),
+            ("Tony", "pending", None),
+        ]
+        # Replacements keep the original time and author
+        tony = db_manager.get_points_by_message_id(1)[-1]
+        assert (tony.time, tony.brother) == (BASE_TIME, "Brother")
+
+    def test_edit_flags_changed_approved_entries(self, db_manager):
+        """Test that approved entries are flagged, not changed, by an edit."""
+        (evan,) = add_submission(db_manager, 1, ["Evan"])
+        db_manager.approve_points([evan.entry_id], "Officer")
+
+        result = reconcile_edited_message(db_manager, 1, "+50 Evan cleanup")
+
+        assert [e.entry_id for e in result.flagged] == [evan.entry_id]
+        # No replacement while the flagged entry still counts
+        assert result.inserted == []
+        assert statuses(db_manager, 1) == [("Evan", "approved", REASON_EDITED)]
+
+    def test_edit_with_flagged_entry_still_voids_pending(self, db_manager):
+        """Test that pending entries are voided next to a flagged approved one."""
+        evan, milo = add_submission(db_manager, 1, ["Evan", "Milo"])
+        db_manager.approve_points([evan.entry_id], "Officer")
+
+        result = reconcile_edited_message(db_manager, 1, "+9 Tony cleanup")
+
+        assert [e.entry_id for e in result.flagged] == [evan.entry_id]
+        assert [e.entry_id for e in result.voided] == [milo.entry_id]
+        assert result.inserted == []
+
+    def test_edit_to_invalid_voids_everything_pending(self, db_manager):
+        """Test that editing a submission into an invalid message voids it."""
+        add_submission(db_manager, 1, ["Evan"])
+
+        result = reconcile_edited_message(db_manager, 1, "never mind")
+
+        assert len(result.voided) == 1
+        assert result.inserted == []
+
+    def test_unchanged_content_is_a_no_op(self, db_manager):
+        """Test that an edit that keeps the submission changes nothing."""
+        add_submission(db_manager, 1, ["Evan"])
+
+        result = reconcile_edited_message(db_manager, 1, "+5 evan   cleanup")
+
+        assert result.changed is False
+        assert statuses(db_manager, 1) == [("Evan", "pending", None)]
+
+    def test_edit_adds_entries_for_cached_message(self, db_manager):
+        """Test that an edit making a cached message valid adds its entries."""
+        cached = CachedMessage(7, 1, 2, "Author", "+5 Evn cleanup", BASE_TIME)
+
+        result = reconcile_edited_message(db_manager, 7, "+5 Evan cleanup", cached)
+
+        assert [(e.pledge, e.brother) for e in result.inserted] == [("Evan", "Author")]
+        assert statuses(db_manager, 7) == [("Evan", "pending", None)]
+
+    def test_edit_of_unknown_message_is_ignored(self, db_manager):
+        """Test that an uncached message without entries is left alone."""
+        result = reconcile_edited_message(db_manager, 7, "+5 Evan cleanup")
+        assert result.changed is False
@@ -0,0 +1,81 @@
+"""Unit tests for PledgePoints roster."""
+
+from PledgePoints.constants import VALID_PLEDGES
+from PledgePoints.roster import PledgeRoster, get_roster
+
+
+class TestPledgeRoster:
+    """Tests for PledgeRoster class."""
+
+    roster = PledgeRoster(
+        ["Eli", "Matthew", "McDonald"],
+        {"Matt": "Matthew", "Ozempic": "Eli", "Ghost": "Nobody", "Eli2": "Eli"},
+    )
+
+    def test_resolve_is_case_insensitive(self):
+        """Test that names resolve regardless of case."""
+        assert self.roster.resolve("eli") == "Eli"
+        assert self.roster.resolve("MCDONALD") == "McDonald"
+        assert self.roster.resolve("mcdonald") == "McDonald"
+
+    def test_resolve_aliases(self):
+        """Test that aliases resolve to the canonical name."""
+        assert self.roster.resolve("matt") == "Matthew"
+        assert self.roster.resolve("OZEMPIC") == "Eli"
+
+    def test_unknown_names(self):
+        """Test that unknown names and dangling aliases do not resolve."""
+        assert self.roster.resolve("Nobody") is None
+        assert self.roster.resolve("ghost") is None
+
+    def test_membership_uses_canonical_names(self):
+        """Test that membership checks official names only."""
+        assert "Eli" in self.roster
+        assert "Matt" not in self.roster
+        assert len(self.roster) == 3
+        assert list(self.roster) == ["Eli", "Matthew", "McDonald"]
+
+    def test_complete_matches_names_and_aliases(self):
+        """Test that prefixes complete to distinct canonical names."""
+        assert self.roster.complete("m") == ["Matthew", "McDonald"]
+        assert self.roster.complete("oz") == ["Eli"]
+        assert self.roster.complete("el") == ["Eli"]
+        assert self.roster.complete("") == ["Eli", "Matthew", "McDonald"]
+        assert self.roster.complete("m", limit=1) == ["Matthew"]
+
+    def test_global_roster_uses_constants(self):
+        """Test that the global roster is built once from VALID_PLEDGES."""
+        assert get_roster() is get_roster()
+        assert get_roster().canonical_names == frozenset(VALID_PLEDGES)
+
+
+class TestFuzzyResolve:
+    """Tests for PledgeRoster.fuzzy_resolve."""
+
+    roster = PledgeRoster(
+        ["Krishiv", "Kashyap", "Logan", "Megan"], {"Kash": "Kashyap"}
+    )
+
+    def test_exact_match_wins(self):
+        """Test that exact names resolve without fuzzy matching."""
+        assert self.roster.fuzzy_resolve("krishiv", 2) == "Krishiv"
+
+    def test_typos_within_distance(self):
+        """Test that misspellings within the threshold resolve."""
+        assert self.roster.fuzzy_resolve("Krishive", 1) == "Krishiv"
+        assert self.roster.fuzzy_resolve("Krshiv", 1) == "Krishiv"
+        assert self.roster.fuzzy_resolve("Kashyup", 1) == "Kashyap"
+
+    def test_disabled_or_too_far(self):
+        """Test that distance 0 or distant names do not resolve."""
+        assert self.roster.fuzzy_resolve("Krishive", 0) is None
+        assert self.roster.fuzzy_resolve("Kristopher", 2) is None
+
+    def test_ambiguous_matches_rejected(self):
+        """Test that ties between different pledges are rejected."""
+        # "Legan" is one edit from both Logan and Megan
+        assert self.roster.fuzzy_resolve("Legan", 1) is None
+
+    def test_short_names_not_corrected(self):
+        """Test that very short tokens are never fuzzy matched."""
+        assert self.roster.fuzzy_resolve("Kas", 2) is None
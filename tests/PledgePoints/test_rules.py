@@ -0,0 +1,100 @@
+"""Unit tests for auto-approval rules."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from PledgePoints.models import PointEntry
+from PledgePoints.rules import ApprovalRules, parse_rule
+from PledgePoints.sqlutils import DatabaseManager
+
+RULES = [
+    {"name": "large-deduction", "action": "hold", "max_points": -11},
+    {"name": "trusted-small", "max_abs_points": 5, "author_ids": [1]},
+    {"name": "bob-awards", "min_points": 1, "author_ids": [2], "pledges": ["Milo"]},
+]
+
+AUTHOR_IDS = {"Ann": 1, "Bob": 2}
+
+
+def make_entry(points, brother="Ann", pledge="Evan", author_id=None):
+    """Build a pending entry for rule checks, by default from the brother's ID."""
+    return PointEntry(
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        points,
+        pledge,
+        brother,
+        "x",
+        author_id=author_id if author_id is not None else AUTHOR_IDS.get(brother),
+    )
+
+
+class TestApprovalRules:
+    """Tests for ApprovalRules."""
+
+    @pytest.fixture
+    def rules(self):
+        """Fixture providing the example rules."""
+        return ApprovalRules.from_config(RULES)
+
+    def test_first_matching_rule_decides(self, rules):
+        """Test that rules are checked in order and a hold rule wins."""
+        assert rules.match(make_entry(5)).name == "trusted-small"
+        assert rules.match(make_entry(-20)).name == "large-deduction"
+        assert rules.match(make_entry(6)) is None
+        assert rules.match(make_entry(10, brother="Bob", pledge="Milo")).name == (
+            "bob-awards"
+        )
+        assert rules.match(make_entry(-1, brother="Bob", pledge="Milo")) is None
+
+    def test_apply_approves_matching_pending_entries(self, rules):
+        """Test that only 'approve' matches are approved, with the rule named."""
+        now = datetime(2025, 1, 2)
+        entries = [make_entry(3), make_entry(-20), make_entry(9)]
+
+        applied = rules.apply(entries, now=now)
+
+        assert [entry.approval_status for entry in applied] == [
+            "approved",
+            "pending",
+            "pending",
+        ]
+        assert applied[0].approved_by == "auto:trusted-small"
+        assert applied[0].approval_timestamp == now
+        assert entries[0].approval_status == "pending"
+
+    def test_brothers_are_matched_by_user_id(self, rules):
+        """Test that a display name alone does not make a submission trusted."""
+        assert rules.match(make_entry(5, brother="Ann", author_id=99)) is None
+        assert rules.match(make_entry(5, brother="Mallory", author_id=1)).name == (
+            "trusted-small"
+        )
+        unknown = PointEntry(datetime(2025, 1, 1), 5, "Evan", "Ann", "x")
+        assert rules.match(unknown) is None
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"max_abs_points": 5},
+            {"name": "x", "action": "reject"},
+            {"name": "x", "max_point": 5},
+            {"name": "x", "brothers": ["Ann"]},
+        ],
+    )
+    def test_invalid_rules(self, config):
+        """Test that malformed rule configuration is rejected."""
+        with pytest.raises(ValueError):
+            parse_rule(config)
+
+    def test_auto_approved_entries_are_stored_approved(self, rules, tmp_path):
+        """Test that add_point_entries keeps the status set by a rule."""
+        db_manager = DatabaseManager(str(tmp_path / "points.db"))
+        db_manager.add_point_entries(rules.apply([make_entry(3), make_entry(9)]))
+
+        stored = db_manager.get_point_by_id(1)
+        assert (stored.approval_status, stored.approved_by) == (
+            "approved",
+            "auto:trusted-small",
+        )
+        assert stored.author_id == 1
+        assert [entry.entry_id for entry in db_manager.get_pending_points()] == [2]
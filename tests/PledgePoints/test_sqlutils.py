@@ -0,0 +1,255 @@
+"""Unit tests for reviewing point entries in DatabaseManager."""
+
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from PledgePoints.models import PointEntry, PointFilter
+from PledgePoints.sqlutils import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database with a few pending point entries."""
+    db_manager = DatabaseManager(str(tmp_path / "points.db"))
+    db_manager.add_point_entries(
+        [
+            PointEntry(datetime(2025, 1, 1, tzinfo=timezone.utc), 10, "Evan", "Ann", "x"),
+            PointEntry(datetime(2025, 1, 2, tzinfo=timezone.utc), 5, "Milo", "Bob", "y"),
+            PointEntry(datetime(2025, 1, 3, tzinfo=timezone.utc), -5, "Evan", "ann", "z"),
+            PointEntry(datetime(2025, 1, 4, tzinfo=timezone.utc), 20, "Evan", "Bob", "w"),
+        ]
+    )
+    return db_manager
+
+
+class TestReviewMatching:
+    """Tests for approve_matching and reject_matching."""
+
+    def test_approve_by_pledge_and_time_range(self, db_manager):
+        """Test that only pending entries inside every criterion are approved."""
+        approved = db_manager.approve_matching(
+            PointFilter(
+                pledge="Evan",
+                since=datetime(2025, 1, 2),
+                until=datetime(2025, 1, 4),
+            ),
+            "Admin",
+        )
+
+        assert [entry.entry_id for entry in approved] == [3]
+        assert approved[0].approval_status == "approved"
+        assert approved[0].approved_by == "Admin"
+        assert [entry.entry_id for entry in db_manager.get_pending_points()] == [1, 2, 4]
+
+    def test_reject_by_brother_ignores_case(self, db_manager):
+        """Test that the brother filter matches regardless of case."""
+        rejected = db_manager.reject_matching(PointFilter(brother="ANN"), "Admin")
+
+        assert [entry.entry_id for entry in rejected] == [1, 3]
+        assert all(entry.approval_status == "rejected" for entry in rejected)
+
+    def test_point_range(self, db_manager):
+        """Test that the point range bounds are inclusive."""
+        approved = db_manager.approve_matching(
+            PointFilter(min_points=5, max_points=10), "Admin"
+        )
+
+        assert [entry.entry_id for entry in approved] == [1, 2]
+
+    def test_already_reviewed_entries_are_untouched(self, db_manager):
+        """Test that a filter never re-reviews approved or rejected entries."""
+        db_manager.reject_points([1], "First")
+
+        approved = db_manager.approve_matching(PointFilter(pledge="Evan"), "Second")
+
+        assert [entry.entry_id for entry in approved] == [3, 4]
+        assert db_manager.get_point_by_id(1).approval_status == "rejected"
+        assert db_manager.get_point_by_id(1).approved_by == "First"
+
+    def test_id_helpers_use_same_path(self, db_manager):
+        """Test the ID and all-pending helpers, including an empty ID list."""
+        assert db_manager.approve_points([], "Admin") == []
+        assert [entry.entry_id for entry in db_manager.approve_points([2, 9], "Admin")] == [2]
+        assert [entry.entry_id for entry in db_manager.reject_all_pending("Admin")] == [
+            1,
+            3,
+            4,
+        ]
+
+
+class TestReviewIndexes:
+    """Tests that filtered reviews are served by the composite indexes."""
+
+    @pytest.mark.parametrize(
+        "point_filter, index",
+        [
+            (PointFilter(pledge="Evan"), "idx_points_status_pledge_time"),
+            (
+                PointFilter(pledge="Evan", since=datetime(2025, 1, 2)),
+                "idx_points_status_pledge_time",
+            ),
+            (PointFilter(since=datetime(2025, 1, 2)), "idx_points_status_time"),
+        ],
+    )
+    def test_query_plan_uses_index(self, db_manager, point_filter, index):
+        """Test that pending entries are found without scanning the table."""
+        clause, params = replace(point_filter, statuses=("pending",)).to_sql()
+        with db_manager.get_connection() as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM Points WHERE {clause}", params
+            ).fetchall()
+
+        assert index in plan[0][3]
+
+
+class TestReviewRequests:
+    """Tests for versioned, idempotent reviews."""
+
+    def test_review_increments_version(self, db_manager):
+        """Test that each status change bumps the row version."""
+        result = db_manager.review(PointFilter(ids=(1,)), "approved", "Admin")
+
+        assert result.reviewed[0].version == 1
+        assert db_manager.get_point_by_id(2).version == 0
+
+    def test_overlapping_review_reports_winner(self, db_manager):
+        """Test that a later review of the same IDs is a no-op naming the first."""
+        db_manager.review(PointFilter(ids=(1, 2)), "approved", "Alice")
+
+        result = db_manager.review(PointFilter(ids=(2, 3, 99)), "rejected", "Bob")
+
+        assert [entry.entry_id for entry in result.reviewed] == [3]
+        assert [
+            (entry.entry_id, entry.approval_status, entry.approved_by)
+            for entry in result.already_reviewed
+        ] == [(2, "approved", "Alice")]
+        assert result.missing == [99]
+        assert not result.replayed
+
+    def test_repeated_key_is_replayed(self, db_manager):
+        """Test that a retried request changes nothing and returns its result."""
+        first = db_manager.review(
+            PointFilter(ids=(1, 2)), "approved", "Alice", idempotency_key="42"
+        )
+        db_manager.add_point_entries(
+            [PointEntry(datetime(2025, 1, 5, tzinfo=timezone.utc), 1, "Evan", "Ann", "v")]
+        )
+        db_manager.reconcile_points([], [2], "source message edited")
+
+        retry = db_manager.review(
+            PointFilter(), "approved", "Alice", idempotency_key="42"
+        )
+
+        assert retry.replayed
+        assert [entry.entry_id for entry in first.reviewed] == [1, 2]
+        # Entry 2 was flagged after the first request, and the new entry 5
+        # was never touched by it
+        assert [entry.entry_id for entry in retry.reviewed] == [1]
+        assert [entry.entry_id for entry in retry.already_reviewed] == [2]
+        assert db_manager.get_point_by_id(5).approval_status == "pending"
+
+
+class TestPointEvents:
+    """Tests for the status change audit log."""
+
+    def test_review_and_reconcile_are_logged(self, db_manager):
+        """Test that every status change is logged with its actor."""
+        db_manager.approve_points([1], "Alice")
+        db_manager.reject_points([2], "Bob")
+        db_manager.reconcile_points([3], [1], "source message edited")
+
+        events = db_manager.get_point_events(entry_id=1)
+        assert [(e.old_status, e.new_status, e.actor, e.note) for e in events] == [
+            ("pending", "approved", "Alice", None),
+            ("approved", "approved", None, "source message edited"),
+        ]
+        assert [
+            (e.old_status, e.new_status, e.actor)
+            for e in db_manager.get_point_events(entry_id=3)
+        ] == [("pending", "voided", None)]
+        assert events[0].time.tzinfo is not None
+
+    def test_non_pending_inserts_are_logged(self, db_manager):
+        """Test that an entry inserted approved gets a creation event."""
+        db_manager.add_point_entries(
+            [
+                PointEntry(
+                    datetime(2025, 1, 5, tzinfo=timezone.utc),
+                    2,
+                    "Evan",
+                    "Ann",
+                    "v",
+                    approval_status="approved",
+                    approved_by="auto:trusted-small",
+                )
+            ]
+        )
+
+        assert db_manager.get_point_events(entry_id=4) == []
+        (event,) = db_manager.get_point_events(entry_id=5)
+        assert (event.old_status, event.new_status, event.actor) == (
+            None,
+            "approved",
+            "auto:trusted-small",
+        )
+
+    def test_events_by_actor_newest_limit(self, db_manager):
+        """Test filtering by actor and keeping only the newest events."""
+        db_manager.approve_points([1], "Alice")
+        db_manager.approve_points([2], "Bob")
+        db_manager.approve_points([3, 4], "Alice")
+
+        events = db_manager.get_point_events(actor="Alice", limit=2)
+
+        assert [event.entry_id for event in events] == [3, 4]
+
+
+class TestFlaggedPoints:
+    """Tests for listing and resolving flagged approved entries."""
+
+    @pytest.fixture
+    def flagged(self, db_manager):
+        """Approve entries 1-3 and flag 1 and 2 as edited."""
+        db_manager.approve_points([1, 2, 3], "Alice")
+        db_manager.reconcile_points([], [1, 2], "source message edited")
+        return db_manager
+
+    def test_lists_only_flagged_approved_entries(self, flagged):
+        """Test that flagged approved entries are listed in ID order."""
+        assert [e.entry_id for e in flagged.get_flagged_points()] == [1, 2]
+
+    def test_keep_clears_flag(self, flagged):
+        """Test that keeping an entry clears its flag and logs the resolver."""
+        (kept,) = flagged.resolve_flagged_points([1, 3, 4], True, "Bob")
+
+        assert (kept.entry_id, kept.approval_status, kept.review_reason) == (
+            1,
+            "approved",
+            None,
+        )
+        assert kept.approved_by == "Bob"
+        assert [e.entry_id for e in flagged.get_flagged_points()] == [2]
+        last = flagged.get_point_events(entry_id=1)[-1]
+        assert (last.old_status, last.new_status, last.actor, last.note) == (
+            "approved",
+            "approved",
+            "Bob",
+            None,
+        )
+
+    def test_void_removes_entry(self, flagged):
+        """Test that voiding a flagged entry takes it out of the approved set."""
+        (voided,) = flagged.resolve_flagged_points([2], False, "Bob")
+
+        assert voided.approval_status == "voided"
+        assert flagged.get_point_by_id(2).approval_status == "voided"
+        last = flagged.get_point_events(entry_id=2)[-1]
+        assert (last.old_status, last.new_status, last.actor) == (
+            "approved",
+            "voided",
+            "Bob",
+        )
+        # Resolving again does nothing
+        assert flagged.resolve_flagged_points([2], False, "Bob") == []
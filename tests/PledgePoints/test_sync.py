@@ -0,0 +1,121 @@
+"""Unit tests for the scheduled incremental sync."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+import pytz
+
+from PledgePoints.models import IngestStats, ParsedMessage, PointEntry
+from PledgePoints.sqlutils import DatabaseManager
+from PledgePoints.sync import IncrementalSync
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database manager backed by a temporary file."""
+    return DatabaseManager(str(tmp_path / "points.db"))
+
+
+def make_sync(db_manager, interval=300, max_backoff=3600):
+    """Create a sync with a mock bot and no jitter."""
+    return IncrementalSync(
+        Mock(), db_manager, 123, interval=interval, max_backoff=max_backoff
+    )
+
+
+class TestGetLatestMessageId:
+    """Tests for DatabaseManager.get_latest_message_id."""
+
+    def test_empty_database(self, db_manager):
+        """Test that an empty database has no watermark."""
+        assert db_manager.get_latest_message_id() is None
+
+    def test_newest_of_points_and_parsed_messages(self, db_manager):
+        """Test that invalid messages count toward the watermark too."""
+        db_manager.add_point_entries(
+            [PointEntry(BASE_TIME, 1, "Evan", "Bro", "x", message_id=5)]
+        )
+        assert db_manager.get_latest_message_id() == 5
+
+        db_manager.save_parsed_messages([ParsedMessage(9, 0, False)])
+        assert db_manager.get_latest_message_id() == 9
+
+
+class TestIncrementalSync:
+    """Tests for IncrementalSync."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_newest_message(self, db_manager, monkeypatch):
+        """Test that a run reads only history after the stored watermark."""
+        db_manager.save_parsed_messages([ParsedMessage(42, 0, True)])
+        ingest = AsyncMock(return_value=IngestStats())
+        monkeypatch.setattr("PledgePoints.sync.ingest_channel_history", ingest)
+
+        await make_sync(db_manager).run_once()
+
+        after = ingest.await_args.args[2]
+        assert isinstance(after, discord.Object) and after.id == 42
+
+    @pytest.mark.asyncio
+    async def test_first_run_uses_lookback(self, db_manager, monkeypatch):
+        """Test that an empty database is synced from the initial lookback."""
+        ingest = AsyncMock(return_value=IngestStats())
+        monkeypatch.setattr("PledgePoints.sync.ingest_channel_history", ingest)
+
+        await make_sync(db_manager).run_once()
+
+        after = ingest.await_args.args[2]
+        assert datetime.now(pytz.UTC) - after > timedelta(days=6)
+
+    @pytest.mark.asyncio
+    async def test_records_successful_run(self, db_manager, monkeypatch):
+        """Test that a run's time, duration and totals are reported."""
+        stats = IngestStats(fetched=3, inserted=2)
+        monkeypatch.setattr(
+            "PledgePoints.sync.ingest_channel_history", AsyncMock(return_value=stats)
+        )
+        sync = make_sync(db_manager)
+
+        await sync._tick()
+
+        assert sync.last_stats is stats
+        assert sync.last_run_at is not None and sync.last_duration is not None
+        assert sync.last_error is None
+
+    @pytest.mark.asyncio
+    async def test_backs_off_and_recovers(self, db_manager, monkeypatch):
+        """Test that failures double the interval and success restores it."""
+        ingest = AsyncMock(side_effect=discord.DiscordException("down"))
+        monkeypatch.setattr("PledgePoints.sync.ingest_channel_history", ingest)
+        sync = make_sync(db_manager, interval=300, max_backoff=1000)
+
+        await sync._tick()
+        assert sync._loop.seconds == 600
+        await sync._tick()
+        assert sync._loop.seconds == 1000
+        assert (sync.failures, sync.last_error) == (2, "down")
+
+        ingest.side_effect = None
+        ingest.return_value = IngestStats()
+        await sync._tick()
+        assert sync._loop.seconds == 300
+        assert sync.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_at_least_retry_after(
+        self, db_manager, monkeypatch
+    ):
+        """Test that a rate limit waits as long as Discord asked."""
+        error = discord.RateLimited(900.0)
+        monkeypatch.setattr(
+            "PledgePoints.sync.ingest_channel_history", AsyncMock(side_effect=error)
+        )
+        sync = make_sync(db_manager, interval=60)
+
+        await sync._tick()
+
+        assert sync._loop.seconds == 900
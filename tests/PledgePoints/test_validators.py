@@ -1,9 +1,12 @@
 """Unit tests for PledgePoints validators."""
 
 from PledgePoints.constants import SQL_INT_MAX, SQL_INT_MIN
+from PledgePoints.roster import PledgeRoster
 from PledgePoints.validators import (
+    PointMessageParser,
     normalize_pledge_name,
     parse_point_message,
+    parse_point_submission,
     validate_pledge_name,
     validate_point_change,
 )
@@ -156,3 +159,87 @@ class TestParsePointMessage:
         huge_points = SQL_INT_MAX + 1
         result = parse_point_message(f"+{huge_points} Eli comment")
         assert result is None
+
+
+class TestPointMessageParser:
+    """Tests for PointMessageParser class."""
+
+    parser = PointMessageParser(
+        PledgeRoster(
+            ["Eli", "Matthew", "To"],
+            {"Matt": "Matthew", "Ozempic": "Eli", "Eli": "Nobody"},
+        )
+    )
+
+    def test_alias_resolution(self):
+        """Test that aliases resolve and lookups are case-insensitive."""
+        assert self.parser.parse("+5 matt late") == (5, "Matthew", "late")
+        assert self.parser.parse("+5 OZEMPIC good") == (5, "Eli", "good")
+
+    def test_alias_to_unknown_pledge_hides_name(self):
+        """Test that an alias pointing at an unknown pledge is rejected."""
+        assert self.parser.parse("+5 Eli good") is None
+
+    def test_whitespace_and_multiline_comments(self):
+        """Test that extra spaces are trimmed and comments may span lines."""
+        assert self.parser.parse("+1 to   Matt  first\nsecond \n") == (
+            1,
+            "Matthew",
+            "first\nsecond",
+        )
+        assert self.parser.parse("+2Matt no space") == (2, "Matthew", "no space")
+
+    def test_to_handling(self):
+        """Test that a bare 'to' is not taken as the pledge name."""
+        assert self.parser.parse("+1 to Matt") is None
+        assert self.parser.parse("+1 to to thanks") == (1, "To", "thanks")
+
+    def test_malformed_points(self):
+        """Test that malformed or huge point values are rejected."""
+        assert self.parser.parse("+1.5.5 Matt x") is None
+        assert self.parser.parse("+" + "9" * 400 + " Matt x") is None
+
+    def test_parse_many_preserves_order(self):
+        """Test that batch parsing returns one result per input, in order."""
+        results = self.parser.parse_many(["+1 Matt a", "nope", "-2 matt b"])
+        assert results == [(1, "Matthew", "a"), None, (-2, "Matthew", "b")]
+
+    def test_fuzzy_distance_corrects_typos(self):
+        """Test that a fuzzy parser accepts close misspellings."""
+        parser = PointMessageParser(PledgeRoster(["Krishiv"]), fuzzy_distance=1)
+        assert parser.parse("+10 Krishive cleanup") == (10, "Krishiv", "cleanup")
+        assert self.parser.parse("+10 Mathew cleanup") is None
+
+
+class TestParsePointSubmission:
+    """Tests for multi-pledge point submissions."""
+
+    def test_comma_separated_pledges(self):
+        """Test that several comma-separated pledges share points and comment."""
+        assert parse_point_submission("+5 Evan, milo,Tony for cleanup") == (
+            5,
+            ("Evan", "Milo", "Tony"),
+            "for cleanup",
+        )
+        assert parse_point_submission("-2 to Evan, Milo late") == (
+            -2,
+            ("Evan", "Milo"),
+            "late",
+        )
+
+    def test_single_pledge(self):
+        """Test that single-pledge messages give a one-element tuple."""
+        assert parse_point_submission("+5 Evan cleanup") == (5, ("Evan",), "cleanup")
+
+    def test_repeated_pledges_counted_once(self):
+        """Test that naming a pledge twice awards points once."""
+        assert parse_point_submission("+5 Evan, evan x") == (5, ("Evan",), "x")
+
+    def test_any_invalid_name_rejects_message(self):
+        """Test that one unknown name rejects the whole submission."""
+        assert parse_point_submission("+5 Evan, Nobody cleanup") is None
+        assert parse_point_submission("+5 Evan, Milo") is None
+
+    def test_single_parser_rejects_lists(self):
+        """Test that parse_point_message keeps its one-pledge contract."""
+        assert parse_point_message("+5 Evan, Milo cleanup") is None
@@ -0,0 +1,48 @@
+"""Unit tests for argument parsing in the points commands."""
+
+from datetime import datetime
+
+import pytest
+
+from PledgePoints.models import PointFilter
+from commands.points import parse_review_filter
+
+
+class TestParseReviewFilter:
+    """Tests for parse_review_filter function."""
+
+    def test_ids_are_reviewed_inline(self):
+        """Test that a list of IDs builds an ID filter that is not bulk."""
+        point_filter, bulk = parse_review_filter("1, 2,3")
+
+        assert point_filter == PointFilter(ids=(1, 2, 3))
+        assert not bulk
+
+    def test_all_selects_every_pending_entry(self):
+        """Test that 'all' builds an empty filter run as a bulk review."""
+        assert parse_review_filter(" ALL ") == (PointFilter(), True)
+
+    def test_filters_without_ids(self):
+        """Test that filters alone build a bulk review."""
+        point_filter, bulk = parse_review_filter(
+            None, pledge="Evan", brother=" Ann ", since="2025-01-02", max_points=10
+        )
+
+        assert point_filter == PointFilter(
+            pledge="Evan", brother="Ann", since=datetime(2025, 1, 2), max_points=10
+        )
+        assert bulk
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"point_ids": "1,x"},
+            {"until": "next monday"},
+            {"min_points": 10, "max_points": 5},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test that missing or invalid arguments raise a user-facing error."""
+        with pytest.raises(ValueError):
+            parse_review_filter(kwargs.pop("point_ids", None), **kwargs)
@@ -59,6 +59,29 @@ class TestBotConfig:
         with pytest.raises(ValueError, match="CHANNEL_ID must be a valid integer"):
             BotConfig.load_from_env()
 
+    def test_fuzzy_match_distance(self, sample_env_vars, monkeypatch):
+        """Test that FUZZY_MATCH_DISTANCE defaults to 0 and is validated."""
+        monkeypatch.delenv("FUZZY_MATCH_DISTANCE", raising=False)
+        assert BotConfig.load_from_env().fuzzy_match_distance == 0
+
+        monkeypatch.setenv("FUZZY_MATCH_DISTANCE", "2")
+        assert BotConfig.load_from_env().fuzzy_match_distance == 2
+
+        monkeypatch.setenv("FUZZY_MATCH_DISTANCE", "-1")
+        with pytest.raises(ValueError, match="must not be negative"):
+            BotConfig.load_from_env()
+
+    def test_sync_schedule(self, sample_env_vars, monkeypatch):
+        """Test that the sync interval and jitter accept fractional values."""
+        monkeypatch.setenv("SYNC_INTERVAL_MINUTES", "2.5")
+        monkeypatch.setenv("SYNC_JITTER_SECONDS", "0")
+        config = BotConfig.load_from_env()
+        assert (config.sync_interval_minutes, config.sync_jitter_seconds) == (2.5, 0)
+
+        monkeypatch.setenv("SYNC_INTERVAL_MINUTES", "often")
+        with pytest.raises(ValueError, match="must be a valid number"):
+            BotConfig.load_from_env()
+
     def test_config_is_frozen(self, sample_env_vars):
         """Test that BotConfig is immutable (frozen dataclass)."""
         config = BotConfig.load_from_env()
@@ -0,0 +1,107 @@
+"""Unit tests for cached role-based permission checks."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from role.permissions import (
+    ROLE_BROTHER,
+    ROLE_EBOARD,
+    ROLE_INFO_SYSTEMS,
+    PermissionService,
+)
+
+INFO_SYSTEMS_ID = 1032306248235888762
+
+
+def make_role(role_id, name):
+    """Create a mock guild role."""
+    role = Mock()
+    role.id = role_id
+    role.name = name
+    return role
+
+
+def make_guild(roles, guild_id=1):
+    """Create a mock guild with the given roles."""
+    guild = Mock()
+    guild.id = guild_id
+    guild.roles = roles
+    guild.get_role = lambda role_id: next(
+        (role for role in roles if role.id == role_id), None
+    )
+    return guild
+
+
+def make_interaction(guild, member_roles):
+    """Create a mock interaction from a member with the given roles."""
+    interaction = Mock()
+    interaction.guild = guild
+    interaction.user.roles = member_roles
+    return interaction
+
+
+@pytest.fixture
+def roles():
+    """Fixture providing the guild's roles."""
+    return [
+        make_role(10, "Brother"),
+        make_role(20, "Executive Board"),
+        make_role(INFO_SYSTEMS_ID, "Info Systems"),
+    ]
+
+
+@pytest.fixture
+def service():
+    """Fixture providing a service with only the Info Systems ID configured."""
+    return PermissionService(
+        {ROLE_BROTHER: None, ROLE_EBOARD: None, ROLE_INFO_SYSTEMS: INFO_SYSTEMS_ID}
+    )
+
+
+class TestPermissionService:
+    """Tests for PermissionService."""
+
+    def test_resolves_by_name_and_id(self, service, roles):
+        """Test that unconfigured roles are found by name, others by ID."""
+        guild = make_guild(roles)
+
+        assert service.resolve(guild, ROLE_BROTHER) == 10
+        assert service.resolve(guild, ROLE_EBOARD) == 20
+        assert service.resolve(guild, ROLE_INFO_SYSTEMS) == INFO_SYSTEMS_ID
+
+    def test_configured_id_wins_over_name(self, roles):
+        """Test that a configured ID is used even if another role has the name."""
+        roles.append(make_role(11, "Brothers Emeritus"))
+        service = PermissionService({ROLE_BROTHER: 11})
+
+        assert service.resolve(make_guild(roles), ROLE_BROTHER) == 11
+
+    def test_has_any_role(self, service, roles):
+        """Test membership checks against one or several roles."""
+        guild = make_guild(roles)
+        brother = make_interaction(guild, [roles[0]])
+        info_systems = make_interaction(guild, [roles[0], roles[2]])
+
+        assert service.has_any_role(brother, ROLE_BROTHER)
+        assert not service.has_any_role(brother, ROLE_EBOARD, ROLE_INFO_SYSTEMS)
+        assert service.has_any_role(info_systems, ROLE_EBOARD, ROLE_INFO_SYSTEMS)
+
+    def test_missing_role_and_no_guild(self, service, roles):
+        """Test that absent roles and DMs never grant permission."""
+        guild = make_guild(roles[:1])
+
+        assert not service.has_any_role(make_interaction(guild, []), ROLE_EBOARD)
+        assert not service.has_any_role(make_interaction(None, []), ROLE_BROTHER)
+
+    def test_caches_until_invalidated(self, service, roles):
+        """Test that guild roles are scanned once until invalidated."""
+        guild = make_guild(roles)
+        service.resolve(guild, ROLE_BROTHER)
+
+        roles[0].name = "Old Brother"
+        roles.append(make_role(12, "Brother"))
+        assert service.resolve(guild, ROLE_BROTHER) == 10
+
+        service.invalidate(guild.id)
+        assert service.resolve(guild, ROLE_BROTHER) == 12
@@ -0,0 +1,141 @@
+"""Unit tests for batched deleted-message logging."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+
+from PledgePoints.message_cache import CachedMessage, MessageContentCache
+from utils.deletion_log import DeletionLogAggregator
+
+LOG_CHANNEL_ID = 999
+# A real snowflake, so the send time can be derived from it
+MESSAGE_ID = 1160689874299523133
+
+
+def make_message(message_id, content="hello", bot=False, channel_id=1):
+    """Create a mock cached Discord message."""
+    message = Mock()
+    message.id = message_id
+    message.content = content
+    message.attachments = []
+    message.embeds = []
+    message.author = Mock()
+    message.author.bot = bot
+    message.author.mention = "<@1>"
+    message.author.name = "brother"
+    message.author.discriminator = "0"
+    message.channel = Mock()
+    message.channel.id = channel_id
+    message.channel.mention = f"<#{channel_id}>"
+    message.channel.name = "points"
+    return message
+
+
+def make_aggregator(**kwargs):
+    """Create an aggregator whose log channel records sends."""
+    channel = Mock()
+    channel.send = AsyncMock()
+    bot = Mock()
+    bot.get_channel = Mock(return_value=channel)
+    return DeletionLogAggregator(bot, LOG_CHANNEL_ID, **kwargs), channel
+
+
+def make_bulk_payload(message_ids, cached_messages, channel_id=1):
+    """Create a mock bulk deletion event."""
+    payload = Mock()
+    payload.message_ids = set(message_ids)
+    payload.cached_messages = cached_messages
+    payload.channel_id = channel_id
+    return payload
+
+
+class TestDeletionLogAggregator:
+    """Tests for DeletionLogAggregator class."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_sends_ten_embeds_per_message(self):
+        """Test that a 25 message purge is logged in three sends."""
+        aggregator, channel = make_aggregator(flush_interval=0)
+        cached = [make_message(MESSAGE_ID + i, "x") for i in range(5)]
+        payload = make_bulk_payload([MESSAGE_ID + i for i in range(25)], cached)
+
+        aggregator.log_raw_bulk_delete(payload)
+        await aggregator.flush()
+
+        sizes = [len(call.kwargs["embeds"]) for call in channel.send.await_args_list]
+        assert sizes == [10, 10, 5]
+        assert aggregator.sent == 25
+        assert aggregator.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_total_length_limit(self):
+        """Test that long embeds are split to stay under 6000 characters."""
+        aggregator, channel = make_aggregator()
+        for i in range(6):
+            aggregator.log_message(make_message(MESSAGE_ID + i, "y" * 1024))
+        await aggregator.flush()
+
+        for call in channel.send.await_args_list:
+            assert sum(len(embed) for embed in call.kwargs["embeds"]) <= 6000
+        assert aggregator.sent == 6
+        assert channel.send.await_count > 1
+
+    @pytest.mark.asyncio
+    async def test_events_are_buffered_until_the_window_closes(self):
+        """Test that events within the window are sent together."""
+        aggregator, channel = make_aggregator(flush_interval=0.05)
+        for i in range(3):
+            aggregator.log_message(make_message(MESSAGE_ID + i))
+        channel.send.assert_not_called()
+
+        await asyncio.sleep(0.1)
+
+        channel.send.assert_awaited_once()
+        assert len(channel.send.await_args.kwargs["embeds"]) == 3
+
+    def test_ignores_bots_and_log_channel(self):
+        """Test that bot messages and the log channel itself are not logged."""
+        aggregator, _ = make_aggregator()
+        aggregator.log_message(make_message(MESSAGE_ID, bot=True))
+        aggregator.log_raw_bulk_delete(
+            make_bulk_payload([MESSAGE_ID], [], channel_id=LOG_CHANNEL_ID)
+        )
+        assert aggregator.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_and_failures_are_counted(self):
+        """Test that dropped embeds are counted on overflow and send errors."""
+        aggregator, channel = make_aggregator(flush_interval=60, max_backlog=3)
+        for i in range(5):
+            aggregator.log_message(make_message(MESSAGE_ID + i))
+        assert (aggregator.backlog, aggregator.dropped) == (3, 2)
+
+        channel.send.side_effect = discord.HTTPException(Mock(status=429), "slow")
+        await aggregator.flush()
+
+        assert (aggregator.sent, aggregator.dropped, aggregator.backlog) == (0, 5, 0)
+        aggregator._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_uncached_deletions_use_message_cache(self):
+        """Test that content missing from discord.py is recovered from memory."""
+        cache = MessageContentCache(max_size=10)
+        cache.put(
+            CachedMessage(MESSAGE_ID, 1, 2, "Brother", "+5 Evan x", datetime.now())
+        )
+        aggregator, _ = make_aggregator(flush_interval=60, message_cache=cache)
+        payload = Mock()
+        payload.cached_message = None
+        payload.message_id = MESSAGE_ID
+        payload.channel_id = 1
+
+        aggregator.log_raw_delete(payload)
+        aggregator.log_raw_bulk_delete(make_bulk_payload([MESSAGE_ID + 1], []))
+
+        embeds = list(aggregator._buffer)
+        assert embeds[0].fields[-1].value == "+5 Evan x"
+        assert embeds[1].fields[-1].value == "*Content unavailable*"
+        aggregator._flush_task.cancel()
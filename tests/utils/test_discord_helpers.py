@@ -7,39 +7,109 @@ from unittest.mock import AsyncMock, Mock
 
 from utils.discord_helpers import (
     format_approval_status,
-    format_approval_confirmation,
-    format_pending_points_list,
     format_point_entry_detailed,
     format_point_entry_summary,
-    format_rankings_text,
-    send_chunked_message,
+    iter_approval_confirmation_chunks,
+    iter_embed_batches,
+    iter_flagged_points_chunks,
+    iter_packed_chunks,
+    iter_point_history_chunks,
+    iter_rankings_chunks,
+    iter_review_note_chunks,
+    send_chunks,
 )
-from PledgePoints.models import PointEntry
+from PledgePoints.models import PointEntry, PointEvent, ReviewResult
 
 
-class TestSendChunkedMessage:
-    """Tests for send_chunked_message function."""
+class TestSendChunks:
+    """Tests for send_chunks function."""
 
     @pytest.mark.asyncio
-    async def test_short_message_single_send(self, mock_discord_interaction):
-        """Test that short messages are sent as a single message."""
-        short_message = "This is a short message"
+    async def test_sends_each_chunk(self, mock_discord_interaction):
+        """Test that each chunk is sent as its own plain message."""
+        await send_chunks(mock_discord_interaction, iter(["one", "two"]))
 
-        await send_chunked_message(mock_discord_interaction, short_message)
-
-        mock_discord_interaction.followup.send.assert_called_once_with(short_message)
+        sent = [c.args[0] for c in mock_discord_interaction.followup.send.call_args_list]
+        assert sent == ["one", "two"]
 
     @pytest.mark.asyncio
-    async def test_long_message_chunked(self, mock_discord_interaction):
-        """Test that long messages are split into chunks."""
-        long_message = "A" * 2500  # Exceeds default chunk size of 1900
-
-        await send_chunked_message(
-            mock_discord_interaction, long_message, chunk_size=1000
+    async def test_embed_mode_sends_embeds(self, mock_discord_interaction):
+        """Test that embed mode packs the chunks into embed descriptions."""
+        await send_chunks(
+            mock_discord_interaction, iter(["**ID: 1**\n", "**ID: 2**\n"]), use_embeds=True
         )
 
-        # Should be called 3 times (2500 chars / 1000 chunk_size = 3 chunks)
-        assert mock_discord_interaction.followup.send.call_count == 3
+        kwargs = mock_discord_interaction.followup.send.call_args.kwargs
+        assert [embed.description for embed in kwargs["embeds"]] == [
+            "**ID: 1**\n**ID: 2**\n"
+        ]
+        assert mock_discord_interaction.followup.send.call_count == 1
+
+
+def make_entries_text(count, lines_per_entry=7):
+    """Build text shaped like a formatted list of detailed entries."""
+    return "".join(
+        f"**ID: {n}**\n" + "💬 Comment: **bold** text\n" * lines_per_entry + "\n"
+        for n in range(count)
+    )
+
+
+def pack_text(text, chunk_size):
+    """Pack a whole text the way the streaming formatters pack their pieces."""
+    return list(iter_packed_chunks([text], chunk_size))
+
+
+class TestPackText:
+    """Tests for packing whole text with iter_packed_chunks."""
+
+    def test_never_splits_entries(self):
+        """Test that every chunk holds whole entries and the text survives."""
+        text = make_entries_text(100)
+        chunks = pack_text(text, chunk_size=500)
+
+        assert "".join(chunks) == text
+        for chunk in chunks:
+            assert len(chunk) <= 500
+            assert chunk.startswith("**ID: ")
+            assert chunk.endswith("\n\n")
+
+    def test_packs_as_full_as_possible(self):
+        """Test that no chunk could have taken the next entry."""
+        text = make_entries_text(100)
+        entry_length = len(text) // 100
+        chunks = pack_text(text, chunk_size=500)
+
+        assert all(len(chunk) + entry_length > 500 for chunk in chunks[:-1])
+
+    def test_long_entries_split_on_lines(self):
+        """Test that an entry over the limit is split between lines."""
+        text = "**bold one**\n**bold two**\n**bold three**\n"
+        chunks = pack_text(text, chunk_size=30)
+
+        assert chunks == ["**bold one**\n**bold two**\n", "**bold three**\n"]
+
+
+class TestEmbedBatches:
+    """Tests for iter_embed_batches function."""
+
+    def test_respects_discord_limits(self):
+        """Test that batches stay within Discord's per-message embed limits."""
+        text = make_entries_text(500)
+        batches = list(iter_embed_batches(pack_text(text, 1900)))
+
+        descriptions = [e.description for batch in batches for e in batch]
+        assert "".join(descriptions) == text
+        for batch in batches:
+            assert len(batch) <= 10
+            assert sum(len(e.description) for e in batch) <= 6000
+            assert all(len(e.description) <= 4096 for e in batch)
+        # Far fewer requests than one plain message per 1900 characters
+        assert len(batches) < len(pack_text(text, 1900)) / 2
+
+    def test_short_text_single_embed(self):
+        """Test that short text becomes a single embed."""
+        batches = list(iter_embed_batches(["hello"]))
+        assert [[e.description for e in batch] for batch in batches] == [["hello"]]
 
 
 class TestFormatApprovalStatus:
@@ -152,99 +222,155 @@ class TestFormatPointEntryDetailed:
         assert "2025-01-01" in result
 
 
-class TestFormatRankingsText:
-    """Tests for format_rankings_text function."""
+def make_pending_entries(count):
+    """Create pending point entries with distinct IDs."""
+    return [
+        PointEntry(
+            entry_id=i,
+            time=datetime(2025, 1, 1, 12, 0, 0),
+            brother="John",
+            point_change=10,
+            pledge="Jake",
+            comment="Good",
+        )
+        for i in range(1, count + 1)
+    ]
 
-    def test_empty_rankings(self):
-        """Test handling of empty rankings."""
-        result = format_rankings_text([])
 
-        assert "No rankings data available" in result
+class TestStreamingFormatters:
+    """Tests for the iter_*_chunks formatters."""
 
     def test_rankings_with_medals(self):
-        """Test that top 3 get medal emojis."""
-        rankings = [
-            ("Jake", 100),
-            ("John", 80),
-            ("Mike", 60),
-            ("Tom", 40),
-        ]
+        """Test that the top 3 get medal emojis and the rest are numbered."""
+        rankings = [("Jake", 100), ("John", 80), ("Mike", 60), ("Tom", 40)]
 
-        result = format_rankings_text(rankings)
+        text = "".join(iter_rankings_chunks(rankings))
 
-        assert "🥇" in result  # 1st place
-        assert "🥈" in result  # 2nd place
-        assert "🥉" in result  # 3rd place
-        assert "4." in result  # 4th place numbered
-        assert "Jake" in result
-        assert "100" in result
+        assert "🥇 **Jake**: 100 points" in text
+        assert "🥈" in text and "🥉" in text
+        assert "4. **Tom**" in text
 
+    def test_chunks_keep_entries_whole(self):
+        """Test that detailed entries are never split across chunks."""
+        entries = make_pending_entries(200)
+        chunks = list(iter_flagged_points_chunks(entries, chunk_size=1000))
 
-class TestFormatPendingPointsList:
-    """Tests for format_pending_points_list function."""
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert all(chunk.endswith("\n\n") for chunk in chunks[:-1])
+        assert sum(chunk.count("**ID: ") for chunk in chunks) == 200
 
-    def test_empty_pending_list(self):
-        """Test handling of empty pending points."""
-        result = format_pending_points_list([])
+    def test_first_chunk_before_rest_formatted(self):
+        """Test that entries are only formatted as chunks are consumed."""
+        consumed = []
 
-        assert "No pending points found" in result
+        def entries():
+            for entry in make_pending_entries(500):
+                consumed.append(entry)
+                yield entry
 
-    def test_pending_list_formatting(self):
-        """Test formatting of pending points list."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
-                approval_status="pending",
-            ),
+        next(iter_flagged_points_chunks(entries(), chunk_size=1000))
+
+        assert len(consumed) < 20
+
+    def test_confirmation_chunks(self):
+        """Test confirmation chunks for all pending entries."""
+        entries = make_pending_entries(300)
+        chunks = list(
+            iter_approval_confirmation_chunks(entries, approved=True, all_pending=True)
+        )
+
+        assert len(chunks) > 1
+        assert chunks[0].startswith("✅ **Approved ALL 300 point submission(s):**")
+        assert sum(chunk.count("**ID ") for chunk in chunks) == 300
+
+    def test_empty_inputs(self):
+        """Test that empty inputs yield a single explanatory chunk."""
+        assert list(iter_rankings_chunks([])) == ["No rankings data available."]
+        assert list(iter_approval_confirmation_chunks([])) == [
+            "No entries to confirm."
         ]
 
-        result = format_pending_points_list(entries)
 
-        assert "Pending Point Submissions" in result
-        assert "ID: 1" in result
+class TestReviewNotes:
+    """Tests for iter_review_note_chunks function."""
+
+    def test_notes_for_unreviewed_ids(self):
+        """Test that replays, already reviewed entries and unknown IDs are noted."""
+        entry = PointEntry(
+            datetime(2025, 1, 1),
+            5,
+            "Evan",
+            "Ann",
+            "x",
+            entry_id=2,
+            approval_status="approved",
+            approved_by="Alice",
+        )
+        result = ReviewResult(already_reviewed=[entry], missing=[7, 8], replayed=True)
+
+        text = "".join(iter_review_note_chunks(result))
 
+        assert "already processed" in text
+        assert "ID 2 is already approved by Alice" in text
+        assert "No point entries with ID 7, 8" in text
 
-class TestFormatApprovalConfirmation:
-    """Tests for format_approval_confirmation function."""
+    def test_no_notes_when_everything_was_reviewed(self):
+        """Test that a fully applied review produces no notes."""
+        assert list(iter_review_note_chunks(ReviewResult())) == []
 
-    def test_approval_confirmation(self):
-        """Test approval confirmation message."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
-            ),
-        ]
 
-        result = format_approval_confirmation(entries, approved=True)
+class TestPointHistory:
+    """Tests for iter_point_history_chunks function."""
 
-        assert "✅" in result
-        assert "Approved" in result
-        assert "1 point submission" in result
-
-    def test_rejection_confirmation(self):
-        """Test rejection confirmation message."""
-        entries = [
-            PointEntry(
-                entry_id=1,
-                time=datetime.now(),
-                brother="John",
-                point_change=10,
-                pledge="Jake",
-                comment="Good",
+    def test_history_lists_each_change(self):
+        """Test that the history shows the entry and one line per event."""
+        entry = PointEntry(datetime(2025, 1, 1), 5, "Evan", "Ann", "x", entry_id=2)
+        events = [
+            PointEvent(1, 2, "pending", "approved", "Alice", datetime(2025, 1, 2)),
+            PointEvent(
+                2, 2, "approved", "approved", None, datetime(2025, 1, 3), "edited"
             ),
         ]
 
-        result = format_approval_confirmation(entries, approved=False)
+        text = "".join(iter_point_history_chunks(entry, events))
 
-        assert "❌" in result
-        assert "Rejected" in result
+        assert "History - ID 2" in text
+        assert "pending → **approved** by Alice" in text
+        assert "flagged for review (edited)" in text
+
+    def test_cleared_flag_names_resolver(self):
+        """Test that a reviewer clearing a flag is shown with their name."""
+        entry = PointEntry(datetime(2025, 1, 1), 5, "Evan", "Ann", "x", entry_id=2)
+        events = [PointEvent(3, 2, "approved", "approved", "Bob", datetime(2025, 1, 4))]
+
+        text = "".join(iter_point_history_chunks(entry, events))
+
+        assert "flag cleared by Bob" in text
+
+
+class TestFlaggedPoints:
+    """Tests for iter_flagged_points_chunks function."""
+
+    def test_lists_entries_with_reason(self):
+        """Test that flagged entries are listed with their review reason."""
+        entry = PointEntry(
+            datetime(2025, 1, 1),
+            5,
+            "Evan",
+            "Ann",
+            "x",
+            approval_status="approved",
+            approved_by="Alice",
+            review_reason="source message edited",
+            entry_id=7,
+        )
+
+        text = "".join(iter_flagged_points_chunks([entry]))
+
+        assert "ID: 7" in text
+        assert "source message edited" in text
+        assert "/resolve_flagged_points" in text
+
+    def test_empty(self):
+        """Test the message shown when nothing is flagged."""
+        assert list(iter_flagged_points_chunks([])) == ["No flagged points found."]
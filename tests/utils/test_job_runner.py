@@ -0,0 +1,141 @@
+"""Unit tests for the background job runner."""
+
+import asyncio
+
+import pytest
+
+from utils.job_runner import JobRunner
+
+
+async def wait_until_done(runner, job):
+    """Wait for a job to reach a final status."""
+    while not job.done:
+        await asyncio.sleep(0.001)
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_records_summary(self):
+        """Test that a job runs and its return value becomes the summary."""
+        runner = JobRunner(workers=1)
+        finished = []
+
+        async def work(job):
+            return f"ran #{job.job_id}"
+
+        async def on_finish(job):
+            finished.append(job.status)
+
+        job = runner.submit("test", work, requested_by="Bro", on_finish=on_finish)
+        assert job.status == "queued"
+        await wait_until_done(runner, job)
+        await asyncio.sleep(0)
+
+        assert (job.status, job.summary) == ("completed", "ran #1")
+        assert job.duration is not None
+        assert finished == ["completed"]
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_is_bounded(self):
+        """Test that no more jobs run at once than there are workers."""
+        runner = JobRunner(workers=2)
+        running = 0
+        peak = 0
+
+        async def work(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        jobs = [runner.submit(f"job {i}", work) for i in range(6)]
+        for job in jobs:
+            await wait_until_done(runner, job)
+
+        assert peak == 2
+        assert all(job.status == "completed" for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded(self):
+        """Test that an exception fails the job without stopping the worker."""
+        runner = JobRunner(workers=1)
+
+        async def fail(job):
+            raise RuntimeError("boom")
+
+        async def work(job):
+            return "ok"
+
+        failed = runner.submit("fail", fail)
+        ok = runner.submit("ok", work)
+        await wait_until_done(runner, ok)
+
+        assert (failed.status, failed.error) == ("failed", "boom")
+        assert ok.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued(self):
+        """Test cancelling a running job and a job still in the queue."""
+        runner = JobRunner(workers=1)
+        started = asyncio.Event()
+
+        async def block(job):
+            started.set()
+            await asyncio.sleep(10)
+
+        running = runner.submit("block", block)
+        queued = runner.submit("block", block)
+        await started.wait()
+
+        assert runner.cancel(queued.job_id)
+        assert queued.status == "cancelled" and queued.started_at is None
+        assert runner.cancel(running.job_id)
+        await wait_until_done(runner, running)
+
+        assert running.status == "cancelled"
+        assert not runner.cancel(running.job_id)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_job_notifies(self):
+        """Test that cancelling a queued job reports it through a tracked task."""
+        runner = JobRunner(workers=1)
+        started = asyncio.Event()
+        notified = []
+
+        async def block(job):
+            started.set()
+            await asyncio.sleep(10)
+
+        async def on_finish(job):
+            notified.append(job.status)
+
+        running = runner.submit("block", block)
+        queued = runner.submit("block", block, on_finish=on_finish, owner_id=7)
+        await started.wait()
+
+        assert queued.owner_id == 7
+        assert runner.cancel(queued.job_id)
+        assert len(runner._background_tasks) == 1
+        await asyncio.gather(*runner._background_tasks)
+
+        assert notified == ["cancelled"]
+        assert not runner._background_tasks
+        runner.cancel(running.job_id)
+        await wait_until_done(runner, running)
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        """Test that only the newest finished jobs are kept."""
+        runner = JobRunner(workers=1, history_size=3)
+
+        async def work(job):
+            return None
+
+        jobs = [runner.submit(f"job {i}", work) for i in range(5)]
+        await wait_until_done(runner, jobs[-1])
+
+        assert [job.job_id for job in runner.list_jobs()] == [5, 4, 3]
+        assert runner.get(1) is None
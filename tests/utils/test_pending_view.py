@@ -0,0 +1,137 @@
+"""Unit tests for the paginated pending points view."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytz
+
+from PledgePoints.models import PointEntry, PointFilter
+from PledgePoints.roster import PledgeRoster
+from PledgePoints.sqlutils import DatabaseManager
+from utils.pending_view import PendingPointsView
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fixture providing a database with 25 pending and 5 approved entries."""
+    db_manager = DatabaseManager(str(tmp_path / "points.db"))
+    db_manager.add_point_entries(
+        [
+            PointEntry(BASE_TIME, 1, "Evan" if i % 2 else "Milo", "Bro", f"#{i}")
+            for i in range(1, 31)
+        ]
+    )
+    db_manager.approve_points([26, 27, 28, 29, 30], "Admin")
+    return db_manager
+
+
+def make_view(db_manager, page_size=10):
+    """Create a view for owner 1 with the first page loaded."""
+    view = PendingPointsView(
+        db_manager, PledgeRoster(["Evan", "Milo"]), owner_id=1, page_size=page_size
+    )
+    view.load()
+    return view
+
+
+def page_ids(view):
+    """Get the entry IDs on the view's current page."""
+    return [entry.entry_id for entry in view.entries]
+
+
+class TestGetPointsPage:
+    """Tests for DatabaseManager.get_points_page."""
+
+    def test_pages_forward_and_back(self, db_manager):
+        """Test that keyset pages follow and precede their anchors."""
+        pending = PointFilter(statuses=("pending",))
+
+        first, more = db_manager.get_points_page(pending, limit=10)
+        assert [e.entry_id for e in first] == list(range(1, 11)) and more
+
+        last, more = db_manager.get_points_page(pending, after_id=20, limit=10)
+        assert [e.entry_id for e in last] == list(range(21, 26)) and not more
+
+        before, more = db_manager.get_points_page(pending, before_id=21, limit=10)
+        assert [e.entry_id for e in before] == list(range(11, 21)) and more
+
+
+class TestPendingPointsView:
+    """Tests for PendingPointsView navigation."""
+
+    @pytest.mark.asyncio
+    async def test_first_page(self, db_manager):
+        """Test that the first page disables Prev and enables Next."""
+        view = make_view(db_manager)
+
+        assert page_ids(view) == list(range(1, 11))
+        assert view.prev_button.disabled and not view.next_button.disabled
+        assert "ID: 1" in view.build_embed().description
+
+    @pytest.mark.asyncio
+    async def test_next_and_prev_buttons(self, db_manager):
+        """Test that the buttons move between pages and edit the message."""
+        view = make_view(db_manager)
+        interaction = Mock()
+        interaction.response.edit_message = AsyncMock()
+
+        await view.next_button.callback(interaction)
+        await view.next_button.callback(interaction)
+        assert page_ids(view) == list(range(21, 26))
+        assert view.next_button.disabled
+
+        await view.prev_button.callback(interaction)
+        assert page_ids(view) == list(range(11, 21))
+        assert not view.prev_button.disabled
+        assert interaction.response.edit_message.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_pledge_filter(self, db_manager):
+        """Test that selecting a pledge restarts the list filtered to them."""
+        view = make_view(db_manager)
+        view.pledge = "Evan"
+        view.load()
+
+        assert page_ids(view) == [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+        assert "for Evan" in view.build_embed().title
+
+    @pytest.mark.asyncio
+    async def test_emptied_page_falls_back(self, db_manager):
+        """Test that paging past entries approved meanwhile shows the last page."""
+        view = make_view(db_manager)
+        db_manager.approve_points(list(range(11, 26)), "Admin")
+
+        view.load(after_id=10)
+
+        assert page_ids(view) == list(range(1, 11))
+        assert view.next_button.disabled
+
+    @pytest.mark.asyncio
+    async def test_long_entries_are_carried_over(self, db_manager):
+        """Test that entries overflowing the embed start the next page."""
+        for point_id in range(1, 6):
+            with db_manager.get_connection() as conn:
+                conn.execute(
+                    "UPDATE Points SET Comment = ? WHERE id = ?",
+                    ("x" * 1500, point_id),
+                )
+        view = make_view(db_manager)
+
+        assert page_ids(view) == [1, 2]
+        assert len(view.build_embed().description) <= 4096
+        view.load(after_id=2)
+        assert page_ids(view)[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_other_users_are_refused(self, db_manager):
+        """Test that only the command's user can use the controls."""
+        view = make_view(db_manager)
+        interaction = Mock()
+        interaction.user.id = 2
+        interaction.response.send_message = AsyncMock()
+
+        assert await view.interaction_check(interaction) is False
+        interaction.response.send_message.assert_awaited_once()
@@ -0,0 +1,306 @@
+"""
+Batched audit logging of deleted messages.
+
+Deletion events are turned into embeds and buffered for a short window, then
+sent to the log channel up to ten embeds per message. A moderator purging a
+hundred messages produces ten sends instead of a hundred, and raw events
+mean uncached and bulk-deleted messages are logged too.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Set
+
+import discord
+import pytz
+
+from PledgePoints.constants import (
+    DELETION_LOG_FLUSH_SECONDS,
+    DELETION_LOG_MAX_BACKLOG,
+    DISCORD_EMBEDS_MAX_TOTAL_LENGTH,
+    DISCORD_MAX_EMBEDS_PER_MESSAGE,
+)
+from PledgePoints.message_cache import CachedMessage, MessageContentCache
+
+
+def _truncate_content(content: str) -> str:
+    """Fit message content into an embed field value."""
+    content = content if content else "*No text content*"
+    if len(content) > 1024:
+        content = content[:1021] + "..."
+    return content
+
+
+def build_deleted_message_embed(message: discord.Message) -> discord.Embed:
+    """
+    Build the audit log embed for a deleted message whose content is known.
+
+    Args:
+        message: The deleted message, from the bot's message cache
+
+    Returns:
+        discord.Embed: Embed describing the author, channel and content
+    """
+    embed = discord.Embed(
+        title="🗑️ Message Deleted",
+        color=discord.Color.red(),
+        timestamp=datetime.now(pytz.UTC),
+    )
+
+    # Add message details
+    embed.add_field(
+        name="Author",
+        value=f"{message.author.mention} ({message.author.name}#{message.author.discriminator})",
+        inline=True,
+    )
+    embed.add_field(
+        name="Channel",
+        value=f"{message.channel.mention} ({message.channel.name})",
+        inline=True,
+    )
+    embed.add_field(name="Message ID", value=message.id, inline=True)
+
+    # Add message content (truncate if too long)
+    embed.add_field(
+        name="Content", value=_truncate_content(message.content), inline=False
+    )
+
+    # Add attachments info if any
+    if message.attachments:
+        attachment_names = [att.filename for att in message.attachments]
+        embed.add_field(
+            name="Attachments", value=", ".join(attachment_names), inline=False
+        )
+
+    # Add embeds info if any
+    if message.embeds:
+        embed.add_field(
+            name="Embeds",
+            value=f"{len(message.embeds)} embed(s) were present",
+            inline=False,
+        )
+
+    return embed
+
+
+def build_remembered_deletion_embed(entry: CachedMessage) -> discord.Embed:
+    """
+    Build the audit log embed for a deleted message recalled from memory.
+
+    Used when discord.py no longer had the message but ingestion had
+    recorded it in the bot's own message cache.
+
+    Args:
+        entry: Cached content and author of the deleted message
+
+    Returns:
+        discord.Embed: Embed describing the author, channel and content
+    """
+    embed = discord.Embed(
+        title="🗑️ Message Deleted",
+        color=discord.Color.red(),
+        timestamp=datetime.now(pytz.UTC),
+    )
+    embed.add_field(
+        name="Author", value=f"<@{entry.author_id}> ({entry.author_name})", inline=True
+    )
+    embed.add_field(name="Channel", value=f"<#{entry.channel_id}>", inline=True)
+    embed.add_field(name="Message ID", value=entry.message_id, inline=True)
+    embed.add_field(
+        name="Content", value=_truncate_content(entry.content), inline=False
+    )
+    return embed
+
+
+def build_uncached_deletion_embed(message_id: int, channel_id: int) -> discord.Embed:
+    """
+    Build the audit log embed for a deleted message that was not cached.
+
+    Discord only sends the IDs of deleted messages, so the content and author
+    of messages sent before the bot started (or evicted from its cache) are
+    unknown.
+
+    Args:
+        message_id: ID of the deleted message
+        channel_id: ID of the channel it was deleted from
+
+    Returns:
+        discord.Embed: Embed with the channel, message ID and send time
+    """
+    embed = discord.Embed(
+        title="🗑️ Message Deleted (not cached)",
+        color=discord.Color.dark_red(),
+        timestamp=datetime.now(pytz.UTC),
+    )
+    embed.add_field(name="Channel", value=f"<#{channel_id}>", inline=True)
+    embed.add_field(name="Message ID", value=message_id, inline=True)
+    sent_at = discord.utils.snowflake_time(message_id)
+    embed.add_field(
+        name="Sent", value=discord.utils.format_dt(sent_at, style="f"), inline=True
+    )
+    embed.add_field(name="Content", value="*Content unavailable*", inline=False)
+    return embed
+
+
+class DeletionLogAggregator:
+    """
+    Buffers deleted-message embeds and sends them to the log channel in batches.
+
+    The first event after a flush starts a timer; everything logged before it
+    fires goes out together, packed into as few messages as Discord's embed
+    limits allow.
+
+    Attributes:
+        bot (discord.Client): Bot used to look up the log channel
+        channel_id (int): ID of the deleted messages log channel
+        flush_interval (float): Seconds events are buffered before sending
+        max_backlog (int): Most embeds held at once; older ones are dropped
+        message_cache (Optional[MessageContentCache]): Fallback source for the
+            content of messages discord.py did not have cached
+        sent (int): Number of embeds delivered
+        dropped (int): Number of embeds lost to overflow or failed sends
+    """
+
+    def __init__(
+        self,
+        bot: discord.Client,
+        channel_id: int,
+        flush_interval: float = DELETION_LOG_FLUSH_SECONDS,
+        max_backlog: int = DELETION_LOG_MAX_BACKLOG,
+        message_cache: Optional[MessageContentCache] = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            bot: Bot used to look up the log channel
+            channel_id: ID of the deleted messages log channel
+            flush_interval: Seconds events are buffered before sending
+            max_backlog: Most embeds held at once; older ones are dropped
+            message_cache: Fallback source for uncached message content
+        """
+        self.bot = bot
+        self.channel_id = channel_id
+        self.flush_interval = flush_interval
+        self.max_backlog = max_backlog
+        self.message_cache = message_cache
+        self.sent = 0
+        self.dropped = 0
+        self._buffer: Deque[discord.Embed] = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._reported_dropped = 0
+
+    @property
+    def backlog(self) -> int:
+        """Number of embeds waiting to be sent."""
+        return len(self._buffer)
+
+    def log_message(self, message: discord.Message) -> None:
+        """
+        Queue a deleted message whose content is known.
+
+        Bot messages and messages from the log channel itself are ignored.
+
+        Args:
+            message: The deleted message
+        """
+        if message.author.bot or message.channel.id == self.channel_id:
+            return
+        self._add(build_deleted_message_embed(message))
+
+    def log_raw_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """
+        Queue a single message deletion event.
+
+        Args:
+            payload: Raw deletion event, with the message if it was cached
+        """
+        if payload.cached_message is not None:
+            self.log_message(payload.cached_message)
+        elif payload.channel_id != self.channel_id:
+            self._log_uncached(payload.message_id, payload.channel_id)
+
+    def log_raw_bulk_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """
+        Queue every message removed by a bulk deletion (e.g. a moderator purge).
+
+        Args:
+            payload: Raw bulk deletion event
+        """
+        if payload.channel_id == self.channel_id:
+            return
+
+        cached_ids: Set[int] = set()
+        for message in sorted(payload.cached_messages, key=lambda m: m.id):
+            cached_ids.add(message.id)
+            self.log_message(message)
+        for message_id in sorted(payload.message_ids - cached_ids):
+            self._log_uncached(message_id, payload.channel_id)
+
+    def _log_uncached(self, message_id: int, channel_id: int) -> None:
+        """Queue a deletion discord.py had no copy of, using our cache if possible."""
+        entry = None
+        if self.message_cache is not None:
+            entry = self.message_cache.get(message_id)
+        if entry is not None:
+            self._add(build_remembered_deletion_embed(entry))
+        else:
+            self._add(build_uncached_deletion_embed(message_id, channel_id))
+
+    def _add(self, embed: discord.Embed) -> None:
+        """Buffer an embed and make sure a flush is scheduled."""
+        if len(self._buffer) >= self.max_backlog:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(embed)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Wait for the buffering window to close, then flush."""
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _next_batch(self) -> List[discord.Embed]:
+        """Take as many buffered embeds as fit in one Discord message."""
+        batch: List[discord.Embed] = []
+        total_length = 0
+        while self._buffer and len(batch) < DISCORD_MAX_EMBEDS_PER_MESSAGE:
+            length = len(self._buffer[0])
+            if batch and total_length + length > DISCORD_EMBEDS_MAX_TOTAL_LENGTH:
+                break
+            batch.append(self._buffer.popleft())
+            total_length += length
+        return batch
+
+    async def flush(self) -> None:
+        """Send every buffered embed to the log channel."""
+        if not self._buffer:
+            return
+
+        channel = self.bot.get_channel(self.channel_id)
+        if channel is None:
+            print(f"Warning: Could not find channel with ID {self.channel_id}")
+            self.dropped += len(self._buffer)
+            self._buffer.clear()
+            return
+
+        while self._buffer:
+            batch = self._next_batch()
+            try:
+                await channel.send(embeds=batch)
+                self.sent += len(batch)
+            except discord.HTTPException as e:
+                self.dropped += len(batch)
+                print(f"Error logging {len(batch)} deleted message(s): {str(e)}")
+
+        if self.dropped > self._reported_dropped:
+            self._reported_dropped = self.dropped
+            print(
+                f"Deletion log: {self.sent} sent, {self.dropped} dropped, "
+                f"{self.backlog} backlogged"
+            )
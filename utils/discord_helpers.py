@@ -7,38 +7,227 @@ such as chunking long messages, formatting responses, and handling embeds.
 Author: Warner (with AI assistance)
 """
 
+import re
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
 import discord
+import pytz
 
-from PledgePoints.constants import DISCORD_MESSAGE_SAFE_LENGTH, RANK_MEDALS
-from PledgePoints.models import PointEntry
+from PledgePoints.constants import (
+    DISCORD_EMBED_DESCRIPTION_MAX_LENGTH,
+    DISCORD_EMBEDS_MAX_TOTAL_LENGTH,
+    DISCORD_MAX_EMBEDS_PER_MESSAGE,
+    DISCORD_MESSAGE_SAFE_LENGTH,
+    RANK_MEDALS,
+)
+from PledgePoints.models import BackfillJob, Job, PointEntry, PointEvent, ReviewResult
 
+if TYPE_CHECKING:
+    # Only for annotations; sync imports the message pipeline, which is
+    # heavier than these formatters need
+    from PledgePoints.sync import IncrementalSync
 
-async def send_chunked_message(
+# Split point after each run of blank lines, so entries stay whole
+_PARAGRAPH_BREAK = re.compile(r"(?<=\n\n)(?!\n)")
+
+
+def _split_units(text: str, limit: int) -> Iterator[str]:
+    """
+    Split text into the largest pieces that should not be broken up.
+
+    Pieces are paragraphs (one entry of a formatted list, with its trailing
+    blank line), then single lines for paragraphs over the limit, then hard
+    slices for single lines over the limit. Concatenating the pieces gives
+    back the original text.
+
+    Args:
+        text: Text to split
+        limit: Maximum length of a piece
+
+    Yields:
+        str: Consecutive pieces of the text, each at most limit characters
+    """
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        if len(paragraph) <= limit:
+            yield paragraph
+            continue
+        for line in paragraph.splitlines(keepends=True):
+            if len(line) <= limit:
+                yield line
+            else:
+                for i in range(0, len(line), limit):
+                    yield line[i : i + limit]
+
+
+def iter_packed_chunks(
+    pieces: Iterable[str], chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH
+) -> Iterator[str]:
+    """
+    Pack pieces of text into chunks, yielding each chunk as soon as it is full.
+
+    Pieces are kept whole where they fit; a piece longer than the chunk size
+    is split on paragraphs and lines first. Pieces are only read as chunks
+    are consumed, so the first chunk can be sent before later pieces exist.
+
+    Args:
+        pieces: Pieces of text in order, e.g. one formatted entry each
+        chunk_size: Maximum size of each chunk
+
+    Yields:
+        str: Chunks in order, each at most chunk_size characters
+    """
+    parts: List[str] = []
+    length = 0
+    for piece in pieces:
+        if len(piece) <= chunk_size:
+            units: Iterable[str] = (piece,)
+        else:
+            units = _split_units(piece, chunk_size)
+        for unit in units:
+            if parts and length + len(unit) > chunk_size:
+                yield "".join(parts)
+                parts.clear()
+                length = 0
+            parts.append(unit)
+            length += len(unit)
+    if parts:
+        yield "".join(parts)
+
+
+def iter_embed_batches(
+    pieces: Iterable[str],
+    color: Optional[discord.Color] = None,
+) -> Iterator[List[discord.Embed]]:
+    """
+    Pack pieces of text into embed descriptions, grouped into few messages.
+
+    Each description holds up to 4096 characters and each message up to 10
+    embeds, but Discord also caps the combined text of a message's embeds at
+    6000 characters, so a message is closed once the next piece would not fit
+    in what is left of that budget. Pieces are kept whole where they fit, as
+    in iter_packed_chunks, and each message is yielded as soon as it is full.
+
+    Args:
+        pieces: Pieces of text in order, e.g. chunks from an iter_*_chunks
+            formatter
+        color: Optional color for every embed
+
+    Yields:
+        List[discord.Embed]: Embeds to send in one message
+    """
+    embeds: List[discord.Embed] = []
+    budget = DISCORD_EMBEDS_MAX_TOTAL_LENGTH
+    parts: List[str] = []
+    length = 0
+
+    for piece in pieces:
+        for unit in _split_units(piece, DISCORD_EMBED_DESCRIPTION_MAX_LENGTH):
+            capacity = min(DISCORD_EMBED_DESCRIPTION_MAX_LENGTH, budget)
+            if length + len(unit) <= capacity:
+                parts.append(unit)
+                length += len(unit)
+                continue
+
+            # Close the current description
+            if parts:
+                embeds.append(discord.Embed(description="".join(parts), color=color))
+                budget -= length
+            if len(embeds) >= DISCORD_MAX_EMBEDS_PER_MESSAGE or len(unit) > min(
+                DISCORD_EMBED_DESCRIPTION_MAX_LENGTH, budget
+            ):
+                yield embeds
+                embeds = []
+                budget = DISCORD_EMBEDS_MAX_TOTAL_LENGTH
+            parts = [unit]
+            length = len(unit)
+
+    if parts:
+        embeds.append(discord.Embed(description="".join(parts), color=color))
+    if embeds:
+        yield embeds
+
+
+async def send_chunks(
     interaction: discord.Interaction,
-    text: str,
-    chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH,
+    chunks: Iterable[str],
+    use_embeds: bool = False,
 ) -> None:
     """
-    Send a long message by splitting it into chunks if necessary.
+    Send chunks from a streaming formatter as followup messages.
 
-    Discord has a 2000 character limit for messages. This function automatically
-    splits long messages into multiple followup messages if needed.
+    Each chunk is sent as soon as it is produced, so long outputs start
+    appearing before the rest has been formatted. With use_embeds, the chunks
+    are packed into embed descriptions instead, which fit up to 6000
+    characters in a single followup, so long lists take far fewer requests.
 
     Args:
         interaction: Discord interaction to send messages through
-        text: The full text to send (may exceed Discord's limit)
-        chunk_size: Maximum size of each chunk (default: 1900 for safety buffer)
+        chunks: Message-sized chunks, e.g. from an iter_*_chunks formatter
+        use_embeds: Send the chunks as batches of embeds rather than plain text
+    """
+    if use_embeds:
+        for embeds in iter_embed_batches(chunks):
+            await interaction.followup.send(embeds=embeds)
+        return
+
+    for chunk in chunks:
+        await interaction.followup.send(chunk)
+
+
+async def send_followup_or_channel(
+    interaction: discord.Interaction, text: str
+) -> None:
+    """
+    Send a followup, falling back to the channel if the interaction expired.
+
+    Interaction tokens are only valid for 15 minutes, so long-running commands
+    cannot rely on followups to report their result.
+
+    Args:
+        interaction: Discord interaction to respond to
+        text: Message to send
     """
-    if len(text) <= chunk_size:
+    try:
         await interaction.followup.send(text)
-    else:
-        # Split into chunks
-        chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
-        for chunk in chunks:
-            await interaction.followup.send(chunk)
+    except discord.HTTPException:
+        if interaction.channel is not None:
+            await interaction.channel.send(text)
+
+
+async def edit_original_response_quietly(
+    interaction: discord.Interaction, text: str
+) -> None:
+    """
+    Edit the original interaction response, ignoring expired tokens.
+
+    Args:
+        interaction: Discord interaction whose response to edit
+        text: New content of the response
+    """
+    try:
+        await interaction.edit_original_response(content=text)
+    except discord.HTTPException:
+        pass
+
+
+@lru_cache(maxsize=1024)
+def format_timestamp(value: datetime) -> str:
+    """
+    Format a timestamp for display.
+
+    Cached because entry times repeat across formatting calls (the same
+    entries are listed, approved and confirmed), and strftime dominates the
+    cost of formatting an entry.
+
+    Args:
+        value: Timestamp to format
+
+    Returns:
+        str: Timestamp as YYYY-MM-DD HH:MM:SS
+    """
+    return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
 def format_approval_status(entry: PointEntry) -> str:
@@ -56,17 +245,17 @@ def format_approval_status(entry: PointEntry) -> str:
     """
     if entry.approval_status == "approved":
         status = f"✅ **Approved** by {entry.approved_by}"
-        if entry.approval_timestamp:
-            status += f" on {entry.approval_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-        return status
     elif entry.approval_status == "rejected":
         status = f"❌ **Rejected** by {entry.approved_by}"
-        if entry.approval_timestamp:
-            status += f" on {entry.approval_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-        return status
+    elif entry.approval_status == "voided":
+        status = "🚫 **Voided**"
     else:
         return "⏳ **Pending Approval**"
 
+    if entry.approval_timestamp:
+        status += f" on {format_timestamp(entry.approval_timestamp)}"
+    return status
+
 
 def format_point_entry_summary(entry: PointEntry) -> str:
     """
@@ -81,6 +270,26 @@ def format_point_entry_summary(entry: PointEntry) -> str:
     return f"**ID {entry.entry_id}**: {entry.brother} → {entry.pledge} ({entry.point_change:+d} points)"
 
 
+def format_point_entry_choice(entry: PointEntry) -> str:
+    """
+    Format a point entry as an autocomplete choice label.
+
+    Args:
+        entry: Point entry to format
+
+    Returns:
+        str: ID, brother, pledge, points and comment, cut to Discord's
+        100 character limit for choice names
+    """
+    label = (
+        f"#{entry.entry_id}: {entry.brother} → {entry.pledge} "
+        f"({entry.point_change:+d}) {entry.comment}"
+    )
+    if len(label) > 100:
+        label = label[:99] + "…"
+    return label
+
+
 def format_point_entry_detailed(entry: PointEntry) -> str:
     """
     Format a point entry with full details for display.
@@ -94,86 +303,304 @@ def format_point_entry_detailed(entry: PointEntry) -> str:
     Returns:
         str: Multi-line formatted string with all entry details
     """
-    time_formatted = entry.time.strftime("%Y-%m-%d %H:%M:%S")
-    approval_info = format_approval_status(entry)
-
-    details = f"**ID: {entry.entry_id}**\n"
-    details += f"⏰ Time: {time_formatted}\n"
-    details += f"👤 Brother: {entry.brother}\n"
-    details += f"📊 Points: {entry.point_change:+d}\n"
-    details += f"🎯 Pledge: {entry.pledge}\n"
-    details += f"💬 Comment: {entry.comment}\n"
-    details += f"🔍 Status: {approval_info}\n"
-
-    return details
+    lines = [
+        f"**ID: {entry.entry_id}**\n",
+        f"⏰ Time: {format_timestamp(entry.time)}\n",
+        f"👤 Brother: {entry.brother}\n",
+        f"📊 Points: {entry.point_change:+d}\n",
+        f"🎯 Pledge: {entry.pledge}\n",
+        f"💬 Comment: {entry.comment}\n",
+        f"🔍 Status: {format_approval_status(entry)}\n",
+    ]
+    if entry.review_reason:
+        lines.append(f"⚠️ Review: {entry.review_reason}\n")
+
+    return "".join(lines)
+
+
+def format_point_event(event: PointEvent) -> str:
+    """
+    Format one audit log event as a single line.
 
+    Args:
+        event: Status change to format
 
-def format_rankings_text(rankings: List[tuple[str, int]]) -> str:
+    Returns:
+        str: Line with the time, the status change, who made it and why
+    """
+    when = f"{format_timestamp(event.time)} UTC"
+    if event.old_status == event.new_status:
+        # Only the review reason changed: an approved entry was flagged, or
+        # a reviewer kept it and cleared the flag
+        if event.note:
+            line = f"{when}: flagged for review"
+        else:
+            line = f"{when}: flag cleared"
+            if event.actor:
+                line += f" by {event.actor}"
+    else:
+        old_status = event.old_status or "created"
+        line = f"{when}: {old_status} → **{event.new_status}**"
+        if event.actor:
+            line += f" by {event.actor}"
+    if event.note:
+        line += f" ({event.note})"
+    return line
+
+
+def _point_history_pieces(
+    entry: PointEntry, events: List[PointEvent]
+) -> Iterator[str]:
+    """Yield the entry's details followed by one line per status change."""
+    yield f"📜 **Point Entry History - ID {entry.entry_id}**\n\n"
+    yield format_point_entry_detailed(entry) + "\n"
+    if not events:
+        yield "No status changes recorded."
+        return
+    for event in events:
+        yield f"• {format_point_event(event)}\n"
+
+
+def iter_point_history_chunks(
+    entry: PointEntry,
+    events: List[PointEvent],
+    chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH,
+) -> Iterator[str]:
     """
-    Format pledge rankings as text with medal emojis for top 3.
+    Format a point entry and its status changes as message-sized chunks.
 
     Args:
-        rankings: List of (pledge_name, total_points) tuples sorted by points descending
+        entry: Point entry as it is now
+        events: Its status changes from the audit log, oldest first
+        chunk_size: Maximum size of each chunk
 
-    Returns:
-        str: Formatted rankings text with medals and point totals
+    Yields:
+        str: Chunks of the history, never splitting an event's line
     """
-    if not rankings:
-        return "No rankings data available."
+    yield from iter_packed_chunks(_point_history_pieces(entry, events), chunk_size)
 
-    text = "🏆 **Pledge Rankings by Total Points**\n\n"
 
+def _rankings_pieces(rankings: List[tuple[str, int]]) -> Iterator[str]:
+    """Yield the header and one line per pledge of the rankings text."""
+    yield "🏆 **Pledge Rankings by Total Points**\n\n"
     for i, (pledge, total_points) in enumerate(rankings, 1):
         # Add medal emoji for top 3, otherwise use number
         medal = RANK_MEDALS.get(i, f"{i}.")
-        text += f"{medal} **{pledge}**: {total_points:,} points\n"
+        yield f"{medal} **{pledge}**: {total_points:,} points\n"
 
-    return text
+
+def iter_rankings_chunks(
+    rankings: List[tuple[str, int]], chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH
+) -> Iterator[str]:
+    """
+    Format pledge rankings as message-sized chunks.
+
+    Args:
+        rankings: List of (pledge_name, total_points) tuples sorted by points descending
+        chunk_size: Maximum size of each chunk
+
+    Yields:
+        str: Chunks of the rankings text, never splitting a pledge's line
+    """
+    if not rankings:
+        yield "No rankings data available."
+        return
+    yield from iter_packed_chunks(_rankings_pieces(rankings), chunk_size)
+
+
+def _flagged_pieces(entries: Iterable[PointEntry]) -> Iterator[str]:
+    """Yield the header and one detailed block per flagged entry."""
+    yield "⚠️ **Approved Points Flagged for Review**\n\n"
+    for entry in entries:
+        yield format_point_entry_detailed(entry) + "\n"
+    yield "Keep or void them with /resolve_flagged_points."
 
 
-def format_pending_points_list(entries: List[PointEntry]) -> str:
+def iter_flagged_points_chunks(
+    entries: List[PointEntry], chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH
+) -> Iterator[str]:
     """
-    Format a list of pending point entries for display.
+    Format approved entries flagged for review as message-sized chunks.
 
     Args:
-        entries: List of pending point entries
+        entries: Flagged entries
+        chunk_size: Maximum size of each chunk
 
-    Returns:
-        str: Formatted list of pending points with details
+    Yields:
+        str: Chunks of the flagged list, never splitting an entry that fits
     """
     if not entries:
-        return "No pending points found."
+        yield "No flagged points found."
+        return
+    yield from iter_packed_chunks(_flagged_pieces(entries), chunk_size)
 
-    text = "📋 **Pending Point Submissions**\n\n"
 
-    for entry in entries:
-        text += format_point_entry_detailed(entry) + "\n"
+def _confirmation_pieces(
+    entries: List[PointEntry], approved: bool, all_pending: bool
+) -> Iterator[str]:
+    """Yield the header and one summary line per approved or rejected entry."""
+    action = "Approved" if approved else "Rejected"
+    if all_pending:
+        action += " ALL"
+    emoji = "✅" if approved else "❌"
 
-    return text
+    yield f"{emoji} **{action} {len(entries)} point submission(s):**\n\n"
+    for entry in entries:
+        yield format_point_entry_summary(entry) + "\n"
 
 
-def format_approval_confirmation(
-    entries: List[PointEntry], approved: bool = True
-) -> str:
+def iter_approval_confirmation_chunks(
+    entries: List[PointEntry],
+    approved: bool = True,
+    all_pending: bool = False,
+    chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH,
+) -> Iterator[str]:
     """
-    Format a confirmation message for approved or rejected points.
+    Format a confirmation for approved or rejected points as message-sized chunks.
 
     Args:
         entries: List of point entries that were approved/rejected
         approved: True for approval message, False for rejection
+        all_pending: Whether every pending entry was approved/rejected at once
+        chunk_size: Maximum size of each chunk
 
-    Returns:
-        str: Formatted confirmation message
+    Yields:
+        str: Chunks of the confirmation, never splitting an entry's line
     """
     if not entries:
-        return "No entries to confirm."
+        yield "No entries to confirm."
+        return
+    yield from iter_packed_chunks(
+        _confirmation_pieces(entries, approved, all_pending), chunk_size
+    )
+
+
+def _review_note_pieces(result: ReviewResult) -> Iterator[str]:
+    """Yield one line per part of a review request that changed nothing."""
+    if result.replayed:
+        yield "ℹ️ This request was already processed; nothing was changed again.\n"
+    for entry in result.already_reviewed:
+        reviewer = f" by {entry.approved_by}" if entry.approved_by else ""
+        yield f"⚠️ ID {entry.entry_id} is already {entry.approval_status}{reviewer}\n"
+    if result.missing:
+        yield "❓ No point entries with ID " + ", ".join(map(str, result.missing)) + "\n"
+
+
+def iter_review_note_chunks(
+    result: ReviewResult, chunk_size: int = DISCORD_MESSAGE_SAFE_LENGTH
+) -> Iterator[str]:
+    """
+    Explain as message-sized chunks why parts of a review changed nothing.
 
-    action = "Approved" if approved else "Rejected"
-    emoji = "✅" if approved else "❌"
+    Covers a request that was already processed, requested entries that
+    someone else reviewed first, and IDs that do not exist.
 
-    text = f"{emoji} **{action} {len(entries)} point submission(s):**\n\n"
+    Args:
+        result: Outcome of the review
+        chunk_size: Maximum size of each chunk
 
-    for entry in entries:
-        text += format_point_entry_summary(entry) + "\n"
+    Yields:
+        str: Chunks of notes; nothing if every requested entry was reviewed
+    """
+    yield from iter_packed_chunks(_review_note_pieces(result), chunk_size)
+
+
+def format_backfill_progress(job: BackfillJob) -> str:
+    """
+    Format the progress of a backfill job for display.
+
+    Args:
+        job: Backfill job to describe
+
+    Returns:
+        str: Status line followed by the job's running totals
+    """
+    status_emoji = {
+        "running": "⏳",
+        "completed": "✅",
+        "cancelled": "🛑",
+        "failed": "❌",
+    }.get(job.status, "⏳")
+
+    text = f"{status_emoji} **Backfill job #{job.job_id}**: {job.status}\n"
+    text += (
+        f"Scanned {job.fetched:,} messages: {job.inserted:,} new points, "
+        f"{job.duplicates:,} duplicates, {job.invalid:,} invalid\n"
+    )
+    if job.error:
+        text += f"Error: {job.error}\n"
+
+    return text
+
+
+def format_job_status(job: Job) -> str:
+    """
+    Format a background job as a single status line.
+
+    Args:
+        job: Job to describe
+
+    Returns:
+        str: Status emoji, ID, name, status, duration and result or error
+    """
+    status_emoji = {
+        "queued": "🕒",
+        "running": "⏳",
+        "completed": "✅",
+        "cancelled": "🛑",
+        "failed": "❌",
+    }.get(job.status, "⏳")
+
+    line = f"{status_emoji} **#{job.job_id}** {job.name}: {job.status}"
+    if job.requested_by:
+        line += f" (by {job.requested_by})"
+    if job.duration is not None:
+        line += f" in {job.duration:.1f}s"
+    if job.error:
+        line += f" - {job.error}"
+    elif job.summary:
+        line += f" - {job.summary}"
+    return line
+
+
+def format_sync_status(sync: "IncrementalSync") -> str:
+    """
+    Format the state of the automatic incremental sync for display.
+
+    Args:
+        sync: Sync schedule to describe
+
+    Returns:
+        str: Schedule, last run time, duration, result and next run
+    """
+    state = "running" if sync.is_running() else "stopped"
+    text = (
+        f"🔄 **Automatic sync**: {state}, every {sync.interval / 60:g} minutes "
+        f"(±{sync.jitter:g}s jitter)\n"
+    )
+
+    if sync.last_run_at is None:
+        text += "Last run: never\n"
+    else:
+        text += f"Last run: {format_timestamp(sync.last_run_at)} UTC"
+        if sync.last_duration is not None:
+            text += f" ({sync.last_duration:.2f} seconds)"
+        text += "\n"
+
+    if sync.last_error:
+        text += (
+            f"❌ Last run failed ({sync.failures} in a row): {sync.last_error}\n"
+            f"Backing off to every {sync.current_interval:.0f} seconds\n"
+        )
+    elif sync.last_stats is not None:
+        stats = sync.last_stats
+        text += (
+            f"✅ Scanned {stats.fetched:,} messages: {stats.inserted:,} new points "
+            f"({stats.auto_approved:,} auto-approved), {stats.invalid:,} invalid\n"
+        )
+
+    if sync.next_run_at is not None:
+        next_run = sync.next_run_at.astimezone(pytz.UTC)
+        text += f"Next run: {format_timestamp(next_run)} UTC\n"
 
     return text
@@ -0,0 +1,213 @@
+"""
+Background job runner for long-running commands.
+
+Commands submit their work as a job and respond immediately with its ID. A
+fixed pool of worker tasks runs queued jobs, so at most a few long
+operations run at once and interactive commands are never stuck behind
+them. Jobs are kept in an in-memory table for /jobs to list and cancel.
+
+Author: Warner (with AI assistance)
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from PledgePoints.constants import JOB_HISTORY_SIZE, JOB_WORKER_COUNT
+from PledgePoints.models import Job
+
+# A job's work: receives the job and returns an optional one-line summary
+JobWork = Callable[[Job], Awaitable[Optional[str]]]
+
+# Called with the job once it reaches a final status
+JobCallback = Callable[[Job], Awaitable[None]]
+
+
+class JobRunner:
+    """
+    Runs submitted jobs on a bounded pool of worker tasks.
+
+    Workers are started on the first submission, since they need a running
+    event loop.
+
+    Attributes:
+        workers (int): Maximum number of jobs running at the same time
+        history_size (int): Number of finished jobs kept in the job table
+    """
+
+    def __init__(
+        self, workers: int = JOB_WORKER_COUNT, history_size: int = JOB_HISTORY_SIZE
+    ):
+        """
+        Initialize the job runner.
+
+        Args:
+            workers: Maximum number of jobs running at the same time
+            history_size: Number of finished jobs kept in the job table
+        """
+        self.workers = workers
+        self.history_size = history_size
+        self._jobs: "OrderedDict[int, Job]" = OrderedDict()
+        self._pending: Dict[int, Tuple[JobWork, Optional[JobCallback]]] = {}
+        self._running: Dict[int, asyncio.Task] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        # Strong references to fire-and-forget tasks so they are not garbage
+        # collected before they finish
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._next_id = 1
+
+    def submit(
+        self,
+        name: str,
+        work: JobWork,
+        requested_by: Optional[str] = None,
+        on_finish: Optional[JobCallback] = None,
+        owner_id: Optional[int] = None,
+    ) -> Job:
+        """
+        Queue work to run as a background job.
+
+        Args:
+            name: Short description shown in /jobs
+            work: Coroutine function run with the job; its return value
+                becomes the job's summary
+            requested_by: Name of the person submitting the job
+            on_finish: Optional coroutine called with the job once it has
+                completed, failed or been cancelled
+            owner_id: Discord user ID of the person submitting the job
+
+        Returns:
+            Job: The queued job
+        """
+        self._ensure_workers()
+        job = Job(
+            job_id=self._next_id,
+            name=name,
+            requested_by=requested_by,
+            owner_id=owner_id,
+        )
+        self._next_id += 1
+        self._jobs[job.job_id] = job
+        self._pending[job.job_id] = (work, on_finish)
+        self._queue.put_nowait(job.job_id)
+        return job
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """
+        Get a job from the job table.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            Optional[Job]: The job, or None if unknown or already pruned
+        """
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """
+        Get every job in the job table.
+
+        Returns:
+            List[Job]: Jobs, newest first
+        """
+        return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a queued or running job.
+
+        A queued job is dropped before it starts; a running job has its task
+        cancelled, which the job's work may handle to clean up.
+
+        Args:
+            job_id: ID of the job to cancel
+
+        Returns:
+            bool: True if the job was cancelled, False if it was not found or
+            had already finished
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+
+        if job_id in self._running:
+            self._running[job_id].cancel()
+            return True
+
+        # Still queued; the worker skips it when it comes up
+        _, on_finish = self._pending.pop(job_id, (None, None))
+        self._finish(job, "cancelled")
+        if on_finish is not None:
+            notify_task = asyncio.create_task(self._notify(job, on_finish))
+            self._background_tasks.add(notify_task)
+            notify_task.add_done_callback(self._background_tasks.discard)
+        return True
+
+    def _ensure_workers(self) -> None:
+        """Start the worker tasks if they are not running."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time, forever."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                if job_id in self._pending:
+                    await self._run(self._jobs[job_id], *self._pending.pop(job_id))
+            except Exception as e:
+                # A broken job must never take a worker down with it
+                print(f"Job #{job_id} crashed its worker: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self, job: Job, work: JobWork, on_finish: Optional[JobCallback]
+    ) -> None:
+        """Run one job in its own task and record how it ended."""
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        task = asyncio.create_task(work(job))
+        self._running[job.job_id] = task
+        try:
+            job.summary = await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                # The worker itself is being cancelled (shutdown)
+                task.cancel()
+                raise
+            self._finish(job, "cancelled")
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, "failed")
+            print(f"Job #{job.job_id} ({job.name}) failed: {e}")
+        else:
+            self._finish(job, "completed")
+        finally:
+            self._running.pop(job.job_id, None)
+
+        if on_finish is not None:
+            await self._notify(job, on_finish)
+
+    def _finish(self, job: Job, status: str) -> None:
+        """Mark a job finished and prune the oldest finished jobs."""
+        job.status = status
+        job.finished_at = datetime.now(timezone.utc)
+
+        finished = [job_id for job_id, entry in self._jobs.items() if entry.done]
+        for job_id in finished[: max(0, len(finished) - self.history_size)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    async def _notify(job: Job, on_finish: JobCallback) -> None:
+        """Call a job's finish callback, logging rather than raising errors."""
+        try:
+            await on_finish(job)
+        except Exception as e:
+            print(f"Error reporting result of job #{job.job_id}: {e}")
@@ -0,0 +1,227 @@
+"""
+Interactive, paginated view of pending point submissions.
+
+Renders one page of pending entries as an embed with Prev/Next buttons and a
+pledge filter. Each page is read from the database with keyset pagination,
+so showing any page costs one small query and one message edit regardless of
+how many submissions are waiting.
+
+Author: Warner (with AI assistance)
+"""
+
+from typing import List, Optional
+
+import discord
+
+from PledgePoints.constants import (
+    DISCORD_EMBED_DESCRIPTION_MAX_LENGTH,
+    PENDING_PAGE_SIZE,
+)
+from PledgePoints.models import PointEntry, PointFilter
+from PledgePoints.roster import PledgeRoster
+from PledgePoints.sqlutils import DatabaseManager
+from utils.discord_helpers import format_point_entry_detailed
+
+# Select value meaning "no pledge filter"
+_ALL_PLEDGES = "__all__"
+
+# Discord allows at most 25 options per select menu
+_MAX_SELECT_OPTIONS = 25
+
+# How long the controls stay active without use
+PENDING_VIEW_TIMEOUT_SECONDS = 600
+
+
+class PendingPointsView(discord.ui.View):
+    """
+    Paginated pending points display with navigation and pledge filter controls.
+
+    Attributes:
+        entries (List[PointEntry]): Entries on the current page
+        pledge (Optional[str]): Pledge the list is filtered to, or None for all
+        has_prev (bool): Whether an earlier page exists
+        has_next (bool): Whether a later page exists
+        message (Optional[discord.Message]): Message the view is attached to
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        roster: PledgeRoster,
+        owner_id: int,
+        page_size: int = PENDING_PAGE_SIZE,
+    ):
+        """
+        Create the view. Call load() to fetch the first page before sending.
+
+        Args:
+            db_manager: Database to read pending points from
+            roster: Pledge roster offered in the filter
+            owner_id: ID of the user allowed to use the controls
+            page_size: Number of entries per page
+        """
+        super().__init__(timeout=PENDING_VIEW_TIMEOUT_SECONDS)
+        self.db_manager = db_manager
+        self.owner_id = owner_id
+        self.page_size = page_size
+
+        self.entries: List[PointEntry] = []
+        self.pledge: Optional[str] = None
+        self.has_prev = False
+        self.has_next = False
+        self.message: Optional[discord.Message] = None
+
+        options = [discord.SelectOption(label="All pledges", value=_ALL_PLEDGES)]
+        options.extend(
+            discord.SelectOption(label=name, value=name)
+            for name in list(roster)[: _MAX_SELECT_OPTIONS - 1]
+        )
+        self.pledge_select = discord.ui.Select(
+            placeholder="Filter by pledge", options=options, row=1
+        )
+        self.pledge_select.callback = self.on_pledge_selected
+        self.add_item(self.pledge_select)
+
+    def load(
+        self, after_id: Optional[int] = None, before_id: Optional[int] = None
+    ) -> None:
+        """
+        Fetch a page of pending entries and update the controls.
+
+        With no anchor the first page is loaded. If the requested page has
+        emptied since it was last shown (entries were approved or rejected),
+        the nearest non-empty page is loaded instead.
+
+        Args:
+            after_id: Load the page following this entry ID
+            before_id: Load the page preceding this entry ID
+        """
+        point_filter = PointFilter(statuses=("pending",), pledge=self.pledge)
+        entries, has_more = self.db_manager.get_points_page(
+            point_filter, after_id=after_id, before_id=before_id, limit=self.page_size
+        )
+
+        if not entries and before_id is not None:
+            # Nothing earlier any more, go back to the start
+            self.load()
+            return
+        if not entries and after_id is not None:
+            # Nothing later any more, show the last page
+            self.load(before_id=after_id + 1)
+            self.has_next = False
+            self.next_button.disabled = True
+            return
+
+        # Drop entries that would overflow the embed; they lead the next page
+        backwards = before_id is not None
+        self.entries = self._fit(entries, backwards)
+        has_more = has_more or len(self.entries) < len(entries)
+        if backwards:
+            self.has_prev, self.has_next = has_more, True
+        else:
+            self.has_prev, self.has_next = after_id is not None, has_more
+        self.prev_button.disabled = not self.has_prev
+        self.next_button.disabled = not self.has_next
+
+    @staticmethod
+    def _fit(entries: List[PointEntry], from_end: bool) -> List[PointEntry]:
+        """
+        Keep as many entries as fit in one embed description.
+
+        Args:
+            entries: Entries of the page, in ID order
+            from_end: Keep the last entries rather than the first
+
+        Returns:
+            List[PointEntry]: At least one entry, in ID order
+        """
+        ordered = reversed(entries) if from_end else entries
+        kept: List[PointEntry] = []
+        length = 0
+        for entry in ordered:
+            length += len(format_point_entry_detailed(entry)) + 1
+            if kept and length > DISCORD_EMBED_DESCRIPTION_MAX_LENGTH:
+                break
+            kept.append(entry)
+        if from_end:
+            kept.reverse()
+        return kept
+
+    def build_embed(self) -> discord.Embed:
+        """
+        Render the current page.
+
+        Returns:
+            discord.Embed: Embed listing the page's entries
+        """
+        title = "📋 Pending Point Submissions"
+        if self.pledge:
+            title += f" for {self.pledge}"
+
+        if self.entries:
+            description = "\n".join(
+                format_point_entry_detailed(entry) for entry in self.entries
+            )
+            footer = (
+                f"Showing IDs {self.entries[0].entry_id}–{self.entries[-1].entry_id}"
+            )
+        else:
+            description = "No pending points found."
+            footer = "Nothing to show"
+
+        embed = discord.Embed(
+            title=title,
+            description=description[:DISCORD_EMBED_DESCRIPTION_MAX_LENGTH],
+            color=discord.Color.blue(),
+        )
+        embed.set_footer(text=footer)
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only let the user who ran the command use the controls."""
+        if interaction.user.id == self.owner_id:
+            return True
+        await interaction.response.send_message(
+            "Only the person who ran this command can use these controls.",
+            ephemeral=True,
+        )
+        return False
+
+    async def _show(self, interaction: discord.Interaction) -> None:
+        """Replace the message with the current page."""
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary, row=0)
+    async def prev_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ) -> None:
+        """Show the previous page."""
+        anchor = self.entries[0].entry_id if self.entries else None
+        self.load(before_id=anchor)
+        await self._show(interaction)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary, row=0)
+    async def next_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ) -> None:
+        """Show the next page."""
+        anchor = self.entries[-1].entry_id if self.entries else None
+        self.load(after_id=anchor)
+        await self._show(interaction)
+
+    async def on_pledge_selected(self, interaction: discord.Interaction) -> None:
+        """Filter the list to the selected pledge and go back to the first page."""
+        value = self.pledge_select.values[0]
+        self.pledge = None if value == _ALL_PLEDGES else value
+        self.load()
+        await self._show(interaction)
+
+    async def on_timeout(self) -> None:
+        """Disable the controls once the view stops listening."""
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass